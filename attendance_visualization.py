@@ -1,30 +1,98 @@
+import argparse
+import hashlib
+import inspect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime
 
-# Set the style for better-looking graphs
-plt.style.use('seaborn-v0_8')
-sns.set_theme(style="whitegrid")
-sns.set_palette("husl")
+from scripts.data_store import load_cleaned_data
 
-# Read the cleaned data files
-attendance_df = pd.read_csv('Employee_Attendance_Clean.csv')
-employee_df = pd.read_excel('Employees_Master_Clean.xlsx')
+PLOTS_DIR = Path('attendance_plots')
+# Input hash of every rendered plot, used to skip plots whose data and code are unchanged
+MANIFEST_NAME = 'manifest.json'
 
-# Convert date to datetime
-attendance_df['Date'] = pd.to_datetime(attendance_df['Date'])
+# Master columns the plots group by
+MASTER_COLUMNS = ['EmployeeID', 'Department', 'Location']
+
+WEEKDAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+WEEKDAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+
+PLOT_DESCRIPTIONS = {
+    'department_attendance.png': "Shows the distribution of attendance status across departments",
+    'monthly_trends.png': "Displays attendance trends over months",
+    'weekday_patterns.png': "Shows attendance patterns for different days of the week",
+    'department_boxplot.png': "Shows the distribution of attendance percentages within each department",
+    'location_attendance.png': "Shows attendance patterns across different office locations",
+    'wfh_trends.png': "Displays the trend of work from home over time",
+}
+
+
+def _set_style():
+    # Headless backend and the shared look; runs once per process, including pool workers
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    # Set the style for better-looking graphs
+    plt.style.use('seaborn-v0_8')
+    sns.set_theme(style="whitegrid")
+    sns.set_palette("husl")
 
-# Create directory for saving plots
-import os
-if not os.path.exists('attendance_plots'):
-    os.makedirs('attendance_plots')
 
-def create_department_attendance_plot():
+def plot_inputs(attendance_df, employee_df):
+    """Aggregated data behind each plot, keyed by its file name.
+
+    The master is merged once and Month/Weekday are derived once per
+    distinct period rather than formatted row by row.
+    """
+    merged_df = attendance_df.merge(employee_df[MASTER_COLUMNS], on='EmployeeID')
+    months = attendance_df['Date'].dt.to_period('M')
+
+    def by_month(counts):
+        counts.index = counts.index.strftime('%Y-%m').rename('Month')
+        return counts
+
     # Calculate department-wise attendance percentages
-    dept_attendance = attendance_df.merge(employee_df[['EmployeeID', 'Department']], on='EmployeeID')
-    dept_stats = dept_attendance.groupby('Department')['Status'].value_counts(normalize=True).unstack()
-    
+    dept_stats = merged_df.groupby('Department', observed=True)['Status'].value_counts(normalize=True).unstack()
+
+    # Calculate monthly attendance trends
+    monthly_status = by_month(attendance_df.groupby([months, 'Status'], observed=True).size().unstack())
+
+    # Analyze weekday patterns
+    weekday_status = attendance_df.groupby([attendance_df['Date'].dt.weekday, 'Status'], observed=True).size().unstack()
+    weekday_status.index = pd.Index(weekday_status.index.map(dict(enumerate(WEEKDAY_NAMES))), name='Weekday')
+    weekday_status = weekday_status.reindex(WEEKDAY_ORDER)
+
+    # Calculate attendance percentage by employee and department
+    present = merged_df['Status'].isin(['Present', 'Wfh'])
+    attendance_metrics = (present.groupby([merged_df['EmployeeID'], merged_df['Department']], observed=True).mean()
+                          * 100).reset_index()
+
+    # Calculate location-wise attendance
+    location_stats = (merged_df.dropna(subset=['Location'])
+                      .groupby('Location', observed=True)['Status'].value_counts(normalize=True).unstack())
+
+    # Analyze WFH trends over time
+    wfh = attendance_df['Status'] == 'Wfh'
+    wfh_trend = by_month(attendance_df[wfh].groupby(months[wfh]).size())
+
+    return {
+        'department_attendance.png': dept_stats,
+        'monthly_trends.png': monthly_status,
+        'weekday_patterns.png': weekday_status,
+        'department_boxplot.png': attendance_metrics,
+        'location_attendance.png': location_stats,
+        'wfh_trends.png': wfh_trend,
+    }
+
+
+def create_department_attendance_plot(dept_stats, path):
+    import matplotlib.pyplot as plt
+
     # Create a stacked bar plot
     plt.figure(figsize=(12, 6))
     dept_stats.plot(kind='bar', stacked=True)
@@ -33,14 +101,13 @@ def create_department_attendance_plot():
     plt.ylabel('Percentage')
     plt.legend(title='Status', bbox_to_anchor=(1.05, 1))
     plt.tight_layout()
-    plt.savefig('attendance_plots/department_attendance.png')
+    plt.savefig(path)
     plt.close()
 
-def create_monthly_trend_plot():
-    # Calculate monthly attendance trends
-    attendance_df['Month'] = attendance_df['Date'].dt.strftime('%Y-%m')
-    monthly_status = attendance_df.groupby(['Month', 'Status']).size().unstack()
-    
+
+def create_monthly_trend_plot(monthly_status, path):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(15, 6))
     monthly_status.plot(kind='line', marker='o')
     plt.title('Monthly Attendance Trends')
@@ -49,18 +116,13 @@ def create_monthly_trend_plot():
     plt.xticks(rotation=45)
     plt.legend(title='Status', bbox_to_anchor=(1.05, 1))
     plt.tight_layout()
-    plt.savefig('attendance_plots/monthly_trends.png')
+    plt.savefig(path)
     plt.close()
 
-def create_weekday_pattern_plot():
-    # Analyze weekday patterns
-    attendance_df['Weekday'] = attendance_df['Date'].dt.day_name()
-    weekday_status = attendance_df.groupby(['Weekday', 'Status']).size().unstack()
-    
-    # Reorder days
-    weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
-    weekday_status = weekday_status.reindex(weekday_order)
-    
+
+def create_weekday_pattern_plot(weekday_status, path):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(12, 6))
     weekday_status.plot(kind='bar', stacked=True)
     plt.title('Attendance Patterns by Weekday')
@@ -68,16 +130,14 @@ def create_weekday_pattern_plot():
     plt.ylabel('Number of Employees')
     plt.legend(title='Status', bbox_to_anchor=(1.05, 1))
     plt.tight_layout()
-    plt.savefig('attendance_plots/weekday_patterns.png')
+    plt.savefig(path)
     plt.close()
 
-def create_department_boxplot():
-    # Calculate attendance percentage by employee and department
-    attendance_metrics = attendance_df.merge(employee_df[['EmployeeID', 'Department']], on='EmployeeID')
-    attendance_metrics = attendance_metrics.groupby(['EmployeeID', 'Department'])['Status'].apply(
-        lambda x: (x.isin(['Present', 'Wfh']).sum() / len(x)) * 100
-    ).reset_index()
-    
+
+def create_department_boxplot(attendance_metrics, path):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     plt.figure(figsize=(12, 6))
     sns.boxplot(x='Department', y='Status', data=attendance_metrics)
     plt.title('Attendance Percentage Distribution by Department')
@@ -85,17 +145,13 @@ def create_department_boxplot():
     plt.ylabel('Attendance Percentage')
     plt.xticks(rotation=45)
     plt.tight_layout()
-    plt.savefig('attendance_plots/department_boxplot.png')
+    plt.savefig(path)
     plt.close()
 
-def create_location_attendance_plot():
-    # Calculate location-wise attendance
-    location_attendance = attendance_df.merge(
-        employee_df[['EmployeeID', 'Location']], on='EmployeeID'
-    ).dropna(subset=['Location'])
-    
-    location_stats = location_attendance.groupby('Location')['Status'].value_counts(normalize=True).unstack()
-    
+
+def create_location_attendance_plot(location_stats, path):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(12, 6))
     location_stats.plot(kind='bar', stacked=True)
     plt.title('Attendance Status Distribution by Location')
@@ -103,15 +159,13 @@ def create_location_attendance_plot():
     plt.ylabel('Percentage')
     plt.legend(title='Status', bbox_to_anchor=(1.05, 1))
     plt.tight_layout()
-    plt.savefig('attendance_plots/location_attendance.png')
+    plt.savefig(path)
     plt.close()
 
-def create_wfh_trend_plot():
-    # Analyze WFH trends over time
-    wfh_trend = attendance_df[attendance_df['Status'] == 'Wfh'].groupby(
-        attendance_df['Date'].dt.strftime('%Y-%m')
-    ).size()
-    
+
+def create_wfh_trend_plot(wfh_trend, path):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(12, 6))
     wfh_trend.plot(kind='line', marker='o')
     plt.title('Work From Home Trends Over Time')
@@ -119,29 +173,85 @@ def create_wfh_trend_plot():
     plt.ylabel('Number of WFH Instances')
     plt.xticks(rotation=45)
     plt.tight_layout()
-    plt.savefig('attendance_plots/wfh_trends.png')
+    plt.savefig(path)
     plt.close()
 
-# Generate all plots
-print("Generating attendance visualization plots...")
-create_department_attendance_plot()
-print("1. Department-wise attendance distribution plot created")
-create_monthly_trend_plot()
-print("2. Monthly attendance trends plot created")
-create_weekday_pattern_plot()
-print("3. Weekday patterns plot created")
-create_department_boxplot()
-print("4. Department-wise attendance distribution boxplot created")
-create_location_attendance_plot()
-print("5. Location-wise attendance distribution plot created")
-create_wfh_trend_plot()
-print("6. Work from home trends plot created")
-
-print("\nAll plots have been saved in the 'attendance_plots' directory.")
-print("\nPlot descriptions:")
-print("1. department_attendance.png: Shows the distribution of attendance status across departments")
-print("2. monthly_trends.png: Displays attendance trends over months")
-print("3. weekday_patterns.png: Shows attendance patterns for different days of the week")
-print("4. department_boxplot.png: Shows the distribution of attendance percentages within each department")
-print("5. location_attendance.png: Shows attendance patterns across different office locations")
-print("6. wfh_trends.png: Displays the trend of work from home over time")
\ No newline at end of file
+
+PLOT_RENDERERS = {
+    'department_attendance.png': create_department_attendance_plot,
+    'monthly_trends.png': create_monthly_trend_plot,
+    'weekday_patterns.png': create_weekday_pattern_plot,
+    'department_boxplot.png': create_department_boxplot,
+    'location_attendance.png': create_location_attendance_plot,
+    'wfh_trends.png': create_wfh_trend_plot,
+}
+
+
+def plot_hash(name, data):
+    """Hash of a plot's input data and of the code that draws it."""
+    digest = hashlib.sha256(inspect.getsource(PLOT_RENDERERS[name]).encode())
+    if isinstance(data, pd.DataFrame):
+        digest.update(repr(list(data.columns)).encode())
+    digest.update(repr(data.index.names).encode())
+    digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _render(name, data, path):
+    PLOT_RENDERERS[name](data, path)
+    return name
+
+
+def render_plots(attendance_df, employee_df, out_dir=PLOTS_DIR, workers=1, force=False):
+    """Render every plot whose inputs changed since the last run; returns the names rendered.
+
+    Plots are drawn in a process pool when `workers` > 1. The manifest in
+    `out_dir` records the input hash of each plot written, and a plot is
+    skipped when its hash matches and its file still exists, unless `force`.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST_NAME
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() and not force else {}
+
+    inputs = plot_inputs(attendance_df, employee_df)
+    hashes = {name: plot_hash(name, data) for name, data in inputs.items()}
+    stale = [name for name in inputs if force or manifest.get(name) != hashes[name] or not (out_dir / name).exists()]
+
+    if workers > 1 and len(stale) > 1:
+        with ProcessPoolExecutor(min(workers, len(stale)), initializer=_set_style) as executor:
+            rendered = list(executor.map(_render, stale, [inputs[name] for name in stale],
+                                         [out_dir / name for name in stale]))
+    else:
+        _set_style()
+        rendered = [_render(name, inputs[name], out_dir / name) for name in stale]
+
+    manifest.update({name: hashes[name] for name in rendered})
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    return rendered
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render the attendance plots into attendance_plots/.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Processes used to render plots (default: one per CPU).')
+    parser.add_argument('--force', action='store_true', help='Re-render every plot even if its inputs are unchanged.')
+    args = parser.parse_args(argv)
+
+    # Read the cleaned data (columnar store, or the cleaned CSV/XLSX)
+    attendance_df, employee_df = load_cleaned_data(master_columns=MASTER_COLUMNS)
+
+    # Generate all plots
+    print("Generating attendance visualization plots...")
+    rendered = render_plots(attendance_df, employee_df, workers=args.workers, force=args.force)
+    for i, name in enumerate(PLOT_RENDERERS, start=1):
+        print(f"{i}. {name} {'created' if name in rendered else 'unchanged, skipped'}")
+
+    print(f"\nAll plots have been saved in the '{PLOTS_DIR}' directory.")
+    print("\nPlot descriptions:")
+    for i, (name, description) in enumerate(PLOT_DESCRIPTIONS.items(), start=1):
+        print(f"{i}. {name}: {description}")
+
+
+if __name__ == '__main__':
+    main()
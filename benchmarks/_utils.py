@@ -0,0 +1,59 @@
+import multiprocessing
+import resource
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = BASE_DIR / 'data'
+
+
+def best_of(func, repeat=3):
+    """Return the fastest wall time in seconds over `repeat` calls of `func`."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def sample_attendance(rows):
+    """Tile the shipped attendance sample until it has `rows` rows."""
+    sample = pd.read_csv(DATA_DIR / 'Employee_Attendance.csv')
+    repeats = -(-rows // len(sample))
+    return pd.concat([sample] * repeats, ignore_index=True).iloc[:rows]
+
+
+def report(title, rows, baseline, candidate):
+    """Print a one-line throughput comparison of two timings."""
+    print(f"{title:<28} rows={rows:>9,}  "
+          f"per-row {rows / baseline:>12,.0f} rows/s  "
+          f"vectorized {rows / candidate:>12,.0f} rows/s  "
+          f"speedup {baseline / candidate:6.1f}x")
+
+
+def _report_peak_rss(queue, func, args):
+    func(*args)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    queue.put(peak / 1024 if sys.platform != 'darwin' else peak / 1024 ** 2)
+
+
+def peak_rss_mb(func, *args):
+    """Run `func(*args)` in a fresh process and return its peak RSS in MB."""
+    ctx = multiprocessing.get_context('spawn')
+    queue = ctx.Queue()
+    process = ctx.Process(target=_report_peak_rss, args=(queue, func, args))
+    process.start()
+    peak = queue.get()
+    process.join()
+    return peak
+
+
+def write_sample_attendance(path, rows):
+    """Write a tiled attendance CSV with `rows` rows to `path`."""
+    sample_attendance(rows).to_csv(path, index=False)
+    return path
@@ -0,0 +1,63 @@
+"""Per-group status counts: groupby/agg with lambdas against aggregations.status_counts.
+
+Run from the repository root:
+    python -m benchmarks.bench_aggregations --employees 10000 --days 365
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._utils import best_of
+from scripts.aggregations import status_counts
+from scripts.schema import STATUS_CATEGORIES
+
+
+def synthetic_attendance(employees, days, seed=0):
+    """One status row per employee per day, typed like the loaded data."""
+    rng = np.random.default_rng(seed)
+    rows = employees * days
+    ids = pd.Categorical.from_codes(np.repeat(np.arange(employees), days),
+                                    categories=[f'E{i:05d}' for i in range(employees)])
+    status = pd.Categorical.from_codes(rng.choice(4, rows, p=[0.5, 0.2, 0.15, 0.15]), categories=STATUS_CATEGORIES)
+    departments = pd.Categorical.from_codes(np.repeat(rng.integers(0, 5, employees), days),
+                                            categories=['FINANCE', 'HR', 'IT', 'OPERATIONS', 'SALES'])
+    return pd.DataFrame({
+        'EmployeeID': ids,
+        'Department': departments,
+        'Date': np.tile(pd.date_range('2024-01-01', periods=days).to_numpy(), employees),
+        'Status': status,
+    })
+
+
+def _lambda_counts(df, keys):
+    return df.groupby(keys, observed=True).agg({
+        'Status': ['count',
+                   lambda x: (x == 'Present').sum(),
+                   lambda x: (x == 'Wfh').sum(),
+                   lambda x: (x == 'Leave').sum(),
+                   lambda x: (x == 'Absent').sum()]
+    })
+
+
+def bench_status_counts(employees, days):
+    df = synthetic_attendance(employees, days)
+    print(f"rows={len(df):,} ({employees:,} employees x {days} days)")
+    for label, keys in [('employee', 'EmployeeID'), ('department', 'Department'), ('date', 'Date'),
+                        ('employee x week', ['EmployeeID', df['Date'].dt.isocalendar().week])]:
+        baseline = best_of(lambda: _lambda_counts(df, keys), repeat=1)
+        candidate = best_of(lambda: status_counts(df, keys))
+        print(f"  by {label:<16} lambdas {baseline:7.2f} s  status_counts {candidate:6.3f} s  "
+              f"speedup {baseline / candidate:6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--employees', type=int, default=10_000)
+    parser.add_argument('--days', type=int, default=365)
+    args = parser.parse_args()
+    bench_status_counts(args.employees, args.days)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""Throughput comparison of the vectorized cleaning helpers against the per-row path.
+
+Run from the repository root:
+    python -m benchmarks.bench_clean_data --rows 100000
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks._utils import DATA_DIR, best_of, peak_rss_mb, report, sample_attendance, write_sample_attendance
+from scripts.clean_data import (clean_and_save, clean_department, incremental_clean_attendance, normalize_categories,
+                                normalize_dates, normalize_times, standardize_date, standardize_time)
+
+
+def bench_dates(rows):
+    dates = sample_attendance(rows)['Date']
+    baseline = best_of(lambda: dates.apply(standardize_date), repeat=1)
+    candidate = best_of(lambda: normalize_dates(dates))
+    report('Date normalization', rows, baseline, candidate)
+
+
+def bench_times(rows):
+    times = sample_attendance(rows)['InTime']
+    baseline = best_of(lambda: times.apply(standardize_time), repeat=1)
+    candidate = best_of(lambda: normalize_times(times))
+    report('Time normalization', rows, baseline, candidate)
+
+
+def bench_categories(rows):
+    master = pd.read_excel(DATA_DIR / 'Employees_Master.xlsx')
+    departments = pd.concat([master['Department']] * (-(-rows // len(master))), ignore_index=True).iloc[:rows]
+    baseline = best_of(lambda: departments.apply(clean_department))
+    candidate = best_of(lambda: normalize_categories(departments, 'Department'))
+    report('Department normalization', rows, baseline, candidate)
+    print(f"{'':<28} object column {departments.apply(clean_department).memory_usage(deep=True) / 1024 ** 2:.1f} MB"
+          f"  categorical {normalize_categories(departments, 'Department').memory_usage(deep=True) / 1024 ** 2:.1f} MB")
+
+
+def _clean_file(attendance_path, out_dir, chunk_size):
+    out_dir = Path(out_dir)
+    clean_and_save(attendance_path, DATA_DIR / 'Employees_Master.xlsx',
+                   out_dir / 'attendance.csv', out_dir / 'master.xlsx', chunk_size=chunk_size)
+
+
+def bench_streaming(rows, chunk_size):
+    with tempfile.TemporaryDirectory() as tmp:
+        attendance_path = write_sample_attendance(Path(tmp) / 'raw_attendance.csv', rows)
+        for label, size in [('in-memory', None), (f'chunked ({chunk_size:,} rows)', chunk_size)]:
+            start = time.perf_counter()
+            peak = peak_rss_mb(_clean_file, attendance_path, tmp, size)
+            elapsed = time.perf_counter() - start
+            print(f"clean_and_save {label:<24} rows={rows:>9,}  peak RSS {peak:8.1f} MB  wall {elapsed:6.2f} s")
+
+
+def bench_workers(rows, worker_counts=(1, 2, 4, 8)):
+    with tempfile.TemporaryDirectory() as tmp:
+        attendance_path = write_sample_attendance(Path(tmp) / 'raw_attendance.csv', rows)
+        master_path = DATA_DIR / 'Employees_Master.xlsx'
+        out_dir = Path(tmp)
+        serial = None
+        for workers in worker_counts:
+            elapsed = best_of(lambda: clean_and_save(attendance_path, master_path, out_dir / 'attendance.csv',
+                                                     out_dir / 'master.xlsx', workers=workers), repeat=1)
+            serial = serial or elapsed
+            print(f"clean_and_save workers={workers:<2}  rows={rows:>9,}  wall {elapsed:6.2f} s  "
+                  f"speedup {serial / elapsed:4.1f}x")
+
+
+def bench_incremental(rows, appended):
+    with tempfile.TemporaryDirectory() as tmp:
+        source = write_sample_attendance(Path(tmp) / 'raw_attendance.csv', rows)
+        out = Path(tmp) / 'attendance.csv'
+        full = best_of(lambda: incremental_clean_attendance(source, out), repeat=1)
+        sample_attendance(appended).to_csv(source, mode='a', header=False, index=False)
+        nightly = best_of(lambda: incremental_clean_attendance(source, out), repeat=1)
+        print(f"incremental clean  history={rows:>9,}  full build {full:6.2f} s  "
+              f"+{appended:,} appended rows {nightly:6.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--chunk-size', type=int, default=50_000)
+    args = parser.parse_args()
+    bench_dates(args.rows)
+    bench_times(args.rows)
+    bench_categories(args.rows)
+    bench_streaming(args.rows * 5, args.chunk_size)
+    bench_workers(args.rows * 5)
+    bench_incremental(args.rows * 5, args.rows // 100)
+
+
+if __name__ == '__main__':
+    main()
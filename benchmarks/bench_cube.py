@@ -0,0 +1,76 @@
+"""Dashboard rerun cost: charts and KPIs from filtered rows against slices of the count cube.
+
+Run from the repository root:
+    python -m benchmarks.bench_cube --employees 10000 --days 365
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._utils import best_of
+from benchmarks.bench_aggregations import synthetic_attendance
+from scripts.cube import WEEKDAY_ORDER, build_cube, daily_status_counts, slice_cube, status_rates, status_shares
+
+
+def synthetic_merged(employees, days, seed=0):
+    """Attendance rows with the Department and Location columns the dashboard merges in."""
+    df = synthetic_attendance(employees, days, seed)
+    rng = np.random.default_rng(seed + 1)
+    df['Location'] = pd.Categorical.from_codes(np.repeat(rng.integers(-1, 5, employees), days),
+                                               categories=['Bengaluru', 'Delhi', 'Hyderabad', 'Mumbai', 'Pune'])
+    return df
+
+
+def _row_charts(merged_df, date_range, departments, locations):
+    dates = merged_df['Date'].dt.date
+    loc_mask = merged_df['Location'].isin(locations)
+    if 'Unknown' in locations:
+        loc_mask |= merged_df['Location'].isna()
+    df = merged_df[(dates >= date_range[0]) & (dates <= date_range[1])
+                   & merged_df['Department'].isin(departments) & loc_mask].copy()
+    df.groupby('Department', observed=True)['Status'].value_counts(normalize=True).unstack()
+    df.groupby('Location', observed=True)['Status'].value_counts(normalize=True).unstack()
+    df.groupby(['Date', 'Status'], observed=True).size().unstack(fill_value=0)
+    df['Weekday'] = df['Date'].dt.day_name()
+    df.groupby('Weekday')['Status'].value_counts(normalize=True).unstack().reindex(WEEKDAY_ORDER)
+    return df['Status'].isin(['Present', 'Wfh']).mean(), (df['Status'] == 'Leave').mean()
+
+
+def _cube_charts(cube, date_range, departments, locations):
+    cells = slice_cube(cube, date_range, departments, locations)
+    status_shares(cells, 'Department')
+    status_shares(cells, 'Location')
+    daily_status_counts(cells)
+    status_shares(cells, cells['Date'].dt.day_name().rename('Weekday')).reindex(WEEKDAY_ORDER)
+    return status_rates(cells)
+
+
+def bench_cube(employees, days):
+    merged_df = synthetic_merged(employees, days)
+    build = best_of(lambda: build_cube(merged_df), repeat=1)
+    cube = build_cube(merged_df)
+    print(f"rows={len(merged_df):,}  cube cells={len(cube):,}  build {build:.2f} s (once per data load)")
+
+    start, end = merged_df['Date'].min().date(), merged_df['Date'].max().date()
+    filters = {
+        'all rows': ((start, end), ['FINANCE', 'HR', 'IT', 'OPERATIONS', 'SALES'],
+                     ['Bengaluru', 'Delhi', 'Hyderabad', 'Mumbai', 'Pune', 'Unknown']),
+        'one quarter, 2 depts': ((start, start + pd.Timedelta(days=90)), ['HR', 'IT'], ['Delhi', 'Pune']),
+    }
+    for label, args in filters.items():
+        baseline = best_of(lambda: _row_charts(merged_df, *args))
+        candidate = best_of(lambda: _cube_charts(cube, *args))
+        print(f"  {label:<22} rows {baseline:6.2f} s  cube {candidate:6.3f} s  speedup {baseline / candidate:6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--employees', type=int, default=10_000)
+    parser.add_argument('--days', type=int, default=365)
+    args = parser.parse_args()
+    bench_cube(args.employees, args.days)
+
+
+if __name__ == '__main__':
+    main()
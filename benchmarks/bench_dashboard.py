@@ -0,0 +1,80 @@
+"""Startup and per-interaction latency of the Streamlit dashboard on a large cleaned dataset.
+
+The dashboard loads the data next to its scripts/ package, so the scripts
+are copied into a scratch directory that holds the generated data and the
+app is timed in a fresh process that has not imported the repository's
+own scripts package.
+
+Run from the repository root:
+    python -m benchmarks.bench_dashboard --rows 1000000
+"""
+import argparse
+import multiprocessing
+import shutil
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+from benchmarks._utils import BASE_DIR, DATA_DIR, write_sample_attendance
+
+
+def _timed_run(app):
+    start = time.perf_counter()
+    app.run()
+    if app.get('exception'):
+        raise RuntimeError(app.get('exception')[0].value)
+    return time.perf_counter() - start
+
+
+def _write_dataset(base_dir, rows):
+    from scripts.clean_data import clean_and_save
+    from scripts.data_store import ATTENDANCE_CSV, MASTER_XLSX
+
+    raw = write_sample_attendance(base_dir / 'raw_attendance.csv', rows)
+    clean_and_save(raw, DATA_DIR / 'Employees_Master.xlsx', base_dir / ATTENDANCE_CSV, base_dir / MASTER_XLSX)
+
+
+def _time_dashboard(script, interactions, queue):
+    warnings.filterwarnings('ignore')
+    app = AppTest.from_file(str(script), default_timeout=600)
+    startup = _timed_run(app)
+    timings = []
+    for i in range(interactions):
+        departments = app.get('multiselect')[0]
+        departments.set_value(departments.options[:i % 3 + 2])
+        timings.append(_timed_run(app))
+    queue.put((startup, timings))
+
+
+def bench_dashboard(rows, interactions=5):
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = Path(tmp)
+        shutil.copytree(BASE_DIR / 'scripts', base_dir / 'scripts')
+        shutil.copytree(DATA_DIR, base_dir / 'data')
+        ctx = multiprocessing.get_context('spawn')
+        writer = ctx.Process(target=_write_dataset, args=(base_dir, rows))
+        writer.start()
+        writer.join()
+
+        queue = ctx.Queue()
+        app = ctx.Process(target=_time_dashboard,
+                          args=(base_dir / 'scripts' / 'attendance_dashboard.py', interactions, queue))
+        app.start()
+        startup, timings = queue.get()
+        app.join()
+        print(f"rows={rows:,}  startup {startup:.2f} s  "
+              f"filter change best {min(timings):.3f} s  worst {max(timings):.3f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+    bench_dashboard(args.rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Load time and memory of the Parquet store against the cleaned CSV/XLSX path.
+
+Run from the repository root:
+    python -m benchmarks.bench_data_store --rows 1000000
+"""
+import argparse
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks._utils import DATA_DIR, best_of, write_sample_attendance
+from scripts.clean_data import clean_and_save
+from scripts.data_store import ATTENDANCE_CSV, MASTER_XLSX, load_cleaned_data
+
+
+def _load_csv_xlsx(base_dir):
+    """The loading code the dashboard, analysis and plots used before the store existed."""
+    attendance_df = pd.read_csv(base_dir / ATTENDANCE_CSV)
+    employee_df = pd.read_excel(base_dir / MASTER_XLSX)
+    attendance_df['Date'] = pd.to_datetime(attendance_df['Date'])
+    return attendance_df, employee_df
+
+
+def _memory_mb(frames):
+    return sum(df.memory_usage(deep=True).sum() for df in frames) / 1024 ** 2
+
+
+def bench_load(rows):
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = Path(tmp)
+        raw = write_sample_attendance(base_dir / 'raw_attendance.csv', rows)
+        clean_and_save(raw, DATA_DIR / 'Employees_Master.xlsx', base_dir / ATTENDANCE_CSV, base_dir / MASTER_XLSX)
+
+        for label, loader in [('CSV + XLSX', _load_csv_xlsx), ('Parquet store', load_cleaned_data)]:
+            elapsed = best_of(lambda: loader(base_dir))
+            memory = _memory_mb(loader(base_dir))
+            print(f"{label:<14} rows={rows:>9,}  load {elapsed:6.3f} s  memory {memory:8.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+    bench_load(args.rows)
+
+
+if __name__ == '__main__':
+    main()
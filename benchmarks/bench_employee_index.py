@@ -0,0 +1,61 @@
+"""Employee drilldown: scanning all rows per selection against the EmployeeIndex slice.
+
+Run from the repository root:
+    python -m benchmarks.bench_employee_index --employees 10000 --days 365
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._utils import best_of
+from benchmarks.bench_cube import synthetic_merged
+from scripts.data_store import WEEKDAY_NAMES
+from scripts.filters import EmployeeIndex
+
+
+def _drilldown_frame(employees, days):
+    df = synthetic_merged(employees, days).sort_values('Date', kind='stable').reset_index(drop=True)
+    df['InTime'] = pd.array(np.full(len(df), 540), dtype='Int16')
+    df['OutTime'] = pd.array(np.full(len(df), 1080), dtype='Int16')
+    df['Weekday'] = pd.Categorical.from_codes(df['Date'].dt.weekday, WEEKDAY_NAMES)
+    iso = df['Date'].dt.isocalendar()
+    df['ISO_Year'], df['ISO_Week'] = iso['year'], iso['week']
+    employee_df = pd.DataFrame({'EmployeeID': df['EmployeeID'].cat.categories,
+                                'Name': [f'Employee {i}' for i in range(employees)]})
+    return df, employee_df
+
+
+def _scan(df, employee_df, name, date_range):
+    emp_id = employee_df[employee_df['Name'] == name]['EmployeeID'].iloc[0]
+    emp_att = df[df['EmployeeID'] == emp_id].copy()
+    emp_att['Date'] = pd.to_datetime(emp_att['Date'])
+    return emp_att[(emp_att['Date'].dt.date >= date_range[0]) & (emp_att['Date'].dt.date <= date_range[1])]
+
+
+def bench_employee_index(employees, days):
+    df, employee_df = _drilldown_frame(employees, days)
+    build = best_of(lambda: EmployeeIndex(df, employee_df), repeat=1)
+    index = EmployeeIndex(df, employee_df)
+    print(f"rows={len(df):,}  index build {build:.2f} s (once per data load)")
+
+    date_range = (df['Date'].min().date(), df['Date'].max().date())
+    names = employee_df['Name'].sample(20, random_state=0).tolist()
+    for name in names:
+        assert len(_scan(df, employee_df, name, date_range)) == len(index.records(index.employee_id(name), date_range))
+    baseline = best_of(lambda: [_scan(df, employee_df, name, date_range) for name in names]) / len(names)
+    candidate = best_of(lambda: [index.records(index.employee_id(name), date_range) for name in names]) / len(names)
+    print(f"  per selection  scan {baseline * 1000:8.2f} ms  EmployeeIndex {candidate * 1000:6.3f} ms  "
+          f"speedup {baseline / candidate:7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--employees', type=int, default=10_000)
+    parser.add_argument('--days', type=int, default=365)
+    args = parser.parse_args()
+    bench_employee_index(args.employees, args.days)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Employee metrics export: pandas/openpyxl against the streamed xlsxwriter path.
+
+Run from the repository root:
+    python -m benchmarks.bench_exports --rows 10000 100000
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._utils import best_of
+from scripts import exports
+
+
+def employee_stats(rows, seed=0):
+    """A frame shaped like the dashboard's employee table."""
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(0, 100, (rows, 4))
+    stats = pd.DataFrame({
+        'EmployeeID': [f'E{i:06d}' for i in range(rows)],
+        'Name': [f'Employee {i}' for i in range(rows)],
+        'Department': pd.Categorical(rng.choice(['FINANCE', 'HR', 'IT', 'OPERATIONS', 'SALES'], rows)),
+        'Location': pd.Categorical(rng.choice(['Delhi', 'Mumbai', 'Pune', None], rows)),
+        'Total_Days': counts.sum(axis=1),
+        'Present_Days': counts[:, 0], 'WFH_Days': counts[:, 1], 'Leave_Days': counts[:, 2], 'Absent_Days': counts[:, 3],
+    })
+    stats['Present_Rate'] = ((stats['Present_Days'] + stats['WFH_Days']) / stats['Total_Days'] * 100).round(2)
+    return stats
+
+
+def bench_exports(rows):
+    stats = employee_stats(rows)
+    csv = best_of(lambda: exports.to_csv_bytes(stats))
+    fast = best_of(lambda: exports.to_excel_bytes(stats, 'EmployeeMetrics'), repeat=1)
+    xlsxwriter, exports.xlsxwriter = exports.xlsxwriter, None
+    try:
+        slow = best_of(lambda: exports.to_excel_bytes(stats, 'EmployeeMetrics'), repeat=1)
+    finally:
+        exports.xlsxwriter = xlsxwriter
+    print(f"rows={rows:>8,}  csv {csv:6.3f} s  excel openpyxl {slow:6.2f} s  xlsxwriter {fast:6.2f} s  "
+          f"speedup {slow / fast:4.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000])
+    args = parser.parse_args()
+    if exports.xlsxwriter is None:
+        parser.error('xlsxwriter is not installed')
+    for rows in args.rows:
+        bench_exports(rows)
+
+
+if __name__ == '__main__':
+    main()
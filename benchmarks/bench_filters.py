@@ -0,0 +1,55 @@
+"""Sidebar filtering: per-row date/isin masks against the sorted FilterIndex.
+
+Run from the repository root:
+    python -m benchmarks.bench_filters --employees 10000 --days 365
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._utils import best_of
+from benchmarks.bench_cube import synthetic_merged
+from scripts.filters import FilterIndex
+
+
+def _row_masks(df, date_range, departments, locations):
+    date_mask = (df['Date'].dt.date >= date_range[0]) & (df['Date'].dt.date <= date_range[1])
+    loc_mask = df['Location'].isin(locations)
+    if 'Unknown' in locations:
+        loc_mask |= df['Location'].isna()
+    return np.flatnonzero(date_mask & df['Department'].isin(departments) & loc_mask)
+
+
+def bench_filters(employees, days):
+    df = synthetic_merged(employees, days).sort_values('Date', kind='stable').reset_index(drop=True)
+    build = best_of(lambda: FilterIndex(df), repeat=1)
+    index = FilterIndex(df)
+    mask_mb = sum(m.nbytes for masks in (index.departments, index.locations) for m in masks.values()) / 1024 ** 2
+    print(f"rows={len(df):,}  index build {build:.2f} s (once per data load), masks {mask_mb:.0f} MB")
+
+    start, end = df['Date'].min().date(), df['Date'].max().date()
+    filters = {
+        'all rows': ((start, end), ['FINANCE', 'HR', 'IT', 'OPERATIONS', 'SALES'],
+                     ['Bengaluru', 'Delhi', 'Hyderabad', 'Mumbai', 'Pune', 'Unknown']),
+        'one quarter, 2 depts': ((start, start + pd.Timedelta(days=90)), ['HR', 'IT'], ['Delhi', 'Pune']),
+        'one week': ((start, start + pd.Timedelta(days=6)), ['HR'], ['Pune', 'Unknown']),
+    }
+    for label, args in filters.items():
+        assert np.array_equal(_row_masks(df, *args), index.positions(*args))
+        baseline = best_of(lambda: _row_masks(df, *args))
+        candidate = best_of(lambda: index.positions(*args))
+        print(f"  {label:<22} row masks {baseline:6.3f} s  FilterIndex {candidate * 1000:7.2f} ms  "
+              f"speedup {baseline / candidate:7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--employees', type=int, default=10_000)
+    parser.add_argument('--days', type=int, default=365)
+    args = parser.parse_args()
+    bench_filters(args.employees, args.days)
+
+
+if __name__ == '__main__':
+    main()
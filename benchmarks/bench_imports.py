@@ -0,0 +1,55 @@
+"""Cold import cost of each entry point, measured with `python -X importtime`.
+
+Each module is imported in a fresh interpreter; the total is the sum of the
+cumulative times of the top-level imports, so anything a module does at
+import time (reading data, plotting) is included.
+
+Run from the repository root:
+    python -m benchmarks.bench_imports
+"""
+import argparse
+import re
+import subprocess
+import sys
+
+from benchmarks._utils import BASE_DIR
+
+ENTRY_POINTS = ['scripts.attendance_analysis', 'scripts.attendance_dashboard', 'attendance_visualization',
+                'scripts.clean_data']
+IMPORT_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)')
+
+
+def import_profile(module):
+    """Return (total seconds, {package: cumulative seconds}) for importing `module`.
+
+    Packages are the root packages pulled in along the way (pandas,
+    streamlit, matplotlib, ...), each with the cumulative time of its own import.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=BASE_DIR, capture_output=True, text=True, check=True)
+    total, packages = 0.0, {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        seconds, name = int(match.group(2)) / 1e6, match.group(4)
+        if not match.group(3):
+            total += seconds
+        if '.' not in name and name not in (module, module.split('.')[0]):
+            packages[name] = max(packages.get(name, 0.0), seconds)
+    return total, packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('modules', nargs='*', default=ENTRY_POINTS)
+    args = parser.parse_args()
+    for module in args.modules:
+        total, packages = import_profile(module)
+        heaviest = sorted(packages.items(), key=lambda item: -item[1])[:4]
+        print(f"{module:<30} {total:6.2f} s   heaviest: "
+              + ', '.join(f"{name} {seconds:.2f} s" for name, seconds in heaviest))
+
+
+if __name__ == '__main__':
+    main()
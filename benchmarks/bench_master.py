@@ -0,0 +1,56 @@
+"""Read time of a large employee master: pd.read_excel against the cached sidecar.
+
+Run from the repository root:
+    python -m benchmarks.bench_master --rows 100000
+"""
+import argparse
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks._utils import DATA_DIR, best_of
+from scripts import data_store
+from scripts.data_store import DASHBOARD_MASTER_COLUMNS, read_workbook, sidecar_path
+
+
+def sample_master(rows):
+    """Tile the shipped raw master to `rows` rows with unique EmployeeIDs."""
+    sample = pd.read_excel(DATA_DIR / 'Employees_Master.xlsx')
+    repeats = -(-rows // len(sample))
+    master = pd.concat([sample] * repeats, ignore_index=True).iloc[:rows]
+    master['EmployeeID'] = [f"E{i:07d}" for i in range(1, rows + 1)]
+    return master
+
+
+def _cold_read(path):
+    sidecar_path(path).unlink(missing_ok=True)
+    return read_workbook(path)
+
+
+def bench_master(rows, repeat):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'Employees_Master.xlsx'
+        sample_master(rows).to_excel(path, index=False)
+        cases = [('read_excel (openpyxl)', lambda: pd.read_excel(path, engine='openpyxl'))]
+        if data_store.python_calamine is not None:
+            cases.append(('read_excel (calamine)', lambda: pd.read_excel(path, engine='calamine')))
+        cases += [
+            ('sidecar, first read', lambda: _cold_read(path)),
+            ('sidecar, all columns', lambda: read_workbook(path)),
+            ('sidecar, dashboard cols', lambda: read_workbook(path, ['EmployeeID'] + DASHBOARD_MASTER_COLUMNS)),
+        ]
+        for label, func in cases:
+            print(f"{label:<24} rows={rows:>9,}  {best_of(func, repeat):7.3f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    bench_master(args.rows, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Worked hours and punctuality per employee: per-row datetime parsing against punctuality.punctuality_counts.
+
+status_counts over the same rows is timed too, as the budget the punch
+metrics should stay within.
+
+Run from the repository root:
+    python -m benchmarks.bench_punctuality --employees 10000 --days 365
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._utils import best_of
+from benchmarks.bench_aggregations import synthetic_attendance
+from scripts.aggregations import status_counts
+from scripts.clean_data import format_minutes
+from scripts.punctuality import LATE_GRACE_MINUTES, SHIFT_END, SHIFT_START, punctuality_counts
+
+
+def synthetic_punches(employees, days, seed=0):
+    """synthetic_attendance rows with InTime/OutTime minutes on Present/WFH days, a few punches missing."""
+    rng = np.random.default_rng(seed)
+    df = synthetic_attendance(employees, days, seed)
+    worked = df['Status'].isin(['Present', 'Wfh']).to_numpy()
+    in_time = np.where(worked, rng.integers(8 * 60 + 30, 10 * 60, len(df)), np.nan)
+    out_time = np.where(worked, rng.integers(17 * 60, 19 * 60 + 30, len(df)), np.nan)
+    out_time[rng.random(len(df)) < 0.02] = np.nan
+    df['InTime'] = pd.array(in_time, dtype='Float64').astype('Int16')
+    df['OutTime'] = pd.array(out_time, dtype='Float64').astype('Int16')
+    return df
+
+
+def _datetime_punctuality(df):
+    # Parse each punch back into a timestamp on its date, as a row-oriented implementation would
+    day = df['Date'].dt.strftime('%Y-%m-%d ')
+    start = pd.to_datetime(day + format_minutes(df['InTime']), format='%Y-%m-%d %H:%M')
+    end = pd.to_datetime(day + format_minutes(df['OutTime']), format='%Y-%m-%d %H:%M')
+    end = end.where(end >= start, end + pd.Timedelta(days=1))
+    shift_start = df['Date'] + pd.Timedelta(minutes=SHIFT_START)
+    shift_end = df['Date'] + pd.Timedelta(minutes=SHIFT_END)
+    worked = (end - start).dt.total_seconds() / 3600
+    return pd.DataFrame({
+        'EmployeeID': df['EmployeeID'],
+        'Worked_Hours': worked,
+        'Overtime_Hours': (worked - (SHIFT_END - SHIFT_START) / 60).clip(lower=0),
+        'Late_Arrivals': start > shift_start + pd.Timedelta(minutes=LATE_GRACE_MINUTES),
+        'Early_Departures': end < shift_end,
+    }).groupby('EmployeeID', observed=True).sum()
+
+
+def bench_punctuality(employees, days):
+    df = synthetic_punches(employees, days)
+    print(f"rows={len(df):,} ({employees:,} employees x {days} days)")
+    budget = best_of(lambda: status_counts(df, 'EmployeeID'))
+    baseline = best_of(lambda: _datetime_punctuality(df), repeat=1)
+    candidate = best_of(lambda: punctuality_counts(df, 'EmployeeID'))
+    print(f"  status_counts (budget)   {budget:7.3f} s")
+    print(f"  datetime parsing         {baseline:7.3f} s")
+    print(f"  punctuality_counts       {candidate:7.3f} s  speedup {baseline / candidate:6.1f}x  "
+          f"{candidate / budget:4.1f}x the status counts")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--employees', type=int, default=10_000)
+    parser.add_argument('--days', type=int, default=365)
+    args = parser.parse_args()
+    bench_punctuality(args.employees, args.days)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Rolling 30/90-day rates and absence streaks: per-employee loops and groupby().rolling against rolling.attendance_trends.
+
+Run from the repository root:
+    python -m benchmarks.bench_rolling --employees 10000 --days 730
+"""
+import argparse
+import itertools
+
+import numpy as np
+
+from benchmarks._utils import best_of
+from benchmarks.bench_aggregations import synthetic_attendance
+from scripts.rolling import ROLLING_WINDOWS, attendance_trends
+
+
+def _loop_trends(df):
+    # One rolling pass and one run-length scan per employee, in Python
+    results = {}
+    for employee, rows in df.groupby('EmployeeID', observed=True):
+        rows = rows.sort_values('Date').set_index('Date')
+        present = rows['Status'].isin(['Present', 'Wfh']).astype(float)
+        rates = [present.rolling(f'{window}D').mean().iloc[-1] * 100 for window in ROLLING_WINDOWS]
+        streaks = [len(list(group)) for absent, group in itertools.groupby(rows['Status'] == 'Absent') if absent]
+        results[employee] = (*rates, max(streaks, default=0))
+    return results
+
+
+def _groupby_rolling(df):
+    # pandas' grouped time-based rolling: rates only, no streaks
+    present = df.assign(Present=df['Status'].isin(['Present', 'Wfh']).astype(float)).sort_values(['EmployeeID', 'Date'])
+    grouped = present.groupby('EmployeeID', observed=True)
+    return [grouped.rolling(f'{window}D', on='Date')['Present'].mean() for window in ROLLING_WINDOWS]
+
+
+def bench_rolling(employees, days):
+    df = synthetic_attendance(employees, days)
+    # Shuffle, so every candidate pays for ordering the rows
+    df = df.iloc[np.random.default_rng(0).permutation(len(df))]
+    print(f"rows={len(df):,} ({employees:,} employees x {days} days)")
+    loops = best_of(lambda: _loop_trends(df), repeat=1)
+    grouped = best_of(lambda: _groupby_rolling(df), repeat=1)
+    candidate = best_of(lambda: attendance_trends(df))
+    print(f"  per-employee loops         {loops:8.2f} s")
+    print(f"  groupby().rolling (rates)  {grouped:8.2f} s")
+    print(f"  attendance_trends          {candidate:8.2f} s  speedup {loops / candidate:6.1f}x over the loops, "
+          f"{grouped / candidate:5.1f}x over groupby().rolling")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--employees', type=int, default=10_000)
+    parser.add_argument('--days', type=int, default=730)
+    args = parser.parse_args()
+    bench_rolling(args.employees, args.days)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Resident memory of the dashboard frames with and without the canonical schema.
+
+Run from the repository root:
+    python -m benchmarks.bench_schema --rows 1000000
+"""
+import argparse
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks._utils import DATA_DIR, write_sample_attendance
+from scripts.clean_data import clean_and_save
+from scripts.data_store import ATTENDANCE_CSV, MASTER_XLSX, load_cleaned_data
+from scripts.schema import memory_report
+
+
+def _frames(attendance_df, employee_df):
+    merged_df = attendance_df.merge(employee_df[['EmployeeID', 'Department', 'Location', 'Name']], on='EmployeeID')
+    return {'attendance_df': attendance_df, 'employee_df': employee_df, 'merged_df': merged_df}
+
+
+def bench_memory(rows):
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = Path(tmp)
+        raw = write_sample_attendance(base_dir / 'raw_attendance.csv', rows)
+        clean_and_save(raw, DATA_DIR / 'Employees_Master.xlsx', base_dir / ATTENDANCE_CSV, base_dir / MASTER_XLSX)
+
+        attendance_df = pd.read_csv(base_dir / ATTENDANCE_CSV)
+        attendance_df['Date'] = pd.to_datetime(attendance_df['Date'])
+        before = memory_report(_frames(attendance_df, pd.read_excel(base_dir / MASTER_XLSX)))
+        after = memory_report(_frames(*load_cleaned_data(base_dir)))
+
+    report = pd.DataFrame({'object strings MB': before, 'schema MB': after})
+    report.loc['total'] = report.sum()
+    report['reduction'] = (report['object strings MB'] / report['schema MB']).round(1).astype(str) + 'x'
+    print(f"rows={rows:,}")
+    print(report)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+    bench_memory(args.rows)
+
+
+if __name__ == '__main__':
+    main()
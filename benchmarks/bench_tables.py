@@ -0,0 +1,58 @@
+"""Employee table render: the whole styled frame against one server-side page.
+
+Measures what st.dataframe does before anything reaches the browser:
+building the Arrow payload (and applying the Styler) for the data it is given.
+
+Run from the repository root:
+    python -m benchmarks.bench_tables --rows 1000 10000 100000
+"""
+import argparse
+
+from streamlit.elements.arrow import marshall
+from streamlit.errors import StreamlitAPIException
+from streamlit.proto.Arrow_pb2 import Arrow as ArrowProto
+
+from benchmarks._utils import best_of
+from benchmarks.bench_exports import employee_stats
+from scripts.tables import search_rows, table_page
+
+
+def _payload(data):
+    proto = ArrowProto()
+    marshall(proto, data, default_uuid='bench')
+    return proto.ByteSize()
+
+
+def _styled(df):
+    return df.style.format({'Present_Rate': '{:.1f}%'})
+
+
+def bench_tables(rows, page_size=50):
+    stats = employee_stats(rows)
+
+    def paged():
+        page = table_page(search_rows(stats, '', ['EmployeeID', 'Name']), 1, page_size, 'Present_Rate', False)
+        return _payload(_styled(page))
+
+    page = best_of(paged)
+    paged_result = f"one page {page * 1000:6.1f} ms {paged() / 1024:5,.0f} KB"
+    try:
+        full = best_of(lambda: _payload(_styled(stats)), repeat=1)
+    except StreamlitAPIException:
+        # pandas' styler.render.max_elements limit: st.dataframe raises instead of rendering
+        print(f"rows={rows:>8,}  full table fails (Styler cell limit)  {paged_result}")
+        return
+    print(f"rows={rows:>8,}  full table {full:6.2f} s {_payload(_styled(stats)) / 1024:9,.0f} KB  "
+          f"{paged_result}  speedup {full / page:6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    args = parser.parse_args()
+    for rows in args.rows:
+        bench_tables(rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""Trend chart size: one point per day against the Auto resolution budget.
+
+Run from the repository root:
+    python -m benchmarks.bench_trend --employees 1000 --years 1 3 5
+"""
+import argparse
+
+import plotly.express as px
+
+from benchmarks._utils import best_of
+from benchmarks.bench_cube import synthetic_merged
+from scripts.cube import build_cube, daily_status_counts, trend_counts
+
+
+def _figure_json(counts):
+    return px.line(counts, title='Attendance Trends Over Time').to_json()
+
+
+def bench_trend(employees, years):
+    cube = build_cube(synthetic_merged(employees, 365 * years))
+    daily = daily_status_counts(cube)
+    baseline = best_of(lambda: _figure_json(daily_status_counts(cube)))
+    counts, resolution = trend_counts(cube)
+    candidate = best_of(lambda: _figure_json(trend_counts(cube)[0]))
+    print(f"years={years}  daily {len(daily):5,} dates {len(_figure_json(daily)) / 1024:6,.0f} KB {baseline:5.2f} s  "
+          f"auto ({resolution:<5}) {len(counts):4,} dates {len(_figure_json(counts)) / 1024:5,.0f} KB {candidate:5.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--employees', type=int, default=1_000)
+    parser.add_argument('--years', type=int, nargs='+', default=[1, 3, 5])
+    args = parser.parse_args()
+    for years in args.years:
+        bench_trend(args.employees, years)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Plot regeneration: a full render against a no-op run that finds every plot up to date.
+
+Run from the repository root:
+    python -m benchmarks.bench_visualization --rows 1000000 --workers 1 4
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from attendance_visualization import render_plots
+from benchmarks._utils import DATA_DIR, write_sample_attendance
+from scripts.clean_data import clean_and_save
+from scripts.data_store import ATTENDANCE_CSV, MASTER_XLSX, load_cleaned_data
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def bench_visualization(rows, workers):
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = Path(tmp)
+        raw = write_sample_attendance(base_dir / 'raw_attendance.csv', rows)
+        clean_and_save(raw, DATA_DIR / 'Employees_Master.xlsx', base_dir / ATTENDANCE_CSV, base_dir / MASTER_XLSX)
+        attendance_df, employee_df = load_cleaned_data(base_dir)
+
+        for count in workers:
+            out_dir = base_dir / f'plots_{count}'
+            full, rendered = _timed(lambda: render_plots(attendance_df, employee_df, out_dir, workers=count))
+            noop, skipped = _timed(lambda: render_plots(attendance_df, employee_df, out_dir, workers=count))
+            print(f"rows={rows:,} workers={count}  full {full:5.2f} s ({len(rendered)} plots)  "
+                  f"no-op {noop:5.2f} s ({len(skipped)} plots)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4])
+    args = parser.parse_args()
+    bench_visualization(args.rows, args.workers)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+"""Benchmark suite: time and peak memory of each pipeline stage at several data sizes.
+
+Covers cleaning (clean_and_save), the analysis report
+(calculate_attendance_metrics), the dashboard's data preparation, metrics
+and charts, and every plot of attendance_visualization. Input files come
+from scripts.generate_data, so the suite needs no data or network access.
+
+After an untimed warm-up call, time is the best of --repeat runs and
+peak memory the largest traced allocation (tracemalloc) during one more
+run. --save writes the results as JSON; --compare checks them against a
+saved baseline and exits with status 1 when a case got slower or bigger
+than --tolerance allows.
+
+Run from the repository root:
+    python -m benchmarks.suite --employees 100 1000 --save benchmarks/results/baseline.json
+    python -m benchmarks.suite --employees 100 1000 --compare benchmarks/results/baseline.json
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import tracemalloc
+import warnings
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks._utils import best_of
+from scripts.clean_data import clean_and_save
+from scripts.data_store import ATTENDANCE_CSV, MASTER_XLSX, load_cleaned_data, prepare_dataset
+from scripts.generate_data import generate_dataset
+
+# Differences below these are noise, whatever the ratio
+MIN_SECONDS = 0.005
+MIN_MB = 1.0
+
+
+def peak_memory_mb(func):
+    """Peak memory traced by tracemalloc while `func()` runs, in MB."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024 ** 2
+    finally:
+        tracemalloc.stop()
+
+
+def suite_cases(base_dir, employees, days):
+    """Yield (case name, callable) for one data size, preparing each stage's inputs from the previous one."""
+    from attendance_visualization import PLOT_RENDERERS, _set_style, plot_inputs
+    from scripts.attendance_analysis import calculate_attendance_metrics
+    from scripts.attendance_dashboard import (calculate_metrics, create_attendance_trend, create_department_chart,
+                                              create_location_chart, create_weekday_chart)
+    from scripts.cube import build_cube
+
+    raw_attendance, raw_master = generate_dataset(base_dir / 'raw', employees, days)
+
+    def clean():
+        return clean_and_save(raw_attendance, raw_master, base_dir / ATTENDANCE_CSV, base_dir / MASTER_XLSX)
+
+    yield 'clean_and_save', clean
+    if not (base_dir / ATTENDANCE_CSV).exists():
+        clean()
+
+    attendance_df, employee_df = load_cleaned_data(base_dir)
+    yield 'calculate_attendance_metrics', lambda: calculate_attendance_metrics(attendance_df, employee_df)
+
+    yield 'dashboard.prepare_dataset', lambda: prepare_dataset(attendance_df, employee_df)
+    merged_df = prepare_dataset(attendance_df, employee_df)
+    yield 'dashboard.build_cube', lambda: build_cube(merged_df)
+    cube = build_cube(merged_df)
+    yield 'dashboard.calculate_metrics', lambda: calculate_metrics(cube, employee_df)
+    for chart in [create_department_chart, create_attendance_trend, create_location_chart, create_weekday_chart]:
+        yield f'dashboard.{chart.__name__}', lambda chart=chart: chart(cube)
+
+    import matplotlib.pyplot as plt
+
+    def render(name):
+        PLOT_RENDERERS[name](inputs[name], base_dir / name)
+        # pandas draws on a figure of its own, so close every figure the renderer left open
+        plt.close('all')
+
+    _set_style()
+    yield 'plots.plot_inputs', lambda: plot_inputs(attendance_df, employee_df)
+    inputs = plot_inputs(attendance_df, employee_df)
+    for name in PLOT_RENDERERS:
+        yield f'plots.{Path(name).stem}', lambda name=name: render(name)
+
+
+def run_suite(sizes, days, repeat=3, match=None):
+    """Results keyed by 'case[employees]', each with rows, seconds and peak_mb."""
+    results = {}
+    for employees in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            for case, func in suite_cases(Path(tmp), employees, days):
+                if match and match not in case:
+                    continue
+                key = f'{case}[{employees}]'
+                # Untimed warm-up, so lazy imports and first-call caches count towards neither measure
+                func()
+                peak_mb = peak_memory_mb(func)
+                results[key] = {'rows': employees * days, 'seconds': best_of(func, repeat), 'peak_mb': peak_mb}
+                print(f"{key:<45} {results[key]['seconds']:8.3f} s  {results[key]['peak_mb']:9.1f} MB", flush=True)
+    return results
+
+
+def compare_results(baseline, current, tolerance=0.25):
+    """Regressions of `current` against `baseline`, as one message per case and measure.
+
+    A case regresses when its time or peak memory exceeds the baseline by
+    more than `tolerance` (0.25 = 25%). Differences within MIN_SECONDS or
+    MIN_MB are never flagged; cases missing from either side are skipped.
+    """
+    regressions = []
+    for key, result in current.items():
+        if key not in baseline:
+            continue
+        before = baseline[key]
+        if result['seconds'] > before['seconds'] * (1 + tolerance) and \
+                result['seconds'] - before['seconds'] > MIN_SECONDS:
+            regressions.append(f"{key}: time {before['seconds']:.3f} s -> {result['seconds']:.3f} s")
+        if result['peak_mb'] > before['peak_mb'] * (1 + tolerance) and result['peak_mb'] - before['peak_mb'] > MIN_MB:
+            regressions.append(f"{key}: peak memory {before['peak_mb']:.1f} MB -> {result['peak_mb']:.1f} MB")
+    return regressions
+
+
+def _environment():
+    return {'python': platform.python_version(), 'pandas': pd.__version__, 'machine': platform.machine(),
+            'processor': platform.processor()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--employees', type=int, nargs='+', default=[100, 1000],
+                        help='data sizes to run, as employee counts')
+    parser.add_argument('--days', type=int, default=130, help='weekdays of attendance per employee')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--match', default=None, help='only run cases whose name contains this text')
+    parser.add_argument('--save', type=Path, default=None, help='write the results to this JSON file')
+    parser.add_argument('--compare', type=Path, default=None, help='baseline JSON written by --save')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed slowdown or memory growth over the baseline (default: 0.25 = 25%%)')
+    args = parser.parse_args(argv)
+
+    # Deprecation notices from plotly and seaborn would drown the results
+    warnings.simplefilter('ignore', FutureWarning)
+    results = run_suite(args.employees, args.days, args.repeat, args.match)
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps({'environment': _environment(), 'results': results}, indent=2))
+        print(f"\nSaved {len(results)} results to {args.save}")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare_results(baseline['results'], results, args.tolerance)
+        print(f"\n{len(regressions)} regression(s) against {args.compare}")
+        for regression in regressions:
+            print(f"  {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+
+# Output column for each attendance status counted by status_counts
+STATUS_COUNT_COLUMNS = {
+    'Present': 'Present_Days',
+    'Wfh': 'WFH_Days',
+    'Leave': 'Leave_Days',
+    'Absent': 'Absent_Days',
+}
+
+
+def _status_codes(status, statuses):
+    """Position of each value in `statuses`, len(statuses) for other values and -1 for missing."""
+    other = len(statuses)
+    if isinstance(status.dtype, pd.CategoricalDtype):
+        # Translate the category codes instead of comparing strings
+        lookup = np.array([statuses.index(c) if c in statuses else other for c in status.cat.categories] + [-1])
+        return lookup[status.cat.codes.to_numpy()]
+    codes = pd.Categorical(status, categories=statuses).codes.astype(np.int64)
+    return np.where((codes < 0) & status.notna().to_numpy(), other, codes)
+
+
+def status_mask(status, statuses):
+    """Boolean array of the rows whose status is in `statuses`; categoricals are looked up per category."""
+    if isinstance(status.dtype, pd.CategoricalDtype):
+        # Code -1 (missing) takes the trailing False
+        lookup = np.append(status.cat.categories.isin(statuses), False)
+        return lookup[status.cat.codes.to_numpy()]
+    return status.isin(statuses).to_numpy()
+
+
+def group_codes(df, keys, dropna=True):
+    """Dense group number per row for `keys`, plus the key values of each group.
+
+    Groups are numbered in the order groupby(keys, sort=True, observed=True)
+    would list them. Each key is factorized once and the codes are combined
+    arithmetically, which avoids building a full GroupBy. With `dropna` rows
+    with a missing key get -1; otherwise missing values form their own
+    group, sorted last.
+    """
+    keys = keys if isinstance(keys, list) else [keys]
+    if len(keys) == 1:
+        # factorize(sort=True) already yields dense, sorted group numbers
+        key = keys[0]
+        codes, uniques = pd.factorize(key if isinstance(key, pd.Series) else df[key], sort=True,
+                                      use_na_sentinel=dropna)
+        name = key.name if isinstance(key, pd.Series) else key
+        return codes.astype(np.int64, copy=False), pd.DataFrame({name: uniques})
+
+    combined = np.zeros(len(df), dtype=np.int64)
+    valid = np.ones(len(df), dtype=bool)
+    factorized = []
+    for key in keys:
+        values = key if isinstance(key, pd.Series) else df[key]
+        codes, uniques = pd.factorize(values, sort=True, use_na_sentinel=dropna)
+        combined = combined * len(uniques) + codes
+        valid &= codes >= 0
+        factorized.append((values.name if isinstance(key, pd.Series) else key, uniques))
+
+    codes = np.full(len(df), -1, dtype=np.int64)
+    space = int(np.prod([len(uniques) for _, uniques in factorized], dtype=np.float64))
+    if space <= max(len(df), 1 << 20):
+        # Small key space: compact the combined codes with a presence table instead of a hash
+        present = np.bincount(combined[valid], minlength=space) > 0
+        codes[valid] = (np.cumsum(present) - 1)[combined[valid]]
+        observed = np.flatnonzero(present)
+    else:
+        codes[valid], observed = pd.factorize(combined[valid], sort=True)
+
+    # Unpack each observed combination back into per-key positions
+    groups = {}
+    remaining = np.asarray(observed, dtype=np.int64)
+    for name, uniques in reversed(factorized):
+        remaining, positions = np.divmod(remaining, len(uniques))
+        groups[name] = uniques.take(positions)
+    return codes, pd.DataFrame({name: groups[name] for name, _ in factorized})
+
+
+def resolve_group_codes(df, keys, dropna, grouping):
+    """group_codes(df, keys, dropna), or a copy of a `grouping` the caller already computed."""
+    if grouping is None:
+        return group_codes(df, keys, dropna)
+    codes, groups = grouping
+    return codes, groups.copy()
+
+
+def status_counts(df, keys, status_col='Status', dropna=True, grouping=None):
+    """Count attendance statuses per group in a single pass.
+
+    `keys` is anything DataFrame.groupby accepts (column names, Series such
+    as an ISO week). Returns one row per group with the key columns,
+    Total_Days (non-missing statuses, like groupby 'count') and one
+    *_Days column per entry of STATUS_COUNT_COLUMNS. Rows whose key is
+    missing are dropped, as groupby does, unless `dropna` is False.
+    Pass the result of group_codes(df, keys, dropna) as `grouping` to reuse
+    it across several aggregations over the same keys.
+    """
+    codes, groups = resolve_group_codes(df, keys, dropna, grouping)
+
+    statuses = list(STATUS_COUNT_COLUMNS)
+    n_groups, n_statuses = len(groups), len(statuses)
+    status_codes = _status_codes(df[status_col], statuses)
+
+    # Slot n_statuses collects unlisted statuses so they still count towards Total_Days
+    flat = codes * (n_statuses + 1) + status_codes
+    valid = (codes >= 0) & (status_codes >= 0)
+    if not valid.all():
+        flat = flat[valid]
+    counts = np.bincount(flat, minlength=n_groups * (n_statuses + 1)).reshape(n_groups, n_statuses + 1)
+
+    groups['Total_Days'] = counts.sum(axis=1)
+    for i, status_name in enumerate(statuses):
+        groups[STATUS_COUNT_COLUMNS[status_name]] = counts[:, i]
+    return groups
+
+
+def present_percentage(counts):
+    """Present + WFH days as a percentage of Total_Days, rounded to 2 places."""
+    return ((counts['Present_Days'] + counts['WFH_Days']) / counts['Total_Days'] * 100).round(2)
+
+
+def status_percentage(counts, column):
+    """A *_Days column as a percentage of Total_Days, rounded to 2 places."""
+    return (counts[column] / counts['Total_Days'] * 100).round(2)
@@ -1,93 +1,130 @@
+import sys
+from pathlib import Path
+
 import pandas as pd
-import numpy as np
-
-# Read the cleaned data files
-attendance_df = pd.read_csv('Employee_Attendance_Clean.csv')
-employee_df = pd.read_excel('Employees_Master_Clean.xlsx')
-
-def calculate_attendance_metrics():
-    # Calculate attendance statistics for each employee
-    attendance_stats = attendance_df.groupby('EmployeeID').agg({
-        'Status': [
-            ('Total_Days', 'count'),
-            ('Present_Days', lambda x: (x == 'Present').sum()),
-            ('WFH_Days', lambda x: (x == 'Wfh').sum()),
-            ('Leave_Days', lambda x: (x == 'Leave').sum()),
-            ('Absent_Days', lambda x: (x == 'Absent').sum())
-        ]
-    })
-    
-    # Flatten the column names
-    attendance_stats.columns = ['Total_Days', 'Present_Days', 'WFH_Days', 'Leave_Days', 'Absent_Days']
-    attendance_stats = attendance_stats.reset_index()
+
+if __package__ in (None, ''):
+    # Running as `python scripts/attendance_analysis.py`: make the `scripts` package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.aggregations import group_codes, present_percentage, status_counts, status_percentage
+from scripts.data_store import load_cleaned_data
+from scripts.punctuality import PUNCTUALITY_COLUMNS, punctuality_counts, punctuality_rates
+
+REPORT_FILE = 'Employee_Attendance_Analysis_Report.xlsx'
+
+# Master columns carried into the report
+MASTER_COLUMNS = ['EmployeeID', 'Name', 'Department', 'Designation', 'Location', 'Status']
+
+
+def calculate_attendance_metrics(attendance_df, employee_df):
+    """Per-employee day counts, percentages, worked hours and punctuality, joined with the employee master."""
+    # Calculate attendance statistics for each employee; the grouping is shared with the punctuality counts
+    grouping = group_codes(attendance_df, 'EmployeeID')
+    attendance_stats = status_counts(attendance_df, 'EmployeeID', grouping=grouping)
     
     # Calculate percentages
-    attendance_stats['Present_Percentage'] = ((attendance_stats['Present_Days'] + attendance_stats['WFH_Days']) / 
-                                           attendance_stats['Total_Days'] * 100).round(2)
-    attendance_stats['Leave_Percentage'] = (attendance_stats['Leave_Days'] / 
-                                         attendance_stats['Total_Days'] * 100).round(2)
-    attendance_stats['Absent_Percentage'] = (attendance_stats['Absent_Days'] / 
-                                          attendance_stats['Total_Days'] * 100).round(2)
+    attendance_stats['Present_Percentage'] = present_percentage(attendance_stats)
+    attendance_stats['Leave_Percentage'] = status_percentage(attendance_stats, 'Leave_Days')
+    attendance_stats['Absent_Percentage'] = status_percentage(attendance_stats, 'Absent_Days')
+
+    # Worked hours and punctuality from the punch minutes; same grouping, so the rows line up with the counts
+    punctuality = punctuality_counts(attendance_df, 'EmployeeID', grouping=grouping)
+    attendance_stats[PUNCTUALITY_COLUMNS] = punctuality[PUNCTUALITY_COLUMNS]
+    attendance_stats = attendance_stats.join(punctuality_rates(attendance_stats))
     
     # Merge with employee details
     result = pd.merge(attendance_stats, 
-                     employee_df[['EmployeeID', 'Name', 'Department', 'Designation', 'Location', 'Status']], 
+                     employee_df[MASTER_COLUMNS], 
                      on='EmployeeID', 
                      how='left')
     
     # Reorder columns for better readability
     column_order = ['EmployeeID', 'Name', 'Department', 'Designation', 'Location', 'Status',
                     'Total_Days', 'Present_Days', 'WFH_Days', 'Leave_Days', 'Absent_Days',
-                    'Present_Percentage', 'Leave_Percentage', 'Absent_Percentage']
+                    'Present_Percentage', 'Leave_Percentage', 'Absent_Percentage',
+                    'Punched_Days', 'Missing_Punch_Days', 'Worked_Hours', 'Avg_Worked_Hours', 'Overtime_Hours',
+                    'Late_Arrivals', 'Late_Percentage', 'Early_Departures', 'Early_Departure_Percentage']
     result = result[column_order]
     
     return result
 
-# Calculate metrics
-attendance_metrics = calculate_attendance_metrics()
-
-# Display overall statistics
-print("\nOverall Attendance Statistics:")
-print("-----------------------------")
-print(f"Total Employees: {len(attendance_metrics)}")
-print(f"Average Present Percentage: {attendance_metrics['Present_Percentage'].mean():.2f}%")
-print(f"Average Leave Percentage: {attendance_metrics['Leave_Percentage'].mean():.2f}%")
-print(f"Average Absent Percentage: {attendance_metrics['Absent_Percentage'].mean():.2f}%")
-
-# Display department-wise statistics
-print("\nDepartment-wise Average Present Percentage:")
-print("----------------------------------------")
-dept_stats = attendance_metrics.groupby('Department')['Present_Percentage'].agg(['mean', 'count']).round(2)
-dept_stats.columns = ['Avg Present %', 'Employee Count']
-print(dept_stats)
-
-# Display top 5 employees with highest attendance
-print("\nTop 5 Employees by Attendance:")
-print("----------------------------")
-top_5 = attendance_metrics[attendance_metrics['Total_Days'] >= 5].nlargest(5, 'Present_Percentage')[
-    ['Name', 'Department', 'Present_Percentage', 'Total_Days']
-]
-print(top_5)
-
-# Display bottom 5 employees with lowest attendance
-print("\nBottom 5 Employees by Attendance:")
-print("-------------------------------")
-bottom_5 = attendance_metrics[attendance_metrics['Total_Days'] >= 5].nsmallest(5, 'Present_Percentage')[
-    ['Name', 'Department', 'Present_Percentage', 'Total_Days']
-]
-print(bottom_5)
-
-# Save detailed results to Excel
-output_file = 'Employee_Attendance_Analysis_Report.xlsx'
-attendance_metrics.to_excel(output_file, index=False)
-print(f"\nDetailed analysis has been saved to '{output_file}'")
-
-# Additional insights
-print("\nAdditional Insights:")
-print("------------------")
-print("1. Employees with 100% Attendance (Present + WFH):", 
-      len(attendance_metrics[attendance_metrics['Present_Percentage'] == 100]))
-print("2. Employees with more than 20% Absence:", 
-      len(attendance_metrics[attendance_metrics['Absent_Percentage'] > 20]))
-print("3. Employees with no leaves taken:", 
-      len(attendance_metrics[attendance_metrics['Leave_Days'] == 0]))
\ No newline at end of file
+
+def print_summary(attendance_metrics):
+    """Overall, department-wise and top/bottom-5 statistics."""
+    # Display overall statistics
+    print("\nOverall Attendance Statistics:")
+    print("-----------------------------")
+    print(f"Total Employees: {len(attendance_metrics)}")
+    print(f"Average Present Percentage: {attendance_metrics['Present_Percentage'].mean():.2f}%")
+    print(f"Average Leave Percentage: {attendance_metrics['Leave_Percentage'].mean():.2f}%")
+    print(f"Average Absent Percentage: {attendance_metrics['Absent_Percentage'].mean():.2f}%")
+
+    # Display department-wise statistics
+    print("\nDepartment-wise Average Present Percentage:")
+    print("----------------------------------------")
+    dept_stats = attendance_metrics.groupby('Department', observed=True)['Present_Percentage'].agg(['mean', 'count']).round(2)
+    dept_stats.columns = ['Avg Present %', 'Employee Count']
+    print(dept_stats)
+
+    # Department totals of the additive columns give exact department rates
+    print("\nDepartment-wise Working Hours and Punctuality:")
+    print("--------------------------------------------")
+    dept_totals = attendance_metrics.groupby('Department', observed=True)[
+        ['Present_Days', 'WFH_Days'] + PUNCTUALITY_COLUMNS].sum()
+    dept_punctuality = punctuality_rates(dept_totals).join(dept_totals['Overtime_Hours'].round(2))
+    dept_punctuality.columns = ['Avg Hours/Day', 'Late %', 'Early Leave %', 'Overtime Hours']
+    print(dept_punctuality)
+
+    # Display top 5 employees with highest attendance
+    print("\nTop 5 Employees by Attendance:")
+    print("----------------------------")
+    top_5 = attendance_metrics[attendance_metrics['Total_Days'] >= 5].nlargest(5, 'Present_Percentage')[
+        ['Name', 'Department', 'Present_Percentage', 'Total_Days']
+    ]
+    print(top_5)
+
+    # Display bottom 5 employees with lowest attendance
+    print("\nBottom 5 Employees by Attendance:")
+    print("-------------------------------")
+    bottom_5 = attendance_metrics[attendance_metrics['Total_Days'] >= 5].nsmallest(5, 'Present_Percentage')[
+        ['Name', 'Department', 'Present_Percentage', 'Total_Days']
+    ]
+    print(bottom_5)
+
+
+def print_insights(attendance_metrics):
+    # Additional insights
+    print("\nAdditional Insights:")
+    print("------------------")
+    print("1. Employees with 100% Attendance (Present + WFH):", 
+          len(attendance_metrics[attendance_metrics['Present_Percentage'] == 100]))
+    print("2. Employees with more than 20% Absence:", 
+          len(attendance_metrics[attendance_metrics['Absent_Percentage'] > 20]))
+    print("3. Employees with no leaves taken:", 
+          len(attendance_metrics[attendance_metrics['Leave_Days'] == 0]))
+
+
+def write_report(attendance_metrics, output_file=REPORT_FILE):
+    """Print the summary and insights and save the per-employee metrics to `output_file`."""
+    print_summary(attendance_metrics)
+
+    # Save detailed results to Excel
+    attendance_metrics.to_excel(output_file, index=False)
+    print(f"\nDetailed analysis has been saved to '{output_file}'")
+
+    print_insights(attendance_metrics)
+
+
+def main(output_file=REPORT_FILE):
+    # Read the cleaned data (columnar store, or the cleaned CSV/XLSX)
+    attendance_df, employee_df = load_cleaned_data(master_columns=MASTER_COLUMNS)
+
+    # Calculate metrics
+    attendance_metrics = calculate_attendance_metrics(attendance_df, employee_df)
+    write_report(attendance_metrics, output_file)
+    return attendance_metrics
+
+
+if __name__ == '__main__':
+    main()
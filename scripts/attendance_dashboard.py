@@ -1,61 +1,98 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime
 import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from io import BytesIO
 import os
+import sys
+from pathlib import Path
 
-# For Excel export
-import io
-
-# Set page configuration
-st.set_page_config(
-    page_title="Employee Attendance Dashboard",
-    page_icon="📊",
-    layout="wide"
-)
-
-# Add custom CSS
-st.markdown("""
-    <style>
-    .main {
-        padding: 0rem 1rem;
-    }
-    .stPlotlyChart {
-        width: 100%;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+# `streamlit run scripts/attendance_dashboard.py` only puts scripts/ on the path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.aggregations import group_codes, present_percentage, status_counts
+from scripts.clean_data import format_minutes
+from scripts.cube import (TREND_RESOLUTIONS, WEEKDAY_ORDER, build_cube, slice_cube, status_rates, status_shares,
+                          trend_counts)
+from scripts.data_store import DASHBOARD_MASTER_COLUMNS, data_signature, load_prepared_data
+from scripts.exports import to_csv_bytes, to_excel_bytes
+from scripts.filters import EmployeeIndex, FilterIndex
+from scripts.instrumentation import Timings, section, timed
+from scripts.punctuality import PUNCTUALITY_COLUMNS, punctuality_counts, punctuality_rates
+from scripts.rolling import ROLLING_WINDOWS, attendance_trends, hr_alerts, rolling_rates
+from scripts.tables import page_count, search_rows, table_page
+
+# Session-state keys of the Performance panel's checkboxes
+TIMINGS_KEY = 'debug_timings'
+TRACE_MEMORY_KEY = 'debug_trace_memory'
 
 # Load the data
-@st.cache_data
-def load_data():
-    # Use relative path from the repository root
-    attendance_df = pd.read_csv('Employee_Attendance_Clean.csv')
-    employee_df = pd.read_excel('Employees_Master_Clean.xlsx')
-    
-    # Convert date to datetime
-    attendance_df['Date'] = pd.to_datetime(attendance_df['Date'])
-    return attendance_df, employee_df
+# `signature` (mtime and size of the data files) keys the caches, so re-cleaning the data invalidates them;
+# the per-dataset caches keep only the current signature, so the previous version's frames are released.
+# cache_resource hands every rerun the same frames without copying them; they must not be modified.
+# The loaders are timed outside the cache, so a rerun also shows its cache hits.
+@timed()
+@st.cache_resource(max_entries=1)
+def load_data(signature):
+    # Typed columnar store when present, cleaned CSV/XLSX otherwise, plus the merged rows with calendar columns
+    return load_prepared_data(master_columns=DASHBOARD_MASTER_COLUMNS)
 
-def calculate_metrics(attendance_df, employee_df):
-    # Merge data
-    merged_df = attendance_df.merge(employee_df[['EmployeeID', 'Department', 'Location']], on='EmployeeID')
-    
+@timed()
+@st.cache_data(max_entries=1)
+def load_cube(signature):
+    # Counts per (Date, Department, Location, Status); charts and KPIs are sums over these cells
+    return build_cube(load_data(signature)[2])
+
+@timed()
+@st.cache_resource(max_entries=1)
+def load_filter_index(signature):
+    # Date-sorted positions and per-value masks for the row-level filters
+    return FilterIndex(load_data(signature)[2])
+
+@timed()
+@st.cache_resource(max_entries=1)
+def load_employee_index(signature):
+    # Employee-major copy of the drilldown columns with per-employee offsets, plus the name -> ID map
+    _, employee_df, merged_df = load_data(signature)
+    return EmployeeIndex(merged_df, employee_df)
+
+@st.cache_data(max_entries=32)
+def load_heatmap(signature, emp_id, date_range):
+    # Calendar-like heatmap data (weeks x weekday), cached per (employee, date range)
+    emp_att = load_employee_index(signature).records(emp_id, date_range)
+    # Map status to numeric values for heatmap
+    status_map = {'Present': 1.0, 'Wfh': 1.0, 'Leave': 0.5, 'Absent': 0.0}
+    emp_att = emp_att.assign(
+        Week_Label=emp_att['ISO_Year'].astype(str) + "-W" + emp_att['ISO_Week'].astype(str),
+        Weekday_Num=emp_att['Weekday'].cat.codes,  # 0=Monday
+        Status_Num=emp_att['Status'].map(status_map).fillna(0.0),
+    )
+    pivot = emp_att.pivot_table(index='Week_Label', columns='Weekday_Num', values='Status_Num', aggfunc='mean')
+    # Reindex weekdays to 0..6 and fill missing with NaN
+    return pivot.reindex(columns=range(0, 7))
+
+@st.cache_data(max_entries=16)
+def build_export(signature, export_key, file_format, _employee_stats):
+    # Cached per data version, filter state and format; the stats follow from those, so they are not hashed
+    if file_format == 'csv':
+        return to_csv_bytes(_employee_stats)
+    return to_excel_bytes(_employee_stats, sheet_name='EmployeeMetrics')
+
+@timed()
+@st.cache_data(max_entries=16)
+def load_trends(signature, filter_key, _filtered_df):
+    # Rolling rates and absence streaks of the filtered rows, cached per data version and filter state like the exports
+    return attendance_trends(_filtered_df)
+
+@timed()
+def calculate_metrics(cube, employee_df):
     # Calculate overall metrics
     total_employees = employee_df.shape[0]
-    present_rate = (merged_df['Status'].isin(['Present', 'Wfh']).mean() * 100).round(2)
-    leave_rate = (merged_df['Status'] == 'Leave').mean() * 100
-    absent_rate = (merged_df['Status'] == 'Absent').mean() * 100
+    present_rate, leave_rate, absent_rate = status_rates(cube)
     
     return total_employees, present_rate, leave_rate, absent_rate
 
-def create_department_chart(merged_df):
-    dept_stats = merged_df.groupby('Department')['Status'].value_counts(normalize=True).unstack()
+@timed()
+def create_department_chart(cube):
+    dept_stats = status_shares(cube, 'Department')
     fig = px.bar(dept_stats, 
                  title='Attendance Status by Department',
                  barmode='stack',
@@ -63,16 +100,25 @@ def create_department_chart(merged_df):
     fig.update_layout(height=400)
     return fig
 
-def create_attendance_trend(merged_df):
-    daily_status = merged_df.groupby(['Date', 'Status']).size().unstack(fill_value=0)
+@timed()
+def create_attendance_trend(cube, resolution='Auto', webgl=False):
+    # Daily points, or weekly/monthly averages when the range would exceed the point budget
+    daily_status, resolution = trend_counts(cube, resolution)
+    title = 'Attendance Trends Over Time'
+    value_label = 'Number of Employees'
+    if resolution != 'Day':
+        title += f' ({resolution}ly average)'
+        value_label = 'Employees per Day'
     fig = px.line(daily_status, 
-                  title='Attendance Trends Over Time',
-                  labels={'value': 'Number of Employees', 'Date': 'Date'})
+                  title=title,
+                  labels={'value': value_label, 'Date': 'Date'},
+                  render_mode='webgl' if webgl else 'auto')
     fig.update_layout(height=400)
     return fig
 
-def create_location_chart(merged_df):
-    location_stats = merged_df.groupby('Location')['Status'].value_counts(normalize=True).unstack()
+@timed()
+def create_location_chart(cube):
+    location_stats = status_shares(cube, 'Location')
     fig = px.bar(location_stats,
                  title='Attendance Status by Location',
                  barmode='stack',
@@ -80,12 +126,11 @@ def create_location_chart(merged_df):
     fig.update_layout(height=400)
     return fig
 
-def create_weekday_chart(merged_df):
-    merged_df['Weekday'] = merged_df['Date'].dt.day_name()
-    weekday_stats = merged_df.groupby('Weekday')['Status'].value_counts(normalize=True).unstack()
+@timed()
+def create_weekday_chart(cube):
+    weekday_stats = status_shares(cube, 'Weekday')
     # Reorder days
-    weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
-    weekday_stats = weekday_stats.reindex(weekday_order)
+    weekday_stats = weekday_stats.reindex(WEEKDAY_ORDER)
     
     fig = px.bar(weekday_stats,
                  title='Attendance Patterns by Weekday',
@@ -94,17 +139,104 @@ def create_weekday_chart(merged_df):
     fig.update_layout(height=400)
     return fig
 
+@timed()
+def create_punctuality_chart(dept_punctuality):
+    fig = px.bar(dept_punctuality[['Late_Percentage', 'Early_Departure_Percentage']],
+                 title='Late Arrivals and Early Departures by Department',
+                 barmode='group',
+                 labels={'value': '% of Worked Days', 'variable': 'Measure'})
+    fig.update_layout(height=400)
+    return fig
+
+@timed()
+def create_rolling_rate_chart(rates):
+    fig = px.line(rates,
+                  title='Rolling Present + WFH Rate',
+                  labels={'value': 'Rate (%)', 'variable': 'Window'})
+    fig.update_layout(height=350, yaxis_range=[0, 100])
+    return fig
+
+def paged_dataframe(df, key, sort_by, ascending=True, search_columns=None, format_page=None, page_size=50, height=300):
+    # Search, sort and paginate on the server so only one page is formatted and sent to the browser
+    controls = st.columns([3, 2, 2, 1])
+    if search_columns:
+        df = search_rows(df, controls[0].text_input("Search", key=f'{key}_search'), search_columns)
+    columns = list(df.columns)
+    sort_by = controls[1].selectbox("Sort by", columns, index=columns.index(sort_by), key=f'{key}_sort')
+    order = controls[2].radio("Order", ['Ascending', 'Descending'], index=0 if ascending else 1,
+                              horizontal=True, key=f'{key}_order')
+
+    pages = page_count(len(df), page_size)
+    # Keep the page inside the range after a filter or search shrinks the table
+    if st.session_state.get(f'{key}_page', 1) > pages:
+        st.session_state[f'{key}_page'] = pages
+    page = controls[3].number_input("Page", min_value=1, max_value=pages, key=f'{key}_page')
+
+    rows = table_page(df, page, page_size, sort_by, order == 'Ascending')
+    st.dataframe(format_page(rows) if format_page else rows, height=height)
+    first = (page - 1) * page_size
+    st.caption(f"Rows {min(first + 1, len(df)):,}-{first + len(rows):,} of {len(df):,}")
+
+def show_chart(fig, name):
+    # Plotly serializes the figure here, so it is timed apart from building it
+    with section(f'plotly_chart.{name}'):
+        st.plotly_chart(fig, use_container_width=True)
+
+def timing_panel(timings, filters):
+    # Sidebar panel with this rerun's section timings; each enabled rerun is also logged as JSON with its filters
+    with st.sidebar.expander("Performance"):
+        st.checkbox("Show timings", key=TIMINGS_KEY, value=os.environ.get('DASHBOARD_TIMINGS') == '1')
+        st.checkbox("Trace memory (slower)", key=TRACE_MEMORY_KEY)
+        if timings.enabled:
+            timings.log(filters=filters)
+            st.caption(f"Total {timings.total_seconds():.3f} s (nested sections are indented and included in the step above)")
+            if timings.records:
+                records = pd.DataFrame(timings.records)
+                records['section'] = ['\u2003' * depth + name for name, depth in zip(records['section'], records['depth'])]
+                st.dataframe(records.drop(columns='depth'), hide_index=True, use_container_width=True)
+
 def main():
+    # Set page configuration
+    st.set_page_config(
+        page_title="Employee Attendance Dashboard",
+        page_icon="📊",
+        layout="wide"
+    )
+
+    # Add custom CSS
+    st.markdown("""
+        <style>
+        .main {
+            padding: 0rem 1rem;
+        }
+        .stPlotlyChart {
+            width: 100%;
+        }
+        </style>
+        """, unsafe_allow_html=True)
+
+    # Per-rerun timings, switched on from the Performance panel (or DASHBOARD_TIMINGS=1)
+    timings = Timings(enabled=st.session_state.get(TIMINGS_KEY, os.environ.get('DASHBOARD_TIMINGS') == '1'),
+                      trace_memory=st.session_state.get(TRACE_MEMORY_KEY, False))
+    # Filled in by render_dashboard as the sidebar is read, so the timing log says which view was timed
+    filters = {}
+    with timings.activate():
+        render_dashboard(filters)
+    timing_panel(timings, filters)
+
+def render_dashboard(filters):
     # Load data
-    attendance_df, employee_df = load_data()
-    merged_df = attendance_df.merge(employee_df[['EmployeeID', 'Department', 'Location', 'Name']], on='EmployeeID')
+    signature = data_signature()
+    attendance_df, employee_df, merged_df = load_data(signature)
+    cube = load_cube(signature)
+    filter_index = load_filter_index(signature)
     
     # Title
     st.title("📊 Employee Attendance Dashboard")
     st.markdown("---")
     
     # Calculate metrics
-    total_employees, present_rate, leave_rate, absent_rate = calculate_metrics(attendance_df, employee_df)
+    total_employees, present_rate, leave_rate, absent_rate = calculate_metrics(cube, employee_df)
     
     # Top metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -125,13 +257,13 @@ def main():
     # Date range filter
     date_range = st.sidebar.date_input(
         "Select Date Range",
-        value=(merged_df['Date'].min(), merged_df['Date'].max()),
-        min_value=merged_df['Date'].min().date(),
-        max_value=merged_df['Date'].max().date()
+        value=(cube['Date'].min(), cube['Date'].max()),
+        min_value=cube['Date'].min().date(),
+        max_value=cube['Date'].max().date()
     )
     
     # Department filter
-    departments = merged_df['Department'].dropna().unique()
+    departments = cube['Department'].dropna().unique()
     selected_departments = st.sidebar.multiselect(
         "Select Departments",
         options=sorted(list(departments)),
@@ -139,8 +271,8 @@ def main():
     )
     
     # Location filter
-    locations = list(merged_df['Location'].dropna().unique())
-    if merged_df['Location'].isna().any():
+    locations = list(cube['Location'].dropna().unique())
+    if cube['Location'].isna().any():
         locations.append('Unknown')
     selected_locations = st.sidebar.multiselect(
         "Select Locations",
@@ -148,91 +280,128 @@ def main():
         default=sorted(locations)
     )
     
-    # Filter data based on selections
-    date_mask = (
-        (merged_df['Date'].dt.date >= date_range[0]) &
-        (merged_df['Date'].dt.date <= date_range[1])
-    )
-    dept_mask = merged_df['Department'].isin(selected_departments)
-    
-    # Handle location filtering including NaN values
-    if 'Unknown' in selected_locations:
-        loc_mask = merged_df['Location'].isin(selected_locations) | merged_df['Location'].isna()
-    else:
-        loc_mask = merged_df['Location'].isin(selected_locations)
+    # Trend chart resolution; Auto keeps the figure to a bounded number of points
+    trend_resolution = st.sidebar.selectbox("Trend Resolution", ['Auto'] + list(TREND_RESOLUTIONS))
+    trend_webgl = st.sidebar.checkbox("Render trend with WebGL", value=False)
+    filters.update(date_range=date_range, departments=selected_departments, locations=selected_locations,
+                   resolution=trend_resolution, webgl=trend_webgl)
     
-    filtered_df = merged_df[date_mask & dept_mask & loc_mask]
+    # Charts only need the cube cells inside the filters
+    with section('slice_cube'):
+        filtered_cube = slice_cube(cube, date_range, selected_departments, selected_locations)
     
     # Charts
     col1, col2 = st.columns(2)
     
     with col1:
-        st.plotly_chart(create_department_chart(filtered_df), use_container_width=True)
+        show_chart(create_department_chart(filtered_cube), 'department')
     with col2:
-        st.plotly_chart(create_location_chart(filtered_df), use_container_width=True)
+        show_chart(create_location_chart(filtered_cube), 'location')
         
     col3, col4 = st.columns(2)
     
     with col3:
-        st.plotly_chart(create_attendance_trend(filtered_df), use_container_width=True)
+        show_chart(create_attendance_trend(filtered_cube, trend_resolution, trend_webgl), 'trend')
     with col4:
-        st.plotly_chart(create_weekday_chart(filtered_df), use_container_width=True)
+        show_chart(create_weekday_chart(filtered_cube), 'weekday')
+    
+    # Row-level filter for the employee table
+    with section('filter_rows'):
+        filtered_df = merged_df.iloc[filter_index.positions(date_range, selected_departments, selected_locations)]
     
     # Detailed Data View
     st.markdown("### Detailed Attendance Data")
     
     # Calculate employee-wise attendance
-    employee_stats = filtered_df.groupby(['EmployeeID', 'Name', 'Department', 'Location']).agg({
-        'Status': ['count',
-                  lambda x: (x == 'Present').sum(),
-                  lambda x: (x == 'Wfh').sum(),
-                  lambda x: (x == 'Leave').sum(),
-                  lambda x: (x == 'Absent').sum()]
-    }).reset_index()
-    
-    employee_stats.columns = ['EmployeeID', 'Name', 'Department', 'Location', 
-                            'Total_Days', 'Present_Days', 'WFH_Days', 'Leave_Days', 'Absent_Days']
+    with section('employee_stats'):
+        employee_keys = ['EmployeeID', 'Name', 'Department', 'Location']
+        # Factorized once for both aggregations, so their groups line up row for row. Missing master values
+        # (the 'Unknown' filter option) keep their own groups, so every filtered row is counted here and below
+        grouping = group_codes(filtered_df, employee_keys, dropna=False)
+        employee_stats = status_counts(filtered_df, employee_keys, dropna=False, grouping=grouping)
+        employee_stats['Present_Rate'] = present_percentage(employee_stats)
+        punctuality = punctuality_counts(filtered_df, employee_keys, dropna=False, grouping=grouping)
+        employee_stats[PUNCTUALITY_COLUMNS] = punctuality[PUNCTUALITY_COLUMNS]
+        employee_stats['Avg_Worked_Hours'] = punctuality_rates(employee_stats)['Avg_Worked_Hours']
     
-    employee_stats['Present_Rate'] = ((employee_stats['Present_Days'] + employee_stats['WFH_Days']) / 
-                                    employee_stats['Total_Days'] * 100).round(2)
-    
-    # Export buttons for the employee-level stats
-    csv_bytes = employee_stats.to_csv(index=False).encode('utf-8')
-    excel_buffer = BytesIO()
-    with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
-        employee_stats.to_excel(writer, index=False, sheet_name='EmployeeMetrics')
-    excel_bytes = excel_buffer.getvalue()
-
-    col_export_1, col_export_2 = st.columns([1, 1])
-    with col_export_1:
-        st.download_button("Download CSV", data=csv_bytes, file_name='employee_metrics.csv', mime='text/csv')
-    with col_export_2:
-        st.download_button("Download Excel", data=excel_bytes, file_name='employee_metrics.xlsx', mime='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-
-    st.dataframe(
-        employee_stats.style.format({
-            'Present_Rate': '{:.1f}%'
-        }),
-        height=300
-    )
+    # Export buttons for the employee-level stats, built only once requested for the current filters
+    export_key = (date_range, tuple(selected_departments), tuple(selected_locations))
+    if st.button("Prepare downloads"):
+        st.session_state['export_key'] = export_key
+
+    if st.session_state.get('export_key') == export_key:
+        with section('exports'):
+            csv_bytes = build_export(signature, export_key, 'csv', employee_stats)
+            excel_bytes = build_export(signature, export_key, 'xlsx', employee_stats)
+
+        col_export_1, col_export_2 = st.columns([1, 1])
+        with col_export_1:
+            st.download_button("Download CSV", data=csv_bytes, file_name='employee_metrics.csv', mime='text/csv')
+        with col_export_2:
+            st.download_button(
+                "Download Excel", data=excel_bytes, file_name='employee_metrics.xlsx',
+                mime='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+            )
+
+    with section('employee_table'):
+        paged_dataframe(
+            employee_stats, 'employee_stats', sort_by='EmployeeID', search_columns=['EmployeeID', 'Name'],
+            format_page=lambda page: page.style.format({
+                'Present_Rate': '{:.1f}%',
+                'Worked_Hours': '{:.1f}',
+                'Overtime_Hours': '{:.1f}',
+                'Avg_Worked_Hours': '{:.2f}'
+            })
+        )
+
+    st.markdown("---")
+    st.markdown("### Working Hours and Punctuality")
+    # Sums of the per-employee columns, so the filtered rows are not scanned again
+    with section('punctuality'):
+        punctuality_totals = employee_stats[['Present_Days', 'WFH_Days'] + PUNCTUALITY_COLUMNS]
+        overall = punctuality_rates(punctuality_totals.sum().to_frame().T).iloc[0]
+        dept_punctuality = punctuality_rates(employee_stats.groupby('Department', observed=True)[
+            punctuality_totals.columns].sum())
+
+    p1, p2, p3, p4 = st.columns(4)
+    p1.metric("Avg Hours per Day", f"{overall['Avg_Worked_Hours']:.2f}")
+    p2.metric("Late Arrival Rate", f"{overall['Late_Percentage']:.1f}%")
+    p3.metric("Early Departure Rate", f"{overall['Early_Departure_Percentage']:.1f}%")
+    p4.metric("Overtime Hours", f"{employee_stats['Overtime_Hours'].sum():,.1f}")
+    st.caption(f"Missing punches on {employee_stats['Missing_Punch_Days'].sum():,} Present/WFH days")
+    show_chart(create_punctuality_chart(dept_punctuality), 'punctuality')
+
+    st.markdown("---")
+    st.markdown("### Attendance Trends and HR Alerts")
+    # Rates as of each employee's last record inside the filters; streaks count consecutive recorded days
+    trends = load_trends(signature, export_key, filtered_df)
+    with section('hr_alerts'):
+        names = employee_df[['EmployeeID', 'Name', 'Department']].drop_duplicates('EmployeeID')
+        alerts = names.merge(hr_alerts(trends), on='EmployeeID', how='right')
+    t1, t2, t3 = st.columns(3)
+    t1.metric(f"Avg {ROLLING_WINDOWS[0]}-day Rate", f"{trends[f'Rate_{ROLLING_WINDOWS[0]}d'].mean():.1f}%")
+    t2.metric("Longest Absence Streak", f"{trends['Longest_Absence_Streak'].max() if len(trends) else 0} days")
+    t3.metric("Employees Flagged", len(alerts))
+    with section('alerts_table'):
+        paged_dataframe(
+            alerts[['EmployeeID', 'Name', 'Department', 'Last_Date'] + [f'Rate_{w}d' for w in ROLLING_WINDOWS]
+                   + ['Current_Absence_Streak', 'Longest_Absence_Streak', 'Reason']],
+            'hr_alerts', sort_by='Current_Absence_Streak', ascending=False, search_columns=['EmployeeID', 'Name'],
+            format_page=lambda page: page.assign(Last_Date=page['Last_Date'].dt.date)
+        )
 
     st.markdown("---")
     st.markdown("### Employee Detail Drilldown")
     # Employee selection for drilldown
-    employee_list = ['All'] + sorted(employee_df['Name'].dropna().unique().tolist())
+    employee_index = load_employee_index(signature)
+    employee_list = ['All'] + sorted(employee_index.ids_by_name)
     selected_employee = st.selectbox("Select Employee (for detail view)", employee_list)
+    filters['employee'] = selected_employee
 
     if selected_employee and selected_employee != 'All':
-        emp_id = employee_df[employee_df['Name'] == selected_employee]['EmployeeID'].iloc[0]
-        emp_att = attendance_df[attendance_df['EmployeeID'] == emp_id].copy()
-        emp_att['Date'] = pd.to_datetime(emp_att['Date'])
-        
-        # Apply date filter to employee data
-        date_mask = (
-            (emp_att['Date'].dt.date >= date_range[0]) &
-            (emp_att['Date'].dt.date <= date_range[1])
-        )
-        emp_att = emp_att[date_mask]
+        emp_id = employee_index.employee_id(selected_employee)
+        # Employee's records within the date filter, sliced from the employee index
+        emp_att = employee_index.records(emp_id, date_range)
         
         if len(emp_att) == 0:
             st.warning("No data found for the selected date range!")
@@ -258,21 +427,19 @@ def main():
         **Present Rate:** {present_rate_emp}% | **Leave Rate:** {leave_rate_emp}%
         """)
 
-        # Prepare calendar-like heatmap (weeks x weekday)
-        emp_att['ISO_Year'] = emp_att['Date'].dt.isocalendar().year
-        emp_att['ISO_Week'] = emp_att['Date'].dt.isocalendar().week
-        emp_att['Week_Label'] = emp_att['ISO_Year'].astype(str) + "-W" + emp_att['ISO_Week'].astype(str)
-        emp_att['Weekday_Num'] = emp_att['Date'].dt.weekday  # 0=Monday
+        # Windows reach back before the date filter, so roll over all of the employee's records, then cut
+        all_records = employee_index.records(emp_id)
+        rates = rolling_rates(all_records).set_index(all_records['Date'])
+        rates = rates[(rates.index >= emp_att['Date'].min()) & (rates.index <= emp_att['Date'].max())]
+        show_chart(create_rolling_rate_chart(rates), 'rolling_rates')
 
-        # Map status to numeric values for heatmap
-        status_map = {'Present': 1.0, 'Wfh': 1.0, 'Leave': 0.5, 'Absent': 0.0}
-        emp_att['Status_Num'] = emp_att['Status'].map(status_map).fillna(0.0)
+        # Prepare calendar-like heatmap (weeks x weekday)
+        pivot = load_heatmap(signature, emp_id, date_range)
 
-        pivot = emp_att.pivot_table(index='Week_Label', columns='Weekday_Num', values='Status_Num', aggfunc='mean')
-        # Reindex weekdays to 0..6 and fill missing with NaN
-        pivot = pivot.reindex(columns=range(0, 7))
+        # Plot heatmap; matplotlib and seaborn are only imported once an employee's calendar is drawn
+        import matplotlib.pyplot as plt
+        import seaborn as sns
 
-        # Plot heatmap
         fig, ax = plt.subplots(figsize=(10, max(2, 0.4 * len(pivot))))
         sns.heatmap(pivot, ax=ax, cmap='YlGnBu', cbar_kws={'label': 'Attendance (1=Present,0=Absent)'} , vmin=0, vmax=1)
         ax.set_ylabel('Week')
@@ -280,7 +447,11 @@ def main():
         st.pyplot(fig)
 
         st.markdown("#### Recent Records")
-        st.dataframe(emp_att[['Date', 'Status', 'InTime', 'OutTime']].sort_values('Date', ascending=False), height=300)
+        paged_dataframe(
+            emp_att[['Date', 'Status', 'InTime', 'OutTime']], 'recent_records', sort_by='Date', ascending=False,
+            format_page=lambda page: page.assign(InTime=format_minutes(page['InTime']),
+                                                 OutTime=format_minutes(page['OutTime']))
+        )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+if __package__ in (None, ''):
+    # Running as `python scripts/attendance_trends.py`: make the `scripts` package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.data_store import load_cleaned_data
+from scripts.rolling import RATE_ALERT_PERCENT, ROLLING_WINDOWS, STREAK_ALERT_DAYS, attendance_trends, hr_alerts
+
+TRENDS_REPORT_FILE = 'Employee_Attendance_Trends_Report.xlsx'
+
+# Master columns carried into the report
+MASTER_COLUMNS = ['EmployeeID', 'Name', 'Department', 'Location']
+
+
+def calculate_attendance_trends(attendance_df, employee_df, windows=ROLLING_WINDOWS):
+    """Per-employee rolling rates and absence streaks (see rolling.attendance_trends), joined with the master."""
+    trends = attendance_trends(attendance_df, windows)
+    return employee_df[MASTER_COLUMNS].merge(trends, on='EmployeeID', how='right')
+
+
+def print_alerts(trends, alerts):
+    """Streak and rolling-rate overview plus the employees flagged for HR follow-up."""
+    print("\nRolling Attendance and Absence Streaks:")
+    print("---------------------------------------")
+    print(f"Employees: {len(trends)}")
+    for window in ROLLING_WINDOWS:
+        print(f"Average {window}-day Present + WFH rate: {trends[f'Rate_{window}d'].mean():.2f}%")
+    print(f"Longest absence streak: {trends['Longest_Absence_Streak'].max()} days")
+
+    print(f"\nHR Alerts (absent {STREAK_ALERT_DAYS}+ days running, "
+          f"or {ROLLING_WINDOWS[0]}-day rate below {RATE_ALERT_PERCENT:.0f}%): {len(alerts)}")
+    print("-----------------------------------------------------------")
+    print(alerts[['EmployeeID', 'Name', 'Department', 'Last_Date', 'Reason']].head(20).to_string(index=False))
+
+
+def write_trends_report(trends, output_file=TRENDS_REPORT_FILE):
+    """Print the alerts and save the trends and alerts as two sheets of `output_file`."""
+    alerts = hr_alerts(trends)
+    print_alerts(trends, alerts)
+
+    with pd.ExcelWriter(output_file) as writer:
+        trends.to_excel(writer, sheet_name='Trends', index=False)
+        alerts.to_excel(writer, sheet_name='Alerts', index=False)
+    print(f"\nRolling rates and streaks have been saved to '{output_file}'")
+    return alerts
+
+
+def main(output_file=TRENDS_REPORT_FILE):
+    # Read the cleaned data (columnar store, or the cleaned CSV/XLSX)
+    attendance_df, employee_df = load_cleaned_data(master_columns=MASTER_COLUMNS)
+
+    trends = calculate_attendance_trends(attendance_df, employee_df)
+    write_trends_report(trends, output_file)
+    return trends
+
+
+if __name__ == '__main__':
+    main()
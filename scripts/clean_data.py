@@ -1,8 +1,25 @@
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
 import pandas as pd
 import numpy as np
 from datetime import datetime
 from pathlib import Path
 
+if __package__ in (None, ''):
+    # Running as `python scripts/clean_data.py`: make the `scripts` package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.data_store import (AttendanceStoreWriter, append_to_attendance_store, read_workbook, store_path,
+                                write_master_store)
+from scripts.schema import load_category_aliases
+
 
 def standardize_date(date_str):
     """Convert various date formats to YYYY-MM-DD"""
@@ -17,6 +34,40 @@ def standardize_date(date_str):
     except:
         return pd.NaT
 
+
+# Shape of each date layout accepted by standardize_date, paired with its format.
+# The shapes are mutually exclusive so every value lands in at most one bucket.
+DATE_FORMATS = [
+    (r'\d{1,2}/\d{1,2}/\d{2}', '%d/%m/%y'),
+    (r'\d{1,2}-\d{1,2}-\d{4}', '%d-%m-%Y'),
+    (r'\d{4}/\d{1,2}/\d{1,2}', '%Y/%m/%d'),
+    (r'\d{1,2}\.\d{1,2}\.\d{4}', '%d.%m.%Y'),
+]
+
+
+def normalize_dates(values):
+    """Vectorized standardize_date: parse a column of mixed date formats to datetime64.
+
+    Values are bucketed by shape and each bucket is parsed with a single
+    to_datetime call. Anything left over goes through the same free-form
+    parser standardize_date falls back to; unparseable input becomes NaT.
+    """
+    values = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.normalize()
+
+    text = values.astype('string')
+    result = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+    for pattern, fmt in DATE_FORMATS:
+        mask = text.str.fullmatch(pattern).fillna(False).to_numpy(dtype=bool)
+        if mask.any():
+            result[mask] = pd.to_datetime(text[mask], format=fmt, errors='coerce')
+
+    rest = (text.notna() & result.isna()).to_numpy(dtype=bool)
+    if rest.any():
+        result[rest] = pd.to_datetime(text[rest], format='mixed', errors='coerce')
+    return result.dt.normalize()
+
 def standardize_time(time_str):
     """Convert various time formats to 24-hour HH:MM format"""
     if pd.isna(time_str):
@@ -42,49 +93,84 @@ def standardize_time(time_str):
     except:
         return np.nan
 
+
+# H.MM / HH:MM / HH-MM with an optional AM/PM suffix
+TIME_PATTERN = r'^\s*(?P<hour>\d{1,2})[.:-](?P<minute>\d{2})\s*(?P<meridiem>[AaPp][Mm])?\s*$'
+
+
+def normalize_times(values):
+    """Vectorized standardize_time: parse a time column to minutes since midnight.
+
+    Returns a nullable Int16 Series; blanks and unparseable values are <NA>.
+    """
+    text = pd.Series(values).astype('string')
+    parts = text.str.extract(TIME_PATTERN)
+    hour = parts['hour'].astype('Int16')
+    minute = parts['minute'].astype('Int16')
+    meridiem = parts['meridiem'].str.upper().fillna('')
+
+    is_12h = (meridiem != '').to_numpy(dtype=bool)
+    is_pm = (meridiem == 'PM').to_numpy(dtype=bool)
+    valid = (minute < 60) & (hour < 24) & (~is_12h | hour.between(1, 12))
+    hour = hour.mask(is_12h & (hour == 12).fillna(False).to_numpy(dtype=bool), 0)
+    hour = hour.mask(is_pm, hour + 12)
+    minutes = (hour * 60 + minute).where(valid.fillna(False))
+    minutes.index = text.index
+    return minutes.astype('Int16')
+
+
+def format_minutes(minutes):
+    """Format minutes since midnight as HH:MM strings (NaN where missing)."""
+    minutes = pd.Series(minutes).astype('Int16')
+    hours = (minutes // 60).astype('string').str.zfill(2)
+    mins = (minutes % 60).astype('string').str.zfill(2)
+    return (hours + ':' + mins).astype(object).where(minutes.notna(), np.nan)
+
+
+_CASE_FOLDS = {'upper': str.upper, 'title': str.title, 'lower': str.lower}
+
+
+def _clean_category_value(value, rules):
+    value = _CASE_FOLDS[rules['case']](str(value).strip())
+    return rules['aliases'].get(value, value)
+
+
+def normalize_categories(values, field, aliases=None):
+    """Vectorized clean_department/clean_location for any field in the alias table.
+
+    Each distinct raw value is cleaned once (factorize, map the uniques, take
+    back by code). Returns a categorical Series whose categories are the
+    field's canonical vocabulary followed by any unrecognised spellings, so
+    nothing is silently dropped; missing values stay missing.
+    """
+    values = pd.Series(values)
+    rules = (aliases or load_category_aliases())[field]
+    codes, uniques = pd.factorize(values)
+    cleaned = [_clean_category_value(value, rules) for value in uniques]
+
+    vocabulary = list(rules['categories'])
+    vocabulary += sorted(set(cleaned) - set(vocabulary))
+    positions = {category: i for i, category in enumerate(vocabulary)}
+    unique_codes = np.array([positions[value] for value in cleaned] + [-1], dtype=np.int32)
+
+    # codes of -1 (missing) pick the trailing -1 sentinel
+    categorical = pd.Categorical.from_codes(unique_codes[codes], categories=vocabulary)
+    return pd.Series(categorical, index=values.index, name=values.name)
+
+
 def clean_department(dept):
     """Standardize department names"""
     if pd.isna(dept):
         return np.nan
-    # Convert to uppercase and strip whitespace
-    dept = dept.strip().upper()
-    # Standard department mapping
-    dept_mapping = {
-        'HR': 'HR',
-        'H R': 'HR',
-        'IT': 'IT',
-        'I.T': 'IT',
-        'OPS': 'OPERATIONS',
-        'OPERATION': 'OPERATIONS',
-        'FIN': 'FINANCE',
-        'SALES': 'SALES',
-        'SALE': 'SALES',
-        'S A L E S': 'SALES'
-    }
-    return dept_mapping.get(dept, dept)
+    return _clean_category_value(dept, load_category_aliases()['Department'])
 
 def clean_location(location):
     """Standardize location names"""
     if pd.isna(location):
         return np.nan
-    # Convert to title case and strip whitespace
-    location = location.strip().title()
-    # Standard location mapping
-    location_mapping = {
-        'Pune': 'Pune',
-        'Pun': 'Pune',
-        'Mumbai': 'Mumbai',
-        'Bom': 'Mumbai',
-        'Bengaluru': 'Bengaluru',
-        'Bangalore': 'Bengaluru',
-        'Blr': 'Bengaluru',
-        'Hyderabad': 'Hyderabad',
-        'Hyderabaad': 'Hyderabad',
-        'Hyd': 'Hyderabad',
-        'Delhi': 'Delhi',
-        'Ncr-Delhi': 'Delhi'
-    }
-    return location_mapping.get(location, location)
+    return _clean_category_value(location, load_category_aliases()['Location'])
+
+
 def _get_paths():
     """Return project root and data paths (works when module is imported from anywhere)."""
     base_dir = Path(__file__).resolve().parent.parent
@@ -92,33 +178,306 @@ def _get_paths():
     return base_dir, data_dir
 
 
-def clean_and_save(attendance_path: str | Path, master_path: str | Path, out_attendance: str | Path, out_master: str | Path):
-    """Run cleaning pipeline using provided paths and save outputs."""
-    attendance_df = pd.read_csv(attendance_path)
-    employee_master_df = pd.read_excel(master_path)
+def _attendance_for_csv(attendance_df):
+    """Render InTime/OutTime minutes back to HH:MM for the CSV output."""
+    return attendance_df.assign(
+        InTime=format_minutes(attendance_df['InTime']),
+        OutTime=format_minutes(attendance_df['OutTime']),
+    )
+
+
+# Upper bound on the bytes of attendance CSV handed to one worker at a time
+PARTITION_BYTES = 64 * 1024 * 1024
+
+
+def _read_attendance(source, **kwargs):
+    """Read attendance CSV text verbatim; cleaning decides how each column is parsed."""
+    return pd.read_csv(source, dtype=str, **kwargs)
+
+
+def clean_attendance(attendance_df):
+    """Clean an attendance frame (or chunk of one) in place and return it."""
+    attendance_df['Date'] = normalize_dates(attendance_df['Date'])
+    attendance_df['InTime'] = normalize_times(attendance_df['InTime'])
+    attendance_df['OutTime'] = normalize_times(attendance_df['OutTime'])
+    attendance_df['Status'] = attendance_df['Status'].str.title()
+    return attendance_df
+
+
+def clean_master(employee_master_df, aliases=None):
+    """Clean an employee master frame in place and return it."""
+    aliases = aliases or load_category_aliases()
+    employee_master_df['DateOfJoining'] = normalize_dates(employee_master_df['DateOfJoining'])
+    employee_master_df['Department'] = normalize_categories(employee_master_df['Department'], 'Department', aliases)
+    employee_master_df['Location'] = normalize_categories(employee_master_df['Location'], 'Location', aliases)
+    employee_master_df['Status'] = employee_master_df['Status'].str.title()
+    return employee_master_df
+
 
+def iter_clean_attendance(attendance_path: str | Path, chunk_size: int):
+    """Yield cleaned attendance chunks of at most `chunk_size` rows."""
+    with _read_attendance(attendance_path, chunksize=chunk_size) as reader:
+        for chunk in reader:
+            yield clean_attendance(chunk)
+
+
+def stream_clean_attendance(attendance_path: str | Path, out_attendance: str | Path, chunk_size: int):
+    """Clean the attendance CSV chunk by chunk, appending to the output and its store; return rows written."""
+    rows = 0
+    # The store is closed after the CSV so it never looks older than the CSV it mirrors
+    with AttendanceStoreWriter(store_path(out_attendance)) as store, open(out_attendance, 'w', newline='') as out:
+        for chunk in iter_clean_attendance(attendance_path, chunk_size):
+            _attendance_for_csv(chunk).to_csv(out, index=False, header=rows == 0)
+            store.write(chunk)
+            rows += len(chunk)
+    if rows == 0:
+        # Keep the header even when the input has no data rows
+        _read_attendance(attendance_path, nrows=0).to_csv(out_attendance, index=False)
+    return rows
+
+
+def _byte_partitions(attendance_path: str | Path, parts: int):
+    """Split the CSV body into `parts` byte ranges that start and end on line boundaries."""
+    size = os.path.getsize(attendance_path)
+    with open(attendance_path, 'rb') as f:
+        f.readline()  # header
+        body_start = f.tell()
+        bounds = [body_start]
+        step = max(1, (size - body_start) // parts)
+        for i in range(1, parts):
+            target = max(body_start + i * step, bounds[-1])
+            if target >= size:
+                break
+            f.seek(target)
+            f.readline()
+            if f.tell() > bounds[-1]:
+                bounds.append(f.tell())
+    if bounds[-1] < size:
+        bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _clean_partition(attendance_path, start, end, columns):
+    """Clean one byte range of the attendance CSV; return it as CSV text and as a frame."""
+    with open(attendance_path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    chunk = clean_attendance(_read_attendance(io.BytesIO(data), header=None, names=columns))
+    return _attendance_for_csv(chunk).to_csv(index=False, header=False), chunk
+
+
+def parallel_clean_attendance(attendance_path: str | Path, out_attendance: str | Path, workers: int):
+    """Clean byte-range partitions of the attendance CSV in a process pool.
+
+    Partitions are written back in file order, so the output is identical
+    to the serial pipeline. Returns rows written.
+    """
+    columns = list(_read_attendance(attendance_path, nrows=0).columns)
+    size = os.path.getsize(attendance_path)
+    parts = max(workers * 4, -(-size // PARTITION_BYTES))
+    partitions = _byte_partitions(attendance_path, parts)
+
+    rows = 0
+    # The store is closed after the CSV so it never looks older than the CSV it mirrors
+    with AttendanceStoreWriter(store_path(out_attendance)) as store, open(out_attendance, 'w', newline='') as out:
+        out.write(pd.DataFrame(columns=columns).to_csv(index=False))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            starts, ends = zip(*partitions) if partitions else ((), ())
+            results = executor.map(_clean_partition, repeat(attendance_path), starts, ends, repeat(columns))
+            for text, chunk in results:
+                out.write(text)
+                store.write(chunk)
+                rows += len(chunk)
+    return rows
+
+
+def _clean_attendance_file(attendance_path: str | Path, out_attendance: str | Path,
+                           chunk_size: int | None = None, workers: int = 1):
+    """Clean the whole attendance file in the requested mode; return (frame or None, rows)."""
+    if workers > 1:
+        return None, parallel_clean_attendance(attendance_path, out_attendance, workers)
+    if chunk_size:
+        return None, stream_clean_attendance(attendance_path, out_attendance, chunk_size)
+
+    attendance_clean = clean_attendance(_read_attendance(attendance_path))
+    _attendance_for_csv(attendance_clean).to_csv(out_attendance, index=False)
+    with AttendanceStoreWriter(store_path(out_attendance)) as store:
+        store.write(attendance_clean)
+    return attendance_clean, len(attendance_clean)
+
+
+def watermark_path(out_attendance: str | Path):
+    """Return the file recording how much of the source the cleaned output covers."""
+    return Path(out_attendance).with_suffix('.watermark.json')
+
+
+def _hash_prefix(path: str | Path, length: int):
+    """Return a sha256 fed with the first `length` bytes and the last byte of that prefix.
+
+    The digest object is returned rather than its hex value, so a caller
+    can go on feeding it the bytes that follow without re-reading these.
+    """
+    digest = hashlib.sha256()
+    last = b''
+    with open(path, 'rb') as f:
+        remaining = length
+        while remaining > 0:
+            block = f.read(min(remaining, 1024 * 1024))
+            if not block:
+                break
+            digest.update(block)
+            last = block[-1:]
+            remaining -= len(block)
+    return digest, last
+
+
+def _complete_length(path: str | Path):
+    """Return the length of the file up to and including its last newline."""
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        pos = size
+        while pos > 0:
+            start = max(0, pos - 64 * 1024)
+            f.seek(start)
+            block = f.read(pos - start)
+            idx = block.rfind(b'\n')
+            if idx != -1:
+                return start + idx + 1
+            pos = start
+    return 0
+
+
+def _write_watermark(attendance_path: str | Path, out_attendance: str | Path, offset: int, rows: int,
+                     prefix_sha256: str | None = None):
+    if prefix_sha256 is None:
+        prefix_sha256 = _hash_prefix(attendance_path, offset)[0].hexdigest()
+    watermark = {
+        'source': str(Path(attendance_path).resolve()),
+        'offset': offset,
+        'rows': rows,
+        'prefix_sha256': prefix_sha256,
+        'output_bytes': os.path.getsize(out_attendance),
+    }
+    watermark_path(out_attendance).write_text(json.dumps(watermark, indent=2))
+
+
+def _read_watermark(attendance_path: str | Path, out_attendance: str | Path):
+    """Return the watermark and the prefix digest if the cleaned output can be extended, else None.
+
+    The whole cleaned prefix of the source is hashed, so an edit anywhere in
+    it forces a rebuild. The digest comes back still open, for the caller to
+    extend with the appended bytes instead of hashing the prefix again.
+    """
+    path = watermark_path(out_attendance)
+    if not (path.exists() and Path(out_attendance).exists() and store_path(out_attendance).is_dir()):
+        return None
+    try:
+        watermark = json.loads(path.read_text())
+    except ValueError:
+        return None
+
+    if watermark.get('source') != str(Path(attendance_path).resolve()):
+        return None
+    # Output touched since the last run (or a run died before updating the watermark)
+    if os.path.getsize(out_attendance) != watermark['output_bytes']:
+        return None
+    offset = watermark['offset']
+    size = os.path.getsize(attendance_path)
+    if size < offset:
+        return None
+    digest, last = _hash_prefix(attendance_path, offset)
+    if digest.hexdigest() != watermark['prefix_sha256']:
+        return None
+    # New bytes would continue a line that was already cleaned
+    if size > offset and last != b'\n':
+        return None
+    return watermark, digest
+
+
+def incremental_clean_attendance(attendance_path: str | Path, out_attendance: str | Path,
+                                 chunk_size: int | None = None, workers: int = 1):
+    """Clean only the rows appended to the attendance file since the last run.
+
+    A watermark (byte offset, row count and prefix hash of the source) is kept
+    next to the output. When the already-cleaned prefix no longer matches, the
+    output is rebuilt from scratch using `chunk_size`/`workers`. Otherwise the
+    prefix is read once to check its hash and only the new bytes are parsed,
+    cleaned and written. A trailing line without a newline is left for the
+    next run. Returns rows cleaned this run.
+    """
+    checked = _read_watermark(attendance_path, out_attendance)
+    if checked is None:
+        _, rows = _clean_attendance_file(attendance_path, out_attendance, chunk_size, workers)
+        _write_watermark(attendance_path, out_attendance, os.path.getsize(attendance_path), rows)
+        return rows
+
+    watermark, digest = checked
+    offset = watermark['offset']
+    end = _complete_length(attendance_path)
+    if end <= offset:
+        return 0
+
+    columns = list(_read_attendance(attendance_path, nrows=0).columns)
+    with open(attendance_path, 'rb') as f:
+        f.seek(offset)
+        data = f.read(end - offset)
+    new_rows = clean_attendance(_read_attendance(io.BytesIO(data), header=None, names=columns))
+    _attendance_for_csv(new_rows).to_csv(out_attendance, mode='a', index=False, header=False)
+    append_to_attendance_store(new_rows, store_path(out_attendance))
+    # Extend the checked prefix digest with the bytes just cleaned rather than hashing from byte 0 again
+    digest.update(data)
+    _write_watermark(attendance_path, out_attendance, end, watermark['rows'] + len(new_rows), digest.hexdigest())
+    return len(new_rows)
+
+
+def clean_and_save(attendance_path: str | Path, master_path: str | Path, out_attendance: str | Path, out_master: str | Path,
+                   chunk_size: int | None = None, workers: int = 1, incremental: bool = False,
+                   aliases_path: str | Path | None = None):
+    """Run cleaning pipeline using provided paths and save outputs.
+
+    Alongside the CSV/XLSX outputs a typed Parquet store is written next to
+    each of them (see scripts.data_store) for the loaders to read.
+
+    With `chunk_size` the attendance file is streamed in chunks of that many
+    rows so memory stays bounded; with `workers` > 1 it is split into byte
+    ranges cleaned in a process pool; with `incremental` only rows appended
+    since the previous run are cleaned (see incremental_clean_attendance).
+    In these modes the attendance frame is not kept and None is returned in
+    its place.
+
+    Department and Location spellings are standardized with the alias table
+    at `aliases_path` (data/category_aliases.json by default).
+    """
     # Clean attendance data
-    attendance_clean = attendance_df.copy()
-    attendance_clean['Date'] = attendance_clean['Date'].apply(standardize_date)
-    attendance_clean['InTime'] = attendance_clean['InTime'].apply(standardize_time)
-    attendance_clean['OutTime'] = attendance_clean['OutTime'].apply(standardize_time)
-    attendance_clean['Status'] = attendance_clean['Status'].str.title()
+    if incremental:
+        incremental_clean_attendance(attendance_path, out_attendance, chunk_size, workers)
+        attendance_clean = None
+    else:
+        attendance_clean, _ = _clean_attendance_file(attendance_path, out_attendance, chunk_size, workers)
+        # A full run without the watermark leaves nothing to extend from
+        watermark_path(out_attendance).unlink(missing_ok=True)
 
     # Clean employee master data
-    master_clean = employee_master_df.copy()
-    master_clean['DateOfJoining'] = master_clean['DateOfJoining'].apply(standardize_date)
-    master_clean['Department'] = master_clean['Department'].apply(clean_department)
-    master_clean['Location'] = master_clean['Location'].apply(clean_location)
-    master_clean['Status'] = master_clean['Status'].str.title()
-
-    # Save cleaned data
-    attendance_clean.to_csv(out_attendance, index=False)
-    master_clean.to_excel(out_master, index=False)
+    master_clean = clean_master(read_workbook(master_path), load_category_aliases(aliases_path))
+    with pd.ExcelWriter(out_master, datetime_format='YYYY-MM-DD', date_format='YYYY-MM-DD') as writer:
+        master_clean.to_excel(writer, index=False)
+    write_master_store(master_clean, store_path(out_master))
 
     return attendance_clean, master_clean
 
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Clean the raw attendance and employee master data.')
+    parser.add_argument('--chunk-size', type=int, default=None,
+                        help='stream the attendance file in chunks of this many rows')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='clean the attendance file in parallel with this many processes')
+    parser.add_argument('--incremental', action='store_true',
+                        help='only clean attendance rows appended since the last run')
+    parser.add_argument('--aliases', default=None,
+                        help='JSON alias table for Department/Location spellings (default: data/category_aliases.json)')
+    args = parser.parse_args(argv)
+
     base_dir, data_dir = _get_paths()
     attendance_in = data_dir / 'Employee_Attendance.csv'
     master_in = data_dir / 'Employees_Master.xlsx'
@@ -126,15 +485,20 @@ def main():
     master_out = base_dir / 'Employees_Master_Clean.xlsx'
 
     print("Cleaning attendance data...")
-    attendance_clean, master_clean = clean_and_save(attendance_in, master_in, attendance_out, master_out)
+    attendance_clean, master_clean = clean_and_save(attendance_in, master_in, attendance_out, master_out,
+                                                    chunk_size=args.chunk_size, workers=args.workers,
+                                                    incremental=args.incremental, aliases_path=args.aliases)
 
     # Display summary of changes
     print("\nCleaned Data Summary:")
     print("\nEmployee Attendance Dataset:")
     print("------------------------")
-    print(attendance_clean.head())
-    print("\nNull values in Attendance:")
-    print(attendance_clean.isnull().sum())
+    if attendance_clean is None:
+        print(pd.read_csv(attendance_out, nrows=5))
+    else:
+        print(_attendance_for_csv(attendance_clean.head()))
+        print("\nNull values in Attendance:")
+        print(attendance_clean.isnull().sum())
 
     print("\nEmployee Master Dataset:")
     print("----------------------")
@@ -146,8 +510,9 @@ def main():
     print("\nUnique Departments:", sorted(master_clean['Department'].unique()))
     print("Unique Locations:", sorted(master_clean['Location'].dropna().unique()))
     print("Unique Status Values (Master):", sorted(master_clean['Status'].unique()))
-    print("Unique Status Values (Attendance):", sorted(attendance_clean['Status'].unique()))
+    if attendance_clean is not None:
+        print("Unique Status Values (Attendance):", sorted(attendance_clean['Status'].unique()))
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+from scripts.aggregations import group_codes
+
+# Dimensions of the dashboard count cube; every chart and KPI is a sum over its cells
+CUBE_KEYS = ['Date', 'Department', 'Location', 'Status']
+WEEKDAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+
+# Trend chart resolutions, finest first, with their pandas period frequency
+TREND_RESOLUTIONS = {'Day': 'D', 'Week': 'W', 'Month': 'M'}
+# Most points per status line before 'Auto' switches to a coarser resolution
+TREND_MAX_POINTS = 400
+
+
+def build_cube(merged_df):
+    """Count attendance rows per (Date, Department, Location, Status) cell.
+
+    Only observed combinations get a cell. Missing key values keep cells of
+    their own, so the KPIs still count every row and the 'Unknown' location
+    filter can select them.
+    """
+    codes, cube = group_codes(merged_df, CUBE_KEYS, dropna=False)
+    cube['Count'] = np.bincount(codes, minlength=len(cube))
+    cube['Weekday'] = cube['Date'].dt.day_name()
+    return cube
+
+
+def date_mask(dates, date_range):
+    """Rows whose date falls on or between the two calendar days of `date_range`.
+
+    Compares the timestamps directly rather than deriving a date per row.
+    """
+    start = pd.Timestamp(date_range[0])
+    end = pd.Timestamp(date_range[1]) + pd.Timedelta(days=1)
+    return (dates >= start) & (dates < end)
+
+
+def filter_mask(df, date_range, departments, locations):
+    """Rows (or cube cells) inside the sidebar filters; 'Unknown' in `locations` also keeps missing locations."""
+    mask = date_mask(df['Date'], date_range) & df['Department'].isin(departments)
+    loc_mask = df['Location'].isin(locations)
+    if 'Unknown' in locations:
+        loc_mask |= df['Location'].isna()
+    return mask & loc_mask
+
+
+def slice_cube(cube, date_range, departments, locations):
+    """Cells inside the sidebar filters."""
+    return cube[filter_mask(cube, date_range, departments, locations)]
+
+
+def status_rates(cube):
+    """Present + WFH (rounded to 2 places), Leave and Absent as percentages of all rows in the cube."""
+    totals = cube.groupby('Status', observed=False)['Count'].sum()
+    rows = cube['Count'].sum()
+    present_rate = round((totals['Present'] + totals['Wfh']) / rows * 100, 2)
+    return present_rate, totals['Leave'] / rows * 100, totals['Absent'] / rows * 100
+
+
+def status_shares(cube, by):
+    """Share of each status within each value of `by`, one column per status.
+
+    Matches groupby(by)['Status'].value_counts(normalize=True).unstack() on
+    the rows the cube was built from. `by` is a cube column or a Series
+    aligned with the cube.
+    """
+    cells = cube[cube['Status'].notna()]
+    if isinstance(by, pd.Series):
+        by = by[cells.index]
+    counts = cells.groupby([by, 'Status'], observed=False)['Count'].sum().unstack()
+    keys = by.dropna().unique() if isinstance(by, pd.Series) else cells[by].dropna().unique()
+    counts = counts.loc[counts.index.isin(keys)]
+    return counts.div(counts.sum(axis=1), axis=0)
+
+
+def daily_status_counts(cube):
+    """Rows per date and status, like groupby(['Date', 'Status'], observed=True).size().unstack(fill_value=0)."""
+    return cube.groupby(['Date', 'Status'], observed=True)['Count'].sum().unstack(fill_value=0)
+
+
+def trend_counts(cube, resolution='Auto', max_points=TREND_MAX_POINTS):
+    """Status counts per date for the trend chart, averaged into weeks or months when needed.
+
+    'Auto' picks the finest of TREND_RESOLUTIONS giving at most `max_points`
+    points per status, so the figure size stays bounded for any date range.
+    Weekly and monthly values are the mean daily count over the days with
+    records, keyed by the first day of the period. Returns the counts and
+    the resolution used.
+    """
+    daily = daily_status_counts(cube)
+    if resolution == 'Auto':
+        resolution = next((name for name, freq in TREND_RESOLUTIONS.items()
+                           if daily.index.to_period(freq).nunique() <= max_points), 'Month')
+    if resolution == 'Day':
+        return daily, resolution
+    periods = daily.index.to_period(TREND_RESOLUTIONS[resolution]).start_time
+    return daily.groupby(periods).mean().rename_axis('Date'), resolution
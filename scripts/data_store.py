@@ -0,0 +1,323 @@
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pathlib import Path
+
+try:
+    import python_calamine
+except ImportError:  # optional; pandas reads workbooks with openpyxl instead
+    python_calamine = None
+
+from scripts.schema import apply_attendance_schema, apply_master_schema, apply_schema
+
+ATTENDANCE_CSV = 'Employee_Attendance_Clean.csv'
+MASTER_XLSX = 'Employees_Master_Clean.xlsx'
+
+# Master columns the dashboard shows next to each attendance row
+DASHBOARD_MASTER_COLUMNS = ['Department', 'Location', 'Name']
+# Parquet metadata key holding the size, mtime and SHA-256 of the workbook a sidecar was read from
+SIDECAR_SOURCE_KEY = b'workbook_source'
+
+WEEKDAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def store_path(path: str | Path):
+    """Return the Parquet store that sits next to a cleaned CSV/XLSX output.
+
+    The master store is a single file; the attendance store is a directory
+    of part files (see AttendanceStoreWriter). pandas reads either.
+    """
+    return Path(path).with_suffix('.parquet')
+
+
+def to_columnar_attendance(attendance_df):
+    """Give a cleaned attendance frame the dtypes used by the columnar store."""
+    return apply_attendance_schema(attendance_df)
+
+
+def to_columnar_master(master_df):
+    """Give a cleaned employee master frame the dtypes used by the columnar store."""
+    return apply_master_schema(master_df)
+
+
+def _to_table(df):
+    """Convert to Arrow with int32 dictionary indices so chunks of any vocabulary size share one schema."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    fields = [pa.field(f.name, pa.dictionary(pa.int32(), f.type.value_type), f.nullable)
+              if pa.types.is_dictionary(f.type) else f for f in table.schema]
+    return table.cast(pa.schema(fields, metadata=table.schema.metadata))
+
+
+def _remove_store(path: Path):
+    if path.is_dir():
+        shutil.rmtree(path)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def _store_parts(path: Path):
+    """Part files of an attendance store directory, in the order they were written."""
+    return sorted(path.glob('part-*.parquet'))
+
+
+class _PartWriter:
+    """Write one part file of an attendance store, published under its final name only on close.
+
+    The part is written under a dot-prefixed name, which dataset readers
+    skip, and renamed into place when complete; the rename also bumps the
+    store directory's mtime, which the loaders compare against the CSV.
+    """
+
+    def __init__(self, store: Path, schema=None):
+        self.store = store
+        self.path = store / f'part-{len(_store_parts(store)):05d}.parquet'
+        self._tmp = store / f'.{self.path.name}.tmp'
+        self._schema = schema
+        self._writer = None
+
+    def write(self, chunk):
+        table = _to_table(to_columnar_attendance(chunk))
+        if self._writer is None:
+            self._schema = self._schema or table.schema
+            self._writer = pq.ParquetWriter(self._tmp, self._schema)
+        self._writer.write_table(table.cast(self._schema))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            os.replace(self._tmp, self.path)
+
+    def discard(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._tmp.unlink(missing_ok=True)
+
+
+class AttendanceStoreWriter:
+    """Write cleaned attendance chunks to a new Parquet store.
+
+    The store is a directory of part files read as one dataset, so later
+    incremental runs add a part instead of rewriting it (see
+    append_to_attendance_store). Any existing store at `path` is removed up
+    front so a failed or empty run never leaves a stale store for the loader
+    to pick up.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        _remove_store(self.path)
+        self._part = None
+
+    def write(self, chunk):
+        if self._part is None:
+            self.path.mkdir(parents=True)
+            self._part = _PartWriter(self.path)
+        self._part.write(chunk)
+
+    def close(self):
+        if self._part is not None:
+            self._part.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            if self._part is not None:
+                self._part.discard()
+            _remove_store(self.path)
+        else:
+            self.close()
+
+
+def append_to_attendance_store(chunk, path: str | Path):
+    """Append cleaned attendance rows to an existing store as a new part file.
+
+    Only the new rows are written; the parts already stored are neither read
+    nor rewritten, so each run costs I/O in proportion to what it appends.
+    The new part takes the schema of the first one, so the dataset reads as
+    a single table.
+    """
+    path = Path(path)
+    part = _PartWriter(path, schema=pq.read_schema(_store_parts(path)[0]))
+    try:
+        part.write(chunk)
+    except BaseException:
+        part.discard()
+        raise
+    part.close()
+
+
+def write_master_store(master_df, path: str | Path):
+    """Write the cleaned employee master to its Parquet store."""
+    to_columnar_master(master_df).to_parquet(path, index=False)
+
+
+def _is_fresh(store: Path, source: Path):
+    """A store is usable when it exists and is not older than the file it mirrors."""
+    if not store.exists():
+        return False
+    return not source.exists() or store.stat().st_mtime >= source.stat().st_mtime
+
+
+def load_attendance(path: str | Path):
+    """Load cleaned attendance, preferring the Parquet store over the CSV."""
+    path = Path(path)
+    store = store_path(path)
+    if _is_fresh(store, path):
+        return pd.read_parquet(store)
+
+    from scripts.clean_data import normalize_times
+
+    attendance_df = pd.read_csv(path)
+    attendance_df['Date'] = pd.to_datetime(attendance_df['Date'])
+    attendance_df['InTime'] = normalize_times(attendance_df['InTime'])
+    attendance_df['OutTime'] = normalize_times(attendance_df['OutTime'])
+    return to_columnar_attendance(attendance_df)
+
+
+def sidecar_path(path: str | Path):
+    """Return the Parquet copy read_workbook keeps next to a workbook, e.g. Employees_Master.xlsx.parquet."""
+    path = Path(path)
+    return path.with_name(path.name + '.parquet')
+
+
+def _file_digest(path: Path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _sidecar_matches(sidecar: Path, path: Path):
+    """Whether `sidecar` was converted from the current contents of `path`.
+
+    Size and mtime decide in the common case; when only the mtime moved
+    (the workbook was touched or copied), the SHA-256 recorded in the
+    sidecar is compared and, if it matches, the sidecar is re-stamped.
+    """
+    if not sidecar.exists():
+        return False
+    metadata = pq.read_schema(sidecar).metadata or {}
+    source = json.loads(metadata.get(SIDECAR_SOURCE_KEY, b'{}'))
+    stat = path.stat()
+    if source.get('size') != stat.st_size:
+        return False
+    if source.get('mtime_ns') == stat.st_mtime_ns:
+        return True
+    if source.get('sha256') != _file_digest(path):
+        return False
+    _write_sidecar(pq.read_table(sidecar), sidecar, path, source['sha256'])
+    return True
+
+
+def _write_sidecar(table, sidecar: Path, path: Path, digest: str):
+    stat = path.stat()
+    source = json.dumps({'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest}).encode()
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), SIDECAR_SOURCE_KEY: source})
+    tmp = sidecar.with_suffix('.parquet.tmp')
+    pq.write_table(table, tmp)
+    os.replace(tmp, sidecar)
+
+
+def read_workbook(path: str | Path, columns=None):
+    """Read the first sheet of an Excel workbook through a Parquet sidecar.
+
+    The first read parses the whole sheet (with calamine when
+    python-calamine is installed, openpyxl otherwise) and saves it to
+    sidecar_path(path), keyed by the workbook's size, mtime and SHA-256.
+    Later reads load only `columns` (all by default) from the sidecar
+    until the workbook changes. Sheets that Arrow cannot store, such as
+    columns mixing dates and text, are read from the workbook every time.
+    """
+    path = Path(path)
+    sidecar = sidecar_path(path)
+    if _sidecar_matches(sidecar, path):
+        # Arrow returns None for empty text cells where read_excel gives NaN
+        return pd.read_parquet(sidecar, columns=columns).fillna(np.nan)
+
+    df = pd.read_excel(path, engine='calamine' if python_calamine is not None else None)
+    try:
+        _write_sidecar(pa.Table.from_pandas(df, preserve_index=False), sidecar, path, _file_digest(path))
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OSError):
+        pass
+    return df if columns is None else df[columns]
+
+
+def load_master(path: str | Path, columns=None):
+    """Load the cleaned employee master, preferring the Parquet store over the XLSX.
+
+    `columns` limits the columns read; EmployeeID is always included.
+    """
+    path = Path(path)
+    if columns is not None:
+        columns = ['EmployeeID'] + [c for c in columns if c != 'EmployeeID']
+    store = store_path(path)
+    if _is_fresh(store, path):
+        return pd.read_parquet(store, columns=columns)
+    return to_columnar_master(read_workbook(path, columns))
+
+
+def _base_dir(base_dir: str | Path | None):
+    return Path(base_dir) if base_dir is not None else Path(__file__).resolve().parent.parent
+
+
+def load_cleaned_data(base_dir: str | Path | None = None, master_columns=None):
+    """Load the cleaned attendance and employee master used by the analysis, dashboard and plots.
+
+    Both frames come back in the canonical dtypes of scripts.schema, sharing
+    one EmployeeID vocabulary. `master_columns` limits the master to the
+    columns a caller uses (see load_master).
+    """
+    base_dir = _base_dir(base_dir)
+    return apply_schema(load_attendance(base_dir / ATTENDANCE_CSV),
+                        load_master(base_dir / MASTER_XLSX, master_columns))
+
+
+def data_signature(base_dir: str | Path | None = None):
+    """Name, mtime and size of every file load_cleaned_data may read.
+
+    Cheap to compute on each rerun and changes whenever cleaning rewrites
+    the data, so it can key caches of anything derived from it.
+    """
+    base_dir = _base_dir(base_dir)
+    paths = [base_dir / ATTENDANCE_CSV, store_path(base_dir / ATTENDANCE_CSV),
+             base_dir / MASTER_XLSX, store_path(base_dir / MASTER_XLSX)]
+    return tuple((p.name, p.stat().st_mtime_ns, p.stat().st_size) for p in paths if p.exists())
+
+
+def prepare_dataset(attendance_df, employee_df):
+    """Join each attendance row with its master columns and add calendar columns.
+
+    Rows without a master record are dropped; the rest are ordered by Date
+    (stable, so ties keep file order) and keep their attendance index.
+    Weekday is categorical over WEEKDAY_NAMES, so its codes are the weekday
+    numbers (0=Monday); Month is the first day of the month.
+    """
+    merged_df = attendance_df.join(employee_df.set_index('EmployeeID')[DASHBOARD_MASTER_COLUMNS],
+                                   on='EmployeeID', how='inner').sort_values('Date', kind='stable')
+    dates = merged_df['Date']
+    merged_df['Weekday'] = pd.Categorical.from_codes(dates.dt.weekday.fillna(-1).astype('int8'), WEEKDAY_NAMES)
+    iso = dates.dt.isocalendar()
+    merged_df['ISO_Year'] = iso['year']
+    merged_df['ISO_Week'] = iso['week']
+    merged_df['Month'] = dates.to_numpy().astype('datetime64[M]').astype('datetime64[ns]')
+    return merged_df
+
+
+def load_prepared_data(base_dir: str | Path | None = None, master_columns=None):
+    """Load the cleaned frames plus the joined, calendar-annotated rows from prepare_dataset.
+
+    `master_columns` must include DASHBOARD_MASTER_COLUMNS when given.
+    """
+    attendance_df, employee_df = load_cleaned_data(base_dir, master_columns)
+    return attendance_df, employee_df, prepare_dataset(attendance_df, employee_df)
@@ -0,0 +1,45 @@
+from io import BytesIO
+
+import pandas as pd
+
+try:
+    import xlsxwriter
+except ImportError:  # optional; pandas' openpyxl writer is used instead
+    xlsxwriter = None
+
+
+def to_csv_bytes(df):
+    """UTF-8 CSV of `df` without the index, as the download buttons serve it."""
+    return df.to_csv(index=False).encode('utf-8')
+
+
+def _excel_rows(df):
+    # Plain Python values row by row; missing values become blank cells, as pandas writes them
+    values = df.astype(object).where(df.notna(), None)
+    return values.itertuples(index=False, name=None)
+
+
+def to_excel_bytes(df, sheet_name='Sheet1'):
+    """XLSX workbook of `df` without the index.
+
+    When xlsxwriter is installed, tables of text and numbers are streamed
+    row by row in its constant_memory mode, which is much faster than
+    openpyxl on large tables. Frames with datetime columns, or
+    environments without xlsxwriter, go through pandas and openpyxl.
+    """
+    buffer = BytesIO()
+    if xlsxwriter is None or any(pd.api.types.is_datetime64_any_dtype(dtype) for dtype in df.dtypes):
+        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
+            df.to_excel(writer, index=False, sheet_name=sheet_name)
+        return buffer.getvalue()
+
+    workbook = xlsxwriter.Workbook(buffer, {'constant_memory': True,
+                                            'strings_to_formulas': False, 'strings_to_urls': False})
+    sheet = workbook.add_worksheet(sheet_name)
+    # Same header look as pandas' Excel writers
+    header = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+    sheet.write_row(0, 0, [str(column) for column in df.columns], header)
+    for row, values in enumerate(_excel_rows(df), start=1):
+        sheet.write_row(row, 0, values)
+    workbook.close()
+    return buffer.getvalue()
@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+# Location value the sidebar uses for rows without a location
+UNKNOWN_LOCATION = 'Unknown'
+
+# Prepared columns the Employee Detail view reads
+DRILLDOWN_COLUMNS = ['EmployeeID', 'Date', 'Status', 'InTime', 'OutTime', 'Weekday', 'ISO_Year', 'ISO_Week']
+
+
+def _date_bounds(date_range):
+    """Half-open datetime64 bounds covering the two calendar days of `date_range`."""
+    return (np.datetime64(pd.Timestamp(date_range[0])),
+            np.datetime64(pd.Timestamp(date_range[1]) + pd.Timedelta(days=1)))
+
+
+def _value_masks(values):
+    """One boolean mask per distinct value; missing values are keyed by None."""
+    codes, uniques = pd.factorize(values)
+    masks = {value: codes == i for i, value in enumerate(uniques)}
+    if (codes < 0).any():
+        masks[None] = codes < 0
+    return masks
+
+
+class FilterIndex:
+    """Row positions matching the dashboard's sidebar filters without scanning the rows.
+
+    `df` must be sorted by Date (prepare_dataset does this), so a date range
+    is a single searchsorted slice. Department and Location keep one
+    precomputed boolean mask per value; a filter ORs the masks of the
+    selected values inside the date slice and ANDs the two results.
+    """
+
+    def __init__(self, df):
+        self.dates = df['Date'].to_numpy()
+        self.departments = _value_masks(df['Department'])
+        self.locations = _value_masks(df['Location'])
+
+    def date_slice(self, date_range):
+        """Slice of the rows dated on or between the two calendar days of `date_range`."""
+        start, end = _date_bounds(date_range)
+        return slice(int(self.dates.searchsorted(start, 'left')), int(self.dates.searchsorted(end, 'left')))
+
+    @staticmethod
+    def _any(masks, values, window):
+        selected = np.zeros(window.stop - window.start, dtype=bool)
+        for value in values:
+            if value in masks:
+                selected |= masks[value][window]
+        return selected
+
+    def positions(self, date_range, departments=None, locations=None):
+        """Ascending positions of the rows inside the filters.
+
+        None leaves a dimension unfiltered. 'Unknown' in `locations` also
+        selects rows without a location, as the sidebar filter does.
+        """
+        window = self.date_slice(date_range)
+        mask = np.ones(window.stop - window.start, dtype=bool)
+        if departments is not None:
+            mask &= self._any(self.departments, departments, window)
+        if locations is not None:
+            locations = list(locations) + ([None] if UNKNOWN_LOCATION in locations else [])
+            mask &= self._any(self.locations, locations, window)
+        return window.start + np.flatnonzero(mask)
+
+
+class EmployeeIndex:
+    """Constant-time lookup of one employee's attendance for the Employee Detail view.
+
+    Keeps a copy of DRILLDOWN_COLUMNS laid out employee by employee, with
+    start/end offsets per EmployeeID, so an employee's records are a slice
+    rather than a scan. `df` must be sorted by Date, which keeps each
+    employee's block in date order. Names resolve to the first matching
+    EmployeeID of `employee_df`, as the master lists them.
+    """
+
+    def __init__(self, df, employee_df):
+        codes, ids = pd.factorize(df['EmployeeID'])
+        order = np.argsort(codes, kind='stable')
+        order = order[codes[order] >= 0]
+        self.rows = df[DRILLDOWN_COLUMNS].iloc[order]
+        self.dates = self.rows['Date'].to_numpy()
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(codes[order], minlength=len(ids)))])
+        self.positions = dict(zip(ids, range(len(ids))))
+        named = employee_df.dropna(subset=['Name']).drop_duplicates('Name')
+        self.ids_by_name = dict(zip(named['Name'], named['EmployeeID']))
+
+    def employee_id(self, name):
+        """EmployeeID shown for `name` in the drilldown selector."""
+        return self.ids_by_name[name]
+
+    def records(self, employee_id, date_range=None):
+        """The employee's rows in date order, optionally limited to `date_range`.
+
+        The result is a slice of the shared layout; copy it before adding columns.
+        """
+        position = self.positions.get(employee_id)
+        if position is None:
+            return self.rows.iloc[:0]
+        start, end = self.offsets[position], self.offsets[position + 1]
+        if date_range is not None:
+            lower, upper = _date_bounds(date_range)
+            dates = self.dates[start:end]
+            start, end = start + dates.searchsorted(lower), start + dates.searchsorted(upper)
+        return self.rows.iloc[start:end]
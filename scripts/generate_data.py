@@ -0,0 +1,233 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+if __package__ in (None, ''):
+    # Running as `python scripts/generate_data.py`: make the `scripts` package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+ATTENDANCE_FILE = 'Employee_Attendance.csv'
+MASTER_FILE = 'Employees_Master.xlsx'
+
+# Raw spellings seen in the shipped master, keyed by the value cleaning maps them to
+DEPARTMENT_SPELLINGS = {
+    'HR': ['HR', 'Hr', 'hr', 'H R', 'Hr ', 'H R '],
+    'IT': ['IT', 'It', 'it', 'I.T'],
+    'FINANCE': ['Finance', 'FINANCE', 'finance', 'Fin', 'Finance ', 'finance '],
+    'OPERATIONS': ['Operations', 'Operation', 'Ops', 'ops', 'Operations ', 'ops '],
+    'SALES': ['Sales', 'SALES', 'sales', 'Sale', ' S A L E S', 'Sales '],
+}
+LOCATION_SPELLINGS = {
+    'Bengaluru': ['Bengaluru', 'Bangalore', 'blr', 'Bengaluru '],
+    'Delhi': ['Delhi', 'delhi', 'NCR-Delhi'],
+    'Hyderabad': ['Hyderabad', 'HYD', 'hyd', 'Hyderabaad'],
+    'Mumbai': ['Mumbai', 'mumbai', 'BOM', 'Mumbai  '],
+    'Pune': ['Pune', 'PUNE', 'pune'],
+}
+DESIGNATIONS = {
+    'HR': ['HR Executive', 'HRBP', 'Recruiter', 'Talent Partner'],
+    'IT': ['Software Engineer', 'Sr. Engineer', 'Data Analyst', 'IT Support'],
+    'FINANCE': ['Accountant', 'Finance Analyst', 'AP Executive', 'AR Executive'],
+    'OPERATIONS': ['Operations Lead', 'Ops Exec', 'Supervisor', 'Coordinator'],
+    'SALES': ['Sales Executive', 'Sr. Sales Exec', 'Account Manager', 'BDR'],
+}
+FIRST_NAMES = ['Amit', 'Anita', 'Anjali', 'Arjun', 'Divya', 'Isha', 'John', 'Kabir', 'Kiran', 'Megha',
+               'Neha', 'Nisha', 'Pranav', 'Priya', 'Rahul', 'Rohan', 'Sara', 'Vikram']
+LAST_NAMES = ['Das', 'Fernandes', 'Gupta', 'Iyer', 'Kapoor', 'Mehta', 'Menon', 'Mukherjee', 'Patel',
+              'Reddy', 'Sharma', 'Varma']
+SALARY_BANDS = ['A1', 'A2', 'B1', 'B2', 'C1', 'C2']
+
+# Shares close to the shipped sample
+STATUS_SHARES = {'Present': 0.52, 'WFH': 0.17, 'Absent': 0.16, 'Leave': 0.15}
+RESIGNED_SHARE = 0.26
+MISSING_LOCATION_SHARE = 0.03
+MISSING_JOINING_DATE_SHARE = 0.03
+# Share of rows with a lower-case status or a trailing space after the EmployeeID
+LOWERCASE_STATUS_SHARE = 0.02
+PADDED_ID_SHARE = 0.015
+
+ATTENDANCE_DATE_FORMATS = ['%d/%m/%y', '%Y/%m/%d', '%d-%m-%Y']
+# Joining date spellings with their shares; a few rows only give the year
+JOINING_DATE_FORMATS = {'%d-%m-%Y': 0.38, '%Y/%m/%d': 0.23, '%d/%m/%y': 0.22, '%d.%m.%Y': 0.15, '%Y': 0.02}
+# Punch minutes after midnight; InTime 9:00-10:00, OutTime 18:00-19:00
+IN_MINUTES = [540, 550, 555, 570, 600]
+OUT_MINUTES = [1080, 1090, 1095, 1110, 1140]
+
+
+def _time_strings(minutes):
+    """Each minute of the day in the raw spellings: 09:15, 9:15, 09-15 and 9.15 AM."""
+    hours, mins = divmod(minutes, 60)
+    twelve = (hours - 1) % 12 + 1
+    meridiem = 'AM' if hours < 12 else 'PM'
+    return [f"{hours:02d}:{mins:02d}", f"{hours}:{mins:02d}", f"{hours:02d}-{mins:02d}",
+            f"{twelve}.{mins:02d} {meridiem}"]
+
+
+# Row per minute of the day, column per spelling, so formatting a chunk is one take
+TIME_STRINGS = np.array([_time_strings(minute) for minute in range(24 * 60)], dtype=object)
+
+
+def _spellings(mapping, count, prefix):
+    """The first `count` canonical values with their raw spellings, inventing extra ones past the known list."""
+    spellings = list(mapping.values())[:count]
+    for i in range(len(spellings) + 1, count + 1):
+        spellings.append([f"{prefix} {i}", f"{prefix.upper()} {i}", f"{prefix.lower()} {i} "])
+    return spellings
+
+
+def employee_ids(count):
+    """IDs E0001, E0002, ... padded to at least four digits."""
+    width = max(4, len(str(count)))
+    return np.array([f"E{i:0{width}d}" for i in range(1, count + 1)], dtype=object)
+
+
+def _pick(rng, choices, groups):
+    """A uniformly random entry of `choices[g]` for each group g in `groups`."""
+    counts = np.array([len(options) for options in choices])
+    table = np.array([options + [None] * (counts.max() - len(options)) for options in choices], dtype=object)
+    return table[groups, (rng.random(len(groups)) * counts[groups]).astype(int)]
+
+
+def master_chunks(employees, departments=5, locations=5, seed=0, chunk_rows=100_000):
+    """Yield the raw employee master in DataFrames of up to `chunk_rows` rows."""
+    rng = np.random.default_rng([seed, 0])
+    dept_spellings = _spellings(DEPARTMENT_SPELLINGS, departments, 'Dept')
+    location_spellings = _spellings(LOCATION_SPELLINGS, locations, 'Site')
+    designations = [DESIGNATIONS.get(key, ['Executive', 'Manager']) for key in list(DEPARTMENT_SPELLINGS)[:departments]]
+    designations += [['Executive', 'Manager']] * (departments - len(designations))
+    ids = employee_ids(employees)
+    for start in range(0, employees, chunk_rows):
+        n = min(chunk_rows, employees - start)
+        dept = rng.integers(departments, size=n)
+        location = _pick(rng, location_spellings, rng.integers(locations, size=n))
+        location[rng.random(n) < MISSING_LOCATION_SHARE] = None
+
+        names = (np.array(FIRST_NAMES, dtype=object)[rng.integers(len(FIRST_NAMES), size=n)] + ' '
+                 + np.array(LAST_NAMES, dtype=object)[rng.integers(len(LAST_NAMES), size=n)])
+        # Some names are shouted or have 'a' typed as '@', as in the shipped master
+        style = rng.random(n)
+        names = np.where(style < 0.15, [name.upper() for name in names],
+                         np.where(style > 0.95, [name.replace('a', '@') for name in names], names))
+
+        joined = pd.Timestamp('2015-01-01') + pd.to_timedelta(rng.integers(0, 9 * 365, size=n), 'D')
+        formats = rng.choice(list(JOINING_DATE_FORMATS), size=n, p=list(JOINING_DATE_FORMATS.values()))
+        joining = np.array([day.strftime(fmt) for day, fmt in zip(joined, formats)], dtype=object)
+        joining[rng.random(n) < MISSING_JOINING_DATE_SHARE] = None
+
+        yield pd.DataFrame({
+            'EmployeeID': ids[start:start + n],
+            'Name': names,
+            'Department': _pick(rng, dept_spellings, dept),
+            'Designation': _pick(rng, designations, dept),
+            'Location': location,
+            'DateOfJoining': joining,
+            'Status': np.where(rng.random(n) < RESIGNED_SHARE, 'Resigned', 'Active'),
+            'SalaryBand': np.array(SALARY_BANDS, dtype=object)[rng.integers(len(SALARY_BANDS), size=n)],
+        })
+
+
+def attendance_chunks(employees, days, start='2024-07-01', seed=0, chunk_rows=1_000_000):
+    """Yield raw attendance rows, employee by employee over `days` weekdays from `start`.
+
+    Each chunk covers whole employees and holds about `chunk_rows` rows, so
+    memory stays bounded however many rows are generated in total. The rows
+    are reproducible for a given `seed` and `chunk_rows`.
+    """
+    rng = np.random.default_rng([seed, 1])
+    dates = pd.bdate_range(start, periods=days)
+    date_strings = np.array([[day.strftime(fmt) for fmt in ATTENDANCE_DATE_FORMATS] for day in dates], dtype=object)
+    statuses = np.array(list(STATUS_SHARES), dtype=object)
+    shares = np.array(list(STATUS_SHARES.values()))
+    ids = employee_ids(employees)
+    per_chunk = max(1, chunk_rows // days)
+    for first in range(0, employees, per_chunk):
+        block = ids[first:first + per_chunk]
+        n = len(block) * days
+        employee = np.repeat(block, days)
+        padded = rng.random(n) < PADDED_ID_SHARE
+        employee[padded] = employee[padded] + ' '
+
+        day = np.tile(np.arange(days), len(block))
+        date = date_strings[day, rng.integers(len(ATTENDANCE_DATE_FORMATS), size=n)]
+
+        status = statuses[rng.choice(len(statuses), size=n, p=shares / shares.sum())]
+        # Absent and Leave rows have no punches
+        worked = (status == 'Present') | (status == 'WFH')
+        lowered = (rng.random(n) < LOWERCASE_STATUS_SHARE) & (status == 'Present')
+        status[lowered] = 'present'
+
+        in_time = TIME_STRINGS[rng.choice(IN_MINUTES, size=n), rng.integers(TIME_STRINGS.shape[1], size=n)]
+        out_time = TIME_STRINGS[rng.choice(OUT_MINUTES, size=n), rng.integers(TIME_STRINGS.shape[1], size=n)]
+        in_time[~worked] = None
+        out_time[~worked] = None
+
+        yield pd.DataFrame({'EmployeeID': employee, 'Date': date, 'InTime': in_time,
+                            'OutTime': out_time, 'Status': status})
+
+
+def write_attendance(path: str | Path, employees, days, start='2024-07-01', seed=0, chunk_rows=1_000_000):
+    """Stream generated attendance to a CSV at `path`; returns the number of rows written."""
+    rows = 0
+    with open(path, 'w', newline='') as f:
+        for chunk in attendance_chunks(employees, days, start, seed, chunk_rows):
+            chunk.to_csv(f, header=rows == 0, index=False)
+            rows += len(chunk)
+    return rows
+
+
+def write_master(path: str | Path, employees, departments=5, locations=5, seed=0):
+    """Stream a generated employee master to an XLSX at `path` with openpyxl's write-only mode."""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for i, chunk in enumerate(master_chunks(employees, departments, locations, seed)):
+        if i == 0:
+            sheet.append(list(chunk.columns))
+        for row in chunk.itertuples(index=False, name=None):
+            sheet.append(row)
+    workbook.save(path)
+    return employees
+
+
+def generate_dataset(out_dir: str | Path, employees, days, departments=5, locations=5, start='2024-07-01',
+                     seed=0, chunk_rows=1_000_000):
+    """Write Employee_Attendance.csv and Employees_Master.xlsx into `out_dir`, in the raw formats of data/.
+
+    The files can be cleaned with scripts.clean_data.clean_and_save like the
+    shipped ones. Returns the two paths.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    attendance_path, master_path = out_dir / ATTENDANCE_FILE, out_dir / MASTER_FILE
+    write_master(master_path, employees, departments, locations, seed)
+    write_attendance(attendance_path, employees, days, start, seed, chunk_rows)
+    return attendance_path, master_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate raw attendance and employee master files for load testing.')
+    parser.add_argument('--employees', type=int, default=10_000)
+    parser.add_argument('--days', type=int, default=260, help='weekdays of attendance per employee')
+    parser.add_argument('--departments', type=int, default=5)
+    parser.add_argument('--locations', type=int, default=5)
+    parser.add_argument('--start', default='2024-07-01', help='first attendance date')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk-rows', type=int, default=1_000_000, help='attendance rows generated at a time')
+    parser.add_argument('--out-dir', default='generated_data')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    attendance_path, master_path = generate_dataset(args.out_dir, args.employees, args.days, args.departments,
+                                                    args.locations, args.start, args.seed, args.chunk_rows)
+    print(f"Wrote {args.employees * args.days:,} attendance rows to {attendance_path}")
+    print(f"Wrote {args.employees:,} employees to {master_path}")
+    print(f"in {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == '__main__':
+    main()
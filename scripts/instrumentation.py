@@ -0,0 +1,116 @@
+import contextvars
+import functools
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+# Recorder of the rerun in progress; None outside Timings.activate()
+_current = contextvars.ContextVar('timings', default=None)
+_NOT_RECORDING = nullcontext()
+
+LOGGER_NAME = 'attendance_dashboard.timings'
+
+
+class Timings:
+    """Wall time, and optionally peak memory, of the named sections of one dashboard rerun.
+
+    Code is instrumented with section() and timed(), which record into the
+    Timings activated around the rerun. A disabled Timings records
+    nothing and leaves them as no-ops. With `trace_memory`, tracemalloc
+    runs for the rerun and each record carries the most memory its section
+    allocated on top of what was in use when it began; a section nested in
+    another resets the outer one's peak. Records are listed in the order
+    their sections began, each with its nesting depth (0 for top level).
+    """
+
+    def __init__(self, enabled=False, trace_memory=False):
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.records = []
+        self._depth = 0
+
+    @contextmanager
+    def activate(self):
+        """Make this the recorder used by section() and timed() inside the block."""
+        token = _current.set(self if self.enabled else None)
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            yield self
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+            _current.reset(token)
+
+    @contextmanager
+    def _section(self, name):
+        # Listed when it begins, so an enclosing section comes before the ones nested in it
+        record = {'section': name, 'depth': self._depth}
+        self.records.append(record)
+        self._depth += 1
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record['seconds'] = round(time.perf_counter() - start, 6)
+            if self.trace_memory:
+                record['peak_mb'] = round((tracemalloc.get_traced_memory()[1] - baseline) / 1024 ** 2, 3)
+            self._depth -= 1
+
+    def total_seconds(self):
+        """Time of the top-level sections; nested sections are already part of their enclosing one."""
+        return sum(record['seconds'] for record in self.records if record['depth'] == 0)
+
+    def log(self, **context):
+        """Write the records as one JSON line to the attendance_dashboard.timings logger and return it.
+
+        `context` adds fields such as the active filters. Nothing is logged
+        when disabled.
+        """
+        if not self.enabled:
+            return None
+        line = json.dumps({'event': 'dashboard_rerun', 'total_seconds': round(self.total_seconds(), 6),
+                           'sections': self.records, **context}, default=str)
+        _logger().info(line)
+        return line
+
+
+def section(name):
+    """Context manager timing its block as `name` in the active Timings; a no-op when none is active."""
+    timings = _current.get()
+    if timings is None:
+        return _NOT_RECORDING
+    return timings._section(name)
+
+
+def timed(name=None):
+    """Decorator timing each call as a section named `name` (the function's name by default)."""
+    def decorate(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with section(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+@functools.lru_cache(maxsize=None)
+def _logger():
+    # Streamlit only configures its own loggers; give ours a plain stderr handler once
+    logger = logging.getLogger(LOGGER_NAME)
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
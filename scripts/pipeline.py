@@ -0,0 +1,190 @@
+import argparse
+import cProfile
+import json
+import os
+import pstats
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # not available on Windows; peak RSS is then left out
+    resource = None
+
+if __package__ in (None, ''):
+    # Running as `python scripts/pipeline.py`: make the `scripts` package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.attendance_analysis import MASTER_COLUMNS, REPORT_FILE, calculate_attendance_metrics, write_report
+from scripts.clean_data import clean_and_save
+from scripts.data_store import ATTENDANCE_CSV, MASTER_XLSX, load_cleaned_data, store_path
+
+STAGES = ['clean', 'analyze', 'visualize', 'report']
+SUMMARY_FILE = 'pipeline_summary.json'
+
+
+def _cpu_seconds():
+    # User + system time of this process and of the worker processes it has waited for
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peaks = [resource.getrusage(who).ru_maxrss for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN)]
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    return round(max(peaks) / (1024 ** 2 if sys.platform == 'darwin' else 1024), 1)
+
+
+class StageProfiler:
+    """Per-stage measurements of one pipeline run.
+
+    Every stage records its wall time and the rows it processed. With
+    `profile`, stages also record CPU time (including worker processes),
+    rows per second and peak RSS, the high-water mark of this process and
+    its workers by the end of the stage. With `cprofile_dir`, each stage
+    runs under cProfile and leaves <stage>.prof and a <stage>.txt summary
+    sorted by cumulative time there.
+    """
+
+    def __init__(self, profile=False, cprofile_dir=None):
+        self.profile = profile or cprofile_dir is not None
+        self.cprofile_dir = Path(cprofile_dir) if cprofile_dir is not None else None
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name):
+        """Time the block as stage `name`; the block sets record['rows'] on the record it is given."""
+        record = {'stage': name, 'rows': None}
+        profiler = cProfile.Profile() if self.cprofile_dir is not None else None
+        cpu = _cpu_seconds()
+        start = time.perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield record
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            record['wall_seconds'] = round(time.perf_counter() - start, 4)
+            if self.profile:
+                record['cpu_seconds'] = round(_cpu_seconds() - cpu, 4)
+                if record['rows'] and record['wall_seconds']:
+                    record['rows_per_second'] = round(record['rows'] / record['wall_seconds'])
+                record['peak_rss_mb'] = _peak_rss_mb()
+            if profiler is not None:
+                self._dump(name, profiler)
+            self.stages.append(record)
+
+    def _dump(self, name, profiler):
+        self.cprofile_dir.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(self.cprofile_dir / f'{name}.prof')
+        with open(self.cprofile_dir / f'{name}.txt', 'w') as f:
+            pstats.Stats(profiler, stream=f).sort_stats('cumulative').print_stats(40)
+
+    def summary(self, **context):
+        """Machine-readable run summary: the stage records plus `context`."""
+        return {'finished': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'total_wall_seconds': round(sum(stage['wall_seconds'] for stage in self.stages), 4),
+                **context, 'stages': self.stages}
+
+    def print_table(self):
+        print(f"\n{'stage':<10} {'wall s':>8} {'cpu s':>8} {'rows':>11} {'rows/s':>11} {'peak RSS MB':>12}")
+        for stage in self.stages:
+            rss = stage.get('peak_rss_mb')
+            print(f"{stage['stage']:<10} {stage['wall_seconds']:>8.2f} {stage.get('cpu_seconds', 0):>8.2f} "
+                  f"{stage['rows'] or 0:>11,} {stage.get('rows_per_second', 0):>11,} "
+                  f"{'-' if rss is None else f'{rss:,.0f}':>12}")
+
+
+def run_pipeline(base_dir: str | Path, stages=STAGES, profiler=None, chunk_size=None, workers=1, plot_workers=1):
+    """Clean the raw files in base_dir/data, then analyze, plot and report, as selected by `stages`.
+
+    Cleaned outputs, the report and attendance_plots/ are written under
+    `base_dir`, where the individual scripts write them. Stages after
+    'clean' read the cleaned data left by a previous run when 'clean' is
+    not selected. Returns the StageProfiler holding the measurements.
+    """
+    base_dir = Path(base_dir)
+    profiler = profiler or StageProfiler()
+    attendance_out, master_out = base_dir / ATTENDANCE_CSV, base_dir / MASTER_XLSX
+
+    if 'clean' in stages:
+        with profiler.stage('clean') as record:
+            attendance_clean, _ = clean_and_save(base_dir / 'data' / 'Employee_Attendance.csv',
+                                                 base_dir / 'data' / 'Employees_Master.xlsx',
+                                                 attendance_out, master_out, chunk_size=chunk_size, workers=workers)
+            # Streaming and parallel runs keep no frame; count the rows in the store instead
+            record['rows'] = (len(attendance_clean) if attendance_clean is not None
+                              else _store_rows(store_path(attendance_out)))
+
+    if not set(stages) & {'analyze', 'visualize', 'report'}:
+        return profiler
+
+    # Loading the cleaned data is timed as part of 'analyze'; the metrics are needed for the report either way
+    analyze = profiler.stage('analyze') if 'analyze' in stages else _untimed()
+    with analyze as record:
+        attendance_df, employee_df = load_cleaned_data(base_dir, master_columns=MASTER_COLUMNS)
+        attendance_metrics = calculate_attendance_metrics(attendance_df, employee_df)
+        record['rows'] = len(attendance_df)
+
+    if 'visualize' in stages:
+        from attendance_visualization import PLOTS_DIR, render_plots
+
+        with profiler.stage('visualize') as record:
+            rendered = render_plots(attendance_df, employee_df, base_dir / PLOTS_DIR, workers=plot_workers)
+            record['rows'] = len(attendance_df)
+            record['plots_rendered'] = len(rendered)
+
+    if 'report' in stages:
+        with profiler.stage('report') as record:
+            write_report(attendance_metrics, base_dir / REPORT_FILE)
+            record['rows'] = len(attendance_metrics)
+
+    return profiler
+
+
+@contextmanager
+def _untimed():
+    yield {}
+
+
+def _store_rows(path):
+    import pyarrow.dataset as ds
+
+    # Row counts come from the part files' footers; no column is read
+    return ds.dataset(path, format='parquet').count_rows()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the batch pipeline: clean -> analyze -> visualize -> report.')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES, help='stages to run (default: all)')
+    parser.add_argument('--profile', action='store_true',
+                        help='record CPU time, rows/s and peak RSS per stage and print a breakdown')
+    parser.add_argument('--cprofile-dir', default=None,
+                        help='run each stage under cProfile and write <stage>.prof/.txt to this directory')
+    parser.add_argument('--summary', default=SUMMARY_FILE, help=f'run summary JSON (default: {SUMMARY_FILE})')
+    parser.add_argument('--chunk-size', type=int, default=None, help='stream the attendance file when cleaning')
+    parser.add_argument('--workers', type=int, default=1, help='processes used to clean the attendance file')
+    parser.add_argument('--plot-workers', type=int, default=1, help='processes used to render plots')
+    args = parser.parse_args(argv)
+
+    base_dir = Path(__file__).resolve().parent.parent
+    profiler = StageProfiler(args.profile, args.cprofile_dir)
+    stages = [stage for stage in STAGES if stage in args.stages]
+    run_pipeline(base_dir, stages, profiler, args.chunk_size, args.workers, args.plot_workers)
+
+    summary = profiler.summary(stages_requested=stages, chunk_size=args.chunk_size, workers=args.workers,
+                               plot_workers=args.plot_workers)
+    Path(args.summary).write_text(json.dumps(summary, indent=2))
+    if profiler.profile:
+        profiler.print_table()
+    print(f"\nRun summary written to {args.summary}")
+
+
+if __name__ == '__main__':
+    main()
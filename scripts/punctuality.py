@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+from scripts.aggregations import resolve_group_codes, status_mask
+
+MINUTES_PER_DAY = 24 * 60
+
+# Default shift in minutes after midnight; an InTime more than LATE_GRACE_MINUTES after SHIFT_START is late
+SHIFT_START = 9 * 60
+SHIFT_END = 18 * 60
+LATE_GRACE_MINUTES = 15
+
+# Statuses of days that should have both punches
+WORKED_STATUSES = ['Present', 'Wfh']
+
+# Columns added by punctuality_counts, all additive over rows
+PUNCTUALITY_COLUMNS = ['Punched_Days', 'Missing_Punch_Days', 'Worked_Hours', 'Overtime_Hours',
+                       'Late_Arrivals', 'Early_Departures']
+
+
+def _minutes(values):
+    """Punch minutes as int16 (0 where missing) and a mask of the punches present."""
+    values = pd.Series(values)
+    return values.to_numpy(dtype=np.int16, na_value=0), values.notna().to_numpy()
+
+
+def minutes_after(reference):
+    """Signed minutes from `reference` to each minute of the day, wrapped into [-12 h, 12 h).
+
+    Wrapping makes a 00:10 punch 130 minutes after a 22:00 shift start
+    rather than 21 hours before it. Indexed by punch minute, the result
+    turns per-row comparisons into table lookups.
+    """
+    half_day = MINUTES_PER_DAY // 2
+    return (np.arange(MINUTES_PER_DAY) - reference + half_day) % MINUTES_PER_DAY - half_day
+
+
+def _flag(mask, bit):
+    return mask.view(np.uint8) << bit
+
+
+def punctuality_counts(df, keys, shift_start=SHIFT_START, shift_end=SHIFT_END, grace=LATE_GRACE_MINUTES,
+                       dropna=True, grouping=None):
+    """Worked hours and punctuality per group in a single pass over the InTime/OutTime minutes.
+
+    `keys`, `dropna` and `grouping` are as for status_counts; with the same
+    grouping the rows line up with its counts. Returns one row per group with
+    the key columns and PUNCTUALITY_COLUMNS:
+
+    - Punched_Days: rows with both punches; Worked_Hours and Overtime_Hours
+      (time beyond the shift length) are summed over these
+    - Missing_Punch_Days: Present/WFH rows lacking either punch
+    - Late_Arrivals: InTime more than `grace` minutes after `shift_start`
+    - Early_Departures: OutTime before `shift_end`
+
+    An OutTime earlier than the InTime is on the next day, so shifts may
+    cross midnight (`shift_end` < `shift_start`). All arithmetic is on
+    integer minutes; no timestamps are built.
+    """
+    late_by_minute = minutes_after(shift_start) > grace
+    early_by_minute = minutes_after(shift_end) < 0
+    codes, groups = resolve_group_codes(df, keys, dropna, grouping)
+    n_groups = len(groups)
+    (in_time, has_in), (out_time, has_out) = _minutes(df['InTime']), _minutes(df['OutTime'])
+    worked_day = status_mask(df['Status'], WORKED_STATUSES)
+
+    valid = codes >= 0
+    if not valid.all():
+        codes, in_time, has_in, out_time, has_out, worked_day = (
+            values[valid] for values in (codes, in_time, has_in, out_time, has_out, worked_day))
+
+    punched = has_in & has_out
+    worked = out_time - in_time
+    worked = np.where(worked < 0, worked + MINUTES_PER_DAY, worked) * punched
+    overtime = np.maximum(worked - (shift_end - shift_start) % MINUTES_PER_DAY, 0)
+
+    # One bincount over a 4-bit flag per row instead of one per measure
+    flags = (_flag(punched, 0) | _flag(worked_day & ~punched, 1)
+             | _flag(has_in & np.take(late_by_minute, in_time, mode='wrap'), 2)
+             | _flag(has_out & np.take(early_by_minute, out_time, mode='wrap'), 3))
+    counts = np.bincount(codes * 16 + flags, minlength=n_groups * 16).reshape(n_groups, 16)
+    bits = np.arange(16)
+
+    def hours(minutes):
+        return (np.bincount(codes, weights=minutes, minlength=n_groups) / 60).round(2)
+
+    groups['Punched_Days'] = counts[:, bits & 1 > 0].sum(axis=1)
+    groups['Missing_Punch_Days'] = counts[:, bits & 2 > 0].sum(axis=1)
+    groups['Worked_Hours'] = hours(worked)
+    groups['Overtime_Hours'] = hours(overtime)
+    groups['Late_Arrivals'] = counts[:, bits & 4 > 0].sum(axis=1)
+    groups['Early_Departures'] = counts[:, bits & 8 > 0].sum(axis=1)
+    return groups
+
+
+def punctuality_rates(stats):
+    """Average worked hours per punched day, and late arrivals and early departures as percentages of worked days.
+
+    `stats` holds PUNCTUALITY_COLUMNS plus Present_Days and WFH_Days, per
+    employee or already summed over a group; rates are rounded to 2 places.
+    """
+    worked_days = (stats['Present_Days'] + stats['WFH_Days']).replace(0, np.nan)
+    return pd.DataFrame({
+        'Avg_Worked_Hours': (stats['Worked_Hours'] / stats['Punched_Days'].replace(0, np.nan)).round(2),
+        'Late_Percentage': (stats['Late_Arrivals'] / worked_days * 100).round(2),
+        'Early_Departure_Percentage': (stats['Early_Departures'] / worked_days * 100).round(2),
+    }, index=stats.index)
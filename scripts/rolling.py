@@ -0,0 +1,209 @@
+import numpy as np
+import pandas as pd
+
+from scripts.aggregations import status_mask
+
+# Trailing windows, in calendar days, of the rolling attendance rates
+ROLLING_WINDOWS = [30, 90]
+
+PRESENT_STATUSES = ['Present', 'Wfh']
+# Statuses that make up an absence streak; Leave is planned, so it does not
+ABSENCE_STATUSES = ['Absent']
+
+# HR alerts: an absence streak still running at the last record that reaches STREAK_ALERT_DAYS,
+# or a Present + WFH rate below RATE_ALERT_PERCENT over the shortest rolling window;
+# rates of employees with fewer than MIN_ALERT_RECORDS records are too noisy to alert on
+STREAK_ALERT_DAYS = 3
+RATE_ALERT_PERCENT = 75.0
+MIN_ALERT_RECORDS = 10
+
+
+class _EmployeeDays:
+    """Rows ordered employee by employee, each in date order, with an integer (employee, day) key.
+
+    The key is code * span + day number, with day numbers starting at `pad`
+    so that going back up to `pad` days from any key stays clear of the
+    previous employee's keys. Rows without an EmployeeID or Date are left
+    out; `order` maps ordered rows back to positions in `df`, and `offsets`
+    holds the start of each employee's block (IDs sorted) plus the total.
+    """
+
+    def __init__(self, df, pad):
+        codes, self.ids = pd.factorize(df['EmployeeID'], sort=True)
+        dates = df['Date']
+        days = dates.to_numpy(dtype='datetime64[ns]').view(np.int64) // (24 * 60 * 60 * 10 ** 9)
+        valid = (codes >= 0) & dates.notna().to_numpy()
+        positions = None if valid.all() else np.flatnonzero(valid)
+        if positions is not None:
+            codes, days = codes[positions], days[positions]
+        first_day = (days.min() if len(days) else 0) - pad
+        span = int(days.max(initial=first_day + pad) - first_day) + 1
+        key = codes * span + (days - first_day)
+
+        space = len(self.ids) * span
+        self._rows_below = None
+        # A few times the rows allows for the padding and for employees joining or leaving mid-range
+        if space <= max(4 * len(key), 1 << 20):
+            # Small key space: counting sort, after which the rows below any key are a lookup
+            counts = np.bincount(key, minlength=space)
+            self._rows_below = np.concatenate([[0], np.cumsum(counts)])
+            if counts.max(initial=0) <= 1:
+                # One row per employee and day: each key's count below it is its position
+                order = np.empty(len(key), dtype=np.int64)
+                order[self._rows_below[key]] = np.arange(len(key))
+            else:
+                order = np.argsort(key, kind='stable')
+            # The sorted keys follow from the counts, without gathering
+            key = np.repeat(np.arange(space), counts)
+        else:
+            order = np.argsort(key, kind='stable')
+            key = key[order]
+
+        self.order = order if positions is None else positions[order]
+        self.key = key
+        self.codes = key // span
+        self.days = key - self.codes * span + first_day
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(self.codes, minlength=len(self.ids)))])
+
+    def statuses(self, status):
+        """`status` in row order, as a categorical; only the integer codes are gathered."""
+        status = pd.Series(status)
+        if not isinstance(status.dtype, pd.CategoricalDtype):
+            status = status.astype('category')
+        return pd.Series(pd.Categorical.from_codes(status.cat.codes.to_numpy()[self.order], dtype=status.dtype))
+
+    def rows_below(self, keys):
+        """Number of ordered rows whose key is below each of `keys`."""
+        if self._rows_below is not None:
+            return self._rows_below[keys]
+        return self.key.searchsorted(keys)
+
+
+def _rolling(rows, present, counted, windows):
+    """Present + WFH percentage of the window ending on each ordered row's date, per window.
+
+    One cumulative sum per flag serves every window: a window's counts are
+    the difference of the sums at its two ends, whose positions come from
+    rows_below. Rows sharing a date share that whole day's window. Also
+    returns, per window, whether the employee's records reach back to its
+    first day.
+    """
+    present = np.concatenate([[0], np.cumsum(present)])
+    counted = np.concatenate([[0], np.cumsum(counted)])
+    right = rows.rows_below(rows.key + 1)
+    history = rows.days - rows.days[rows.offsets[rows.codes]]
+
+    rates, covered = {}, {}
+    for window in windows:
+        left = rows.rows_below(rows.key - (window - 1))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rates[window] = (present[right] - present[left]) / (counted[right] - counted[left]) * 100
+        covered[window] = history >= window - 1
+    return rates, covered
+
+
+def rolling_rates(df, windows=ROLLING_WINDOWS):
+    """Present + WFH percentage over the trailing calendar-day windows of each row, per employee.
+
+    The window of a row covers the `window` days ending on its date, for
+    the same employee; the percentage is of the rows in it with a status.
+    Returns a frame indexed like `df` with a Rate_<window>d column per
+    window; rows without an EmployeeID or Date get NaN.
+    """
+    rows = _EmployeeDays(df, pad=max(windows))
+    statuses = rows.statuses(df['Status'])
+    rates, _ = _rolling(rows, status_mask(statuses, PRESENT_STATUSES), statuses.notna().to_numpy(), windows)
+
+    result = pd.DataFrame(index=df.index)
+    for window in windows:
+        column = np.full(len(df), np.nan)
+        column[rows.order] = rates[window]
+        result[f'Rate_{window}d'] = column.round(2)
+    return result
+
+
+def _runs(codes, flags):
+    """Start and end positions of the runs of consecutive True `flags` within each employee's block."""
+    same_employee = codes[1:] == codes[:-1]
+    continues = np.concatenate([flags[1:] & flags[:-1] & same_employee, [False]])
+    starts = np.flatnonzero(flags & ~np.concatenate([[False], continues[:-1]]))
+    ends = np.flatnonzero(flags & ~continues)
+    return starts, ends
+
+
+def attendance_trends(df, windows=ROLLING_WINDOWS):
+    """Rolling attendance rates and absence streaks per employee, in one pass over employee-ordered rows.
+
+    Returns one row per EmployeeID (sorted) with Records, Last_Date and,
+    for each window, Rate_<window>d (the window ending on the employee's
+    last record) and Lowest_Rate_<window>d (the lowest of the windows
+    fully covered by the employee's records, NaN when none is). Absence
+    streaks count consecutive records with an ABSENCE_STATUSES status, so
+    weekends and holidays without records do not break them:
+    Longest_Absence_Streak with its Longest_Streak_Start date (the earliest
+    on ties) and Current_Absence_Streak, the streak running at the last
+    record.
+    """
+    rows = _EmployeeDays(df, pad=max(windows))
+    codes, days, offsets = rows.codes, rows.days, rows.offsets
+    statuses = rows.statuses(df['Status'])
+    present = status_mask(statuses, PRESENT_STATUSES)
+    counted = statuses.notna().to_numpy()
+    absent = status_mask(statuses, ABSENCE_STATUSES)
+
+    records = np.diff(offsets)
+    has_rows = records > 0
+    starts, last = offsets[:-1][has_rows], offsets[1:][has_rows] - 1
+
+    trends = pd.DataFrame({'EmployeeID': rows.ids[has_rows], 'Records': records[has_rows],
+                           'Last_Date': days[last].astype('datetime64[D]').astype('datetime64[ns]')})
+
+    rates, covered = _rolling(rows, present, counted, windows)
+    for window in windows:
+        trends[f'Rate_{window}d'] = rates[window][last].round(2)
+        # fmin skips the NaN of uncovered windows; an employee with none stays NaN
+        trends[f'Lowest_Rate_{window}d'] = np.fmin.reduceat(np.where(covered[window], rates[window], np.nan),
+                                                            starts).round(2)
+
+    # Run-length encode the absences; runs never cross employees
+    run_starts, run_ends = _runs(codes, absent)
+    lengths = run_ends - run_starts + 1
+    run_employees = codes[run_starts]
+    # Each employee's longest run comes first after sorting by employee, length descending, then start
+    ranked = np.lexsort((run_starts, -lengths, run_employees))
+    first = ranked[np.diff(run_employees[ranked], prepend=-1) != 0]
+
+    positions = np.cumsum(has_rows) - 1  # employee code -> row of `trends`
+    longest = np.zeros(len(trends), dtype=np.int64)
+    longest[positions[run_employees[first]]] = lengths[first]
+    longest_start = np.full(len(trends), np.datetime64('NaT'), dtype='datetime64[D]')
+    longest_start[positions[run_employees[first]]] = days[run_starts[first]].astype('datetime64[D]')
+    current = np.zeros(len(trends), dtype=np.int64)
+    running = run_ends == offsets[run_employees + 1] - 1
+    current[positions[run_employees[running]]] = lengths[running]
+
+    trends['Longest_Absence_Streak'] = longest
+    trends['Longest_Streak_Start'] = longest_start.astype('datetime64[ns]')
+    trends['Current_Absence_Streak'] = current
+    return trends
+
+
+def hr_alerts(trends, streak_days=STREAK_ALERT_DAYS, rate=RATE_ALERT_PERCENT, window=ROLLING_WINDOWS[0],
+              min_records=MIN_ALERT_RECORDS):
+    """Employees of `trends` needing HR follow-up, most urgent first.
+
+    An employee is flagged when an absence streak of at least
+    `streak_days` is still running, or when Rate_<window>d is below
+    `rate` and they have at least `min_records` records; Reason says which.
+    """
+    rate_column = f'Rate_{window}d'
+    streak = trends['Current_Absence_Streak'] >= streak_days
+    low_rate = (trends[rate_column] < rate) & (trends['Records'] >= min_records)
+    alerts = trends[streak | low_rate].copy()
+
+    streak_text = 'absent ' + alerts['Current_Absence_Streak'].astype(str) + ' days running'
+    rate_text = f'{window}-day rate ' + alerts[rate_column].round(1).astype(str) + '%'
+    both = streak[alerts.index] & low_rate[alerts.index]
+    alerts['Reason'] = np.where(both, streak_text + '; ' + rate_text,
+                                np.where(streak[alerts.index], streak_text, rate_text))
+    return alerts.sort_values(['Current_Absence_Streak', rate_column], ascending=[False, True])
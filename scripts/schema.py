@@ -0,0 +1,110 @@
+import json
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+DEFAULT_ALIASES_PATH = Path(__file__).resolve().parent.parent / 'data' / 'category_aliases.json'
+
+# Canonical vocabularies; values outside them are kept and appended after these
+STATUS_CATEGORIES = ['Present', 'Wfh', 'Leave', 'Absent']
+EMPLOYEE_STATUS_CATEGORIES = ['Active', 'Resigned']
+
+# Free-text master columns; cheap as categories and repeated on every row once merged into attendance
+MASTER_CATEGORICAL_COLUMNS = ['Name', 'Designation', 'SalaryBand']
+
+
+@lru_cache(maxsize=None)
+def load_category_aliases(path: str | Path | None = None):
+    """Load the alias table used to standardize categorical master fields.
+
+    Each field lists its canonical `categories`, the `case` raw values are
+    folded to after stripping, and `aliases` mapping folded spellings to a
+    canonical value. New spellings only need an entry in the file.
+    """
+    with open(path or DEFAULT_ALIASES_PATH) as f:
+        return json.load(f)
+
+
+def fixed_categorical(values, categories):
+    """Return `values` as a categorical over `categories`, appending any unexpected values."""
+    values = pd.Series(values)
+    present = values.dropna().unique()
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        present = values.cat.remove_unused_categories().cat.categories
+    extra = sorted(set(present) - set(categories))
+    return values.astype(pd.CategoricalDtype(list(categories) + extra))
+
+
+def employee_codes(employee_ids):
+    """Parse IDs like 'E0001' into nullable int32 codes; malformed IDs become <NA>."""
+    ids = pd.Series(employee_ids)
+    if isinstance(ids.dtype, pd.CategoricalDtype):
+        # Parse each distinct ID once
+        codes = employee_codes(pd.Series(ids.cat.categories, dtype=object))
+        return pd.Series(codes.array.take(ids.cat.codes.to_numpy(), allow_fill=True), index=ids.index)
+    digits = ids.astype('string').str.extract(r'^[A-Za-z]*(\d+)$', expand=False)
+    return pd.to_numeric(digits).astype('Int32')
+
+
+def apply_attendance_schema(attendance_df, employee_ids=None):
+    """Cast a cleaned attendance frame to its canonical dtypes.
+
+    `employee_ids` fixes the EmployeeID vocabulary (see apply_schema);
+    by default it is the sorted set of IDs in the frame.
+    """
+    df = attendance_df.copy(deep=False)
+    if employee_ids is None:
+        employee_ids = sorted(df['EmployeeID'].dropna().unique())
+    df['EmployeeID'] = fixed_categorical(df['EmployeeID'], employee_ids)
+    df['EmployeeCode'] = employee_codes(df['EmployeeID'])
+    df['Date'] = pd.to_datetime(df['Date'])
+    for col in ['InTime', 'OutTime']:
+        if col in df.columns:
+            df[col] = df[col].astype('Int16')
+    df['Status'] = fixed_categorical(df['Status'], STATUS_CATEGORIES)
+    return df
+
+
+def apply_master_schema(master_df, employee_ids=None, aliases=None):
+    """Cast a cleaned employee master frame to its canonical dtypes.
+
+    Only EmployeeID is required, so frames read with a subset of columns work too.
+    """
+    aliases = aliases or load_category_aliases()
+    df = master_df.copy(deep=False)
+    if employee_ids is None:
+        employee_ids = sorted(df['EmployeeID'].dropna().unique())
+    df['EmployeeID'] = fixed_categorical(df['EmployeeID'], employee_ids)
+    df['EmployeeCode'] = employee_codes(df['EmployeeID'])
+    vocabularies = {'Department': aliases['Department']['categories'],
+                    'Location': aliases['Location']['categories'],
+                    'Status': EMPLOYEE_STATUS_CATEGORIES}
+    for col, categories in vocabularies.items():
+        if col in df.columns:
+            df[col] = fixed_categorical(df[col], categories)
+    for col in MASTER_CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    if 'DateOfJoining' in df.columns:
+        df['DateOfJoining'] = pd.to_datetime(df['DateOfJoining'])
+    return df
+
+
+def apply_schema(attendance_df, master_df, aliases=None):
+    """Cast both frames to their canonical dtypes over one shared EmployeeID vocabulary.
+
+    Sharing the categories lets merges and groupbys on EmployeeID work on
+    the integer codes instead of comparing strings.
+    """
+    ids = pd.concat([pd.Series(attendance_df['EmployeeID'].unique()),
+                     pd.Series(master_df['EmployeeID'].unique())]).astype(object)
+    employee_ids = sorted(ids.dropna().unique())
+    return (apply_attendance_schema(attendance_df, employee_ids),
+            apply_master_schema(master_df, employee_ids, aliases))
+
+
+def memory_report(frames):
+    """Return deep memory usage in MB for a mapping of name -> DataFrame."""
+    return pd.Series({name: df.memory_usage(deep=True).sum() / 1024 ** 2 for name, df in frames.items()},
+                     name='MB').round(2)
@@ -0,0 +1,41 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+
+def search_rows(df, query, columns):
+    """Rows where any of `columns` contains `query`, ignoring case; an empty query keeps every row.
+
+    Categorical columns are matched once per category instead of once per row.
+    """
+    query = (query or '').strip()
+    if not query:
+        return df
+    mask = np.zeros(len(df), dtype=bool)
+    for column in columns:
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            hits = values.cat.categories.astype(str).str.contains(query, case=False, regex=False)
+            mask |= np.append(hits, False)[values.cat.codes.to_numpy()]
+        else:
+            mask |= values.astype('string').str.contains(query, case=False, regex=False).fillna(False).to_numpy()
+    return df[mask]
+
+
+def page_count(rows, page_size):
+    """Number of pages needed for `rows` rows; an empty table still has one (empty) page."""
+    return max(1, math.ceil(rows / page_size))
+
+
+def table_page(df, page, page_size, sort_by=None, ascending=True):
+    """One page of `df`, sorted by `sort_by` first.
+
+    Pages are numbered from 1 and `page` is clamped to the available range.
+    The sort is stable, so rows that tie keep their current order.
+    """
+    page = min(max(int(page), 1), page_count(len(df), page_size))
+    if sort_by is not None:
+        df = df.sort_values(sort_by, ascending=ascending, kind='stable')
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size]
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+from scripts.aggregations import present_percentage, status_counts, status_percentage
+
+
+def _lambda_counts(df, keys):
+    stats = df.groupby(keys).agg({
+        'Status': ['count',
+                   lambda x: (x == 'Present').sum(),
+                   lambda x: (x == 'Wfh').sum(),
+                   lambda x: (x == 'Leave').sum(),
+                   lambda x: (x == 'Absent').sum()]
+    }).reset_index()
+    stats.columns = list(np.atleast_1d(keys)) + ['Total_Days', 'Present_Days', 'WFH_Days', 'Leave_Days', 'Absent_Days']
+    return stats
+
+
+def test_status_counts_matches_lambda_aggregation():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'EmployeeID': rng.choice(['E0001', 'E0002', 'E0003'], 200),
+        'Location': rng.choice(['Pune', 'Delhi', None], 200),
+        'Status': rng.choice(['Present', 'Wfh', 'Leave', 'Absent', 'Sick', None], 200),
+    })
+    for keys in ['EmployeeID', ['EmployeeID', 'Location']]:
+        pd.testing.assert_frame_equal(status_counts(df, keys), _lambda_counts(df, keys), check_dtype=False)
+
+
+def test_status_percentages():
+    counts = pd.DataFrame({'Total_Days': [4, 3], 'Present_Days': [1, 0], 'WFH_Days': [1, 0],
+                           'Leave_Days': [1, 1], 'Absent_Days': [1, 2]})
+    assert present_percentage(counts).tolist() == [50.0, 0.0]
+    assert status_percentage(counts, 'Absent_Days').tolist() == [25.0, 66.67]
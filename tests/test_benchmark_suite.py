@@ -0,0 +1,17 @@
+from benchmarks.suite import compare_results
+
+BASELINE = {
+    'clean_and_save[100]': {'rows': 13000, 'seconds': 1.0, 'peak_mb': 40.0},
+    'dashboard.build_cube[100]': {'rows': 13000, 'seconds': 0.002, 'peak_mb': 0.5},
+}
+
+
+def test_compare_flags_only_real_regressions():
+    current = {
+        'clean_and_save[100]': {'rows': 13000, 'seconds': 1.4, 'peak_mb': 45.0},
+        # 2 ms -> 5 ms and 0.5 MB -> 1.2 MB are large ratios but below the noise floors
+        'dashboard.build_cube[100]': {'rows': 13000, 'seconds': 0.005, 'peak_mb': 1.2},
+        'plots.plot_inputs[100]': {'rows': 13000, 'seconds': 9.0, 'peak_mb': 99.0},
+    }
+    assert compare_results(BASELINE, current) == ['clean_and_save[100]: time 1.000 s -> 1.400 s']
+    assert compare_results(BASELINE, current, tolerance=0.5) == []
@@ -1,11 +1,22 @@
+import json
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
 from scripts.clean_data import (
+    clean_and_save,
+    incremental_clean_attendance,
     standardize_date,
+    normalize_dates,
+    normalize_times,
+    format_minutes,
     standardize_time,
     clean_department,
     clean_location,
+    load_category_aliases,
+    normalize_categories,
 )
+from scripts.data_store import load_attendance, store_path
 
 
 def test_standardize_date_various_formats():
@@ -23,6 +34,16 @@ def test_standardize_time_various_formats():
     assert np.isnan(standardize_time(np.nan))
 
 
+def test_normalize_times_to_minutes():
+    raw = pd.Series(['9.00 AM', '6.00 PM', '09-10', '18:30', '9:00', '12.30 AM', np.nan, 'late'])
+    result = normalize_times(raw)
+    assert str(result.dtype) == 'Int16'
+    assert result.iloc[:6].tolist() == [540, 1080, 550, 1110, 540, 30]
+    assert result.iloc[6:].isna().all()
+    assert format_minutes(result).iloc[:4].tolist() == ['09:00', '18:00', '09:10', '18:30']
+    assert pd.isna(format_minutes(result).iloc[6])
+
+
 def test_clean_department_variations():
     assert clean_department(' Hr ') == 'HR'
     assert clean_department('i.t') == 'IT'
@@ -36,3 +57,105 @@ def test_clean_location_variations():
     assert clean_location('Bom') == 'Mumbai'
     assert clean_location('Hyderabaad') == 'Hyderabad'
     assert pd.isna(clean_location(np.nan))
+
+
+def test_normalize_categories_uses_fixed_vocabulary():
+    raw = pd.Series([' Hr ', 'i.t', 'ops', np.nan, 'Fin', 'H R', 'Legal'])
+    result = normalize_categories(raw, 'Department')
+    assert list(result.cat.categories) == ['FINANCE', 'HR', 'IT', 'OPERATIONS', 'SALES', 'LEGAL']
+    assert result.astype(object).tolist()[:3] == ['HR', 'IT', 'OPERATIONS']
+    assert pd.isna(result.iloc[3])
+    assert result.astype(object).dropna().tolist() == raw.dropna().apply(clean_department).tolist()
+
+
+def test_normalize_categories_reads_custom_alias_file(tmp_path):
+    aliases = load_category_aliases()
+    aliases = {**aliases, 'Location': {**aliases['Location'], 'aliases': {'Gurgaon': 'Delhi'}}}
+    path = tmp_path / 'aliases.json'
+    path.write_text(json.dumps(aliases))
+
+    result = normalize_categories(pd.Series(['gurgaon', 'Pune']), 'Location', load_category_aliases(path))
+    assert result.astype(object).tolist() == ['Delhi', 'Pune']
+
+
+def test_normalize_dates_matches_standardize_date():
+    raw = pd.Series(['01/07/24', '02-07-2024', '2024/07/03', '27.10.2018',
+                     '31/02/24', 'July 3 2024', 'not a date', np.nan])
+    result = normalize_dates(raw)
+    assert result.dtype == 'datetime64[ns]'
+    expected = pd.to_datetime(raw.apply(standardize_date))
+    pd.testing.assert_series_equal(result, expected, check_names=False)
+    assert pd.isna(result.iloc[-2])
+
+
+def test_clean_and_save_streaming_matches_in_memory(tmp_path):
+    data_dir = Path(__file__).resolve().parent.parent / 'data'
+    attendance_in = data_dir / 'Employee_Attendance.csv'
+    master_in = data_dir / 'Employees_Master.xlsx'
+
+    attendance_clean, _ = clean_and_save(attendance_in, master_in, tmp_path / 'full.csv', tmp_path / 'full_master.xlsx')
+    streamed, _ = clean_and_save(attendance_in, master_in, tmp_path / 'chunked.csv', tmp_path / 'chunked_master.xlsx',
+                                 chunk_size=500)
+
+    assert streamed is None
+    assert (tmp_path / 'full.csv').read_bytes() == (tmp_path / 'chunked.csv').read_bytes()
+    assert len(attendance_clean) == len(pd.read_csv(tmp_path / 'chunked.csv'))
+
+
+def test_clean_and_save_parallel_is_byte_identical(tmp_path):
+    data_dir = Path(__file__).resolve().parent.parent / 'data'
+    attendance_in = data_dir / 'Employee_Attendance.csv'
+    master_in = data_dir / 'Employees_Master.xlsx'
+
+    clean_and_save(attendance_in, master_in, tmp_path / 'serial.csv', tmp_path / 'serial_master.xlsx')
+    parallel, _ = clean_and_save(attendance_in, master_in, tmp_path / 'parallel.csv', tmp_path / 'parallel_master.xlsx',
+                                 workers=2)
+
+    assert parallel is None
+    assert (tmp_path / 'serial.csv').read_bytes() == (tmp_path / 'parallel.csv').read_bytes()
+
+
+def test_incremental_cleaning_appends_only_new_rows(tmp_path):
+    data_dir = Path(__file__).resolve().parent.parent / 'data'
+    lines = (data_dir / 'Employee_Attendance.csv').read_bytes().splitlines(keepends=True)
+    source = tmp_path / 'attendance.csv'
+    out = tmp_path / 'attendance_clean.csv'
+
+    source.write_bytes(b''.join(lines[:1001]))
+    assert incremental_clean_attendance(source, out) == 1000
+    with open(source, 'ab') as f:
+        f.write(b''.join(lines[1001:]))
+    assert incremental_clean_attendance(source, out) == len(lines) - 1001
+    assert incremental_clean_attendance(source, out) == 0
+
+    clean_and_save(source, data_dir / 'Employees_Master.xlsx', tmp_path / 'full.csv', tmp_path / 'master.xlsx')
+    assert out.read_bytes() == (tmp_path / 'full.csv').read_bytes()
+    pd.testing.assert_frame_equal(load_attendance(out), load_attendance(tmp_path / 'full.csv'),
+                                  check_categorical=False)
+
+    # Rewriting history forces a full rebuild
+    source.write_bytes(b''.join(lines[:1] + lines[2:]))
+    assert incremental_clean_attendance(source, out) == len(lines) - 2
+
+
+def test_incremental_cleaning_rebuilds_after_an_early_edit(tmp_path):
+    data_dir = Path(__file__).resolve().parent.parent / 'data'
+    lines = (data_dir / 'Employee_Attendance.csv').read_bytes().splitlines(keepends=True)
+    source = tmp_path / 'attendance.csv'
+    out = tmp_path / 'attendance_clean.csv'
+
+    source.write_bytes(b''.join(lines[:1001]))
+    incremental_clean_attendance(source, out)
+    with open(source, 'ab') as f:
+        f.write(b''.join(lines[1001:1501]))
+    assert incremental_clean_attendance(source, out) == 500
+    # Each run adds a part to the store; earlier parts are left as they are
+    assert len(list(store_path(out).glob('part-*.parquet'))) == 2
+
+    # Same-length edit of an early row, then an append: the whole prefix no longer matches
+    edited = next(i for i in range(1, 1001) if lines[i].rstrip().endswith(b',Absent'))
+    lines[edited] = lines[edited].replace(b',Absent', b',Leave ')
+    source.write_bytes(b''.join(lines[:1600]))
+    assert incremental_clean_attendance(source, out) == 1599
+    assert load_attendance(out)['Status'].iloc[edited - 1].strip() == 'Leave'
+    assert len(list(store_path(out).glob('part-*.parquet'))) == 1
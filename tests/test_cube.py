@@ -0,0 +1,69 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+from scripts.cube import build_cube, daily_status_counts, slice_cube, status_rates, status_shares, trend_counts
+from scripts.schema import STATUS_CATEGORIES
+
+
+def _attendance_rows(n=2000):
+    rng = np.random.default_rng(0)
+
+    def categorical(categories, missing):
+        codes = rng.integers(0, len(categories), n)
+        codes[rng.random(n) < missing] = -1
+        return pd.Categorical.from_codes(codes, categories=categories)
+
+    return pd.DataFrame({
+        'Date': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 40, n), 'D'),
+        'Department': categorical(['FINANCE', 'HR', 'IT'], 0.05),
+        'Location': categorical(['Delhi', 'Mumbai', 'Pune'], 0.2),
+        'Status': categorical(STATUS_CATEGORIES, 0.03),
+    })
+
+
+def test_cube_slices_match_row_level_charts():
+    df = _attendance_rows()
+    cube = build_cube(df)
+    assert cube['Count'].sum() == len(df)
+
+    date_range = (datetime.date(2024, 1, 5), datetime.date(2024, 1, 30))
+    for departments, locations in [(['HR', 'IT'], ['Pune', 'Unknown']), (['FINANCE'], ['Delhi', 'Mumbai'])]:
+        dates = df['Date'].dt.date
+        loc_mask = df['Location'].isin(locations)
+        if 'Unknown' in locations:
+            loc_mask |= df['Location'].isna()
+        rows = df[(dates >= date_range[0]) & (dates <= date_range[1]) & df['Department'].isin(departments) & loc_mask]
+        cells = slice_cube(cube, date_range, departments, locations)
+
+        for by in ['Department', 'Location']:
+            expected = rows.groupby(by, observed=True)['Status'].value_counts(normalize=True).unstack()
+            pd.testing.assert_frame_equal(status_shares(cells, by), expected)
+        expected = rows.groupby(rows['Date'].dt.day_name().rename('Weekday'))['Status'].value_counts(normalize=True)
+        pd.testing.assert_frame_equal(status_shares(cells, 'Weekday'),
+                                      expected.unstack())
+        pd.testing.assert_frame_equal(daily_status_counts(cells),
+                                      rows.groupby(['Date', 'Status'], observed=True).size().unstack(fill_value=0))
+        assert status_rates(cells) == (round(rows['Status'].isin(['Present', 'Wfh']).mean() * 100, 2),
+                                       (rows['Status'] == 'Leave').mean() * 100,
+                                       (rows['Status'] == 'Absent').mean() * 100)
+
+
+def test_trend_counts_averages_into_coarser_periods():
+    dates = pd.date_range('2024-01-01', periods=70, freq='D')
+    df = pd.DataFrame({
+        'Date': dates.repeat(2),
+        'Department': 'HR',
+        'Location': 'Pune',
+        'Status': pd.Categorical(['Present', 'Absent'] * 70, categories=STATUS_CATEGORIES),
+    })
+    cube = build_cube(df)
+
+    daily, resolution = trend_counts(cube)
+    assert resolution == 'Day' and len(daily) == 70
+    weekly, resolution = trend_counts(cube, max_points=20)
+    assert resolution == 'Week' and len(weekly) == 10
+    assert weekly.index[0] == pd.Timestamp('2024-01-01') and (weekly['Present'] == 1.0).all()
+    monthly, resolution = trend_counts(cube, max_points=5)
+    assert resolution == 'Month'
+    assert monthly.index.tolist() == [pd.Timestamp('2024-01-01'), pd.Timestamp('2024-02-01'), pd.Timestamp('2024-03-01')]
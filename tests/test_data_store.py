@@ -0,0 +1,60 @@
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+from scripts import data_store
+from scripts.clean_data import clean_and_save
+from scripts.data_store import load_attendance, load_master, read_workbook, sidecar_path, store_path
+
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+
+
+def _clean_to(tmp_path):
+    attendance_out = tmp_path / 'attendance.csv'
+    master_out = tmp_path / 'master.xlsx'
+    clean_and_save(DATA_DIR / 'Employee_Attendance.csv', DATA_DIR / 'Employees_Master.xlsx',
+                   attendance_out, master_out)
+    return attendance_out, master_out
+
+
+def test_clean_and_save_writes_typed_store(tmp_path):
+    attendance_out, master_out = _clean_to(tmp_path)
+    assert store_path(attendance_out).exists() and store_path(master_out).exists()
+
+    attendance = load_attendance(attendance_out)
+    master = load_master(master_out)
+    assert attendance['Date'].dtype == 'datetime64[ns]'
+    assert str(attendance['InTime'].dtype) == 'Int16'
+    assert isinstance(attendance['Status'].dtype, pd.CategoricalDtype)
+    assert isinstance(master['Department'].dtype, pd.CategoricalDtype)
+
+
+def test_loader_falls_back_to_csv_and_xlsx(tmp_path):
+    attendance_out, master_out = _clean_to(tmp_path)
+    from_store = load_attendance(attendance_out), load_master(master_out)
+    shutil.rmtree(store_path(attendance_out))
+    store_path(master_out).unlink()
+
+    pd.testing.assert_frame_equal(load_attendance(attendance_out), from_store[0], check_categorical=False)
+    pd.testing.assert_frame_equal(load_master(master_out), from_store[1], check_categorical=False)
+    pd.testing.assert_frame_equal(load_master(master_out, ['Department']),
+                                  from_store[1][['EmployeeID', 'Department', 'EmployeeCode']], check_categorical=False)
+
+
+def test_read_workbook_caches_a_sidecar(tmp_path, monkeypatch):
+    workbook = tmp_path / 'master.xlsx'
+    pd.DataFrame({'EmployeeID': ['E01', 'E02'], 'Name': ['Asha', None]}).to_excel(workbook, index=False)
+    expected = pd.read_excel(workbook)
+
+    pd.testing.assert_frame_equal(read_workbook(workbook), expected)
+    assert sidecar_path(workbook).exists()
+    monkeypatch.setattr(data_store.pd, 'read_excel', None)
+    pd.testing.assert_frame_equal(read_workbook(workbook, ['Name']), expected[['Name']])
+
+    # Touching the workbook keeps the sidecar; changing its contents re-reads it
+    os.utime(workbook, ns=(0, 0))
+    pd.testing.assert_frame_equal(read_workbook(workbook), expected)
+    monkeypatch.undo()
+    pd.DataFrame({'EmployeeID': ['E03'], 'Name': ['Ravi']}).to_excel(workbook, index=False)
+    assert read_workbook(workbook)['EmployeeID'].tolist() == ['E03']
@@ -0,0 +1,29 @@
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+from scripts import exports
+
+
+def _stats():
+    return pd.DataFrame({
+        'EmployeeID': pd.Categorical(['E0001', 'E0002', None]),
+        'Name': ['Asha', 'Ravi', None],
+        'Total_Days': np.array([3, 4, 5]),
+        'Present_Rate': [66.67, np.nan, 20.0],
+        'InTime': pd.array([540, None, 600], dtype='Int16'),
+    })
+
+
+def test_csv_bytes():
+    assert exports.to_csv_bytes(_stats()).decode('utf-8').splitlines()[1] == 'E0001,Asha,3,66.67,540'
+
+
+def test_xlsxwriter_path_matches_openpyxl(monkeypatch):
+    pytest.importorskip('xlsxwriter')
+    fast = pd.read_excel(BytesIO(exports.to_excel_bytes(_stats(), 'EmployeeMetrics')), sheet_name=None)
+    monkeypatch.setattr(exports, 'xlsxwriter', None)
+    slow = pd.read_excel(BytesIO(exports.to_excel_bytes(_stats(), 'EmployeeMetrics')), sheet_name=None)
+    assert list(fast) == ['EmployeeMetrics']
+    pd.testing.assert_frame_equal(fast['EmployeeMetrics'], slow['EmployeeMetrics'])
@@ -0,0 +1,53 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+from scripts.cube import date_mask, filter_mask
+from scripts.data_store import WEEKDAY_NAMES
+from scripts.filters import DRILLDOWN_COLUMNS, EmployeeIndex, FilterIndex
+
+
+def test_positions_match_row_masks():
+    rng = np.random.default_rng(0)
+    n = 1000
+    df = pd.DataFrame({
+        'Date': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 30, n), 'D'),
+        'Department': rng.choice(['HR', 'IT', 'SALES', None], n),
+        'Location': pd.Categorical(rng.choice(['Delhi', 'Pune', None], n)),
+    }).sort_values('Date', kind='stable').reset_index(drop=True)
+    index = FilterIndex(df)
+
+    date_range = (datetime.date(2024, 1, 3), datetime.date(2024, 1, 20))
+    for departments, locations in [(['HR', 'IT'], ['Pune', 'Unknown']), (['SALES'], ['Delhi']), ([], ['Delhi'])]:
+        expected = np.flatnonzero(filter_mask(df, date_range, departments, locations))
+        np.testing.assert_array_equal(index.positions(date_range, departments, locations), expected)
+
+    window = df.iloc[index.date_slice(date_range)]
+    assert window['Date'].min() == pd.Timestamp('2024-01-03')
+    assert window['Date'].max() == pd.Timestamp('2024-01-20')
+    assert len(index.positions((datetime.date(2025, 1, 1), datetime.date(2025, 2, 1)))) == 0
+
+
+def test_employee_index_slices_each_employee():
+    rng = np.random.default_rng(1)
+    n = 500
+    df = pd.DataFrame({
+        'EmployeeID': rng.choice(['E01', 'E02', 'E03'], n),
+        'Date': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 60, n), 'D'),
+        'Status': rng.choice(['Present', 'Absent'], n),
+        'InTime': 540, 'OutTime': 1080,
+    }).sort_values('Date', kind='stable')
+    df['Weekday'] = pd.Categorical.from_codes(df['Date'].dt.weekday, WEEKDAY_NAMES)
+    df['ISO_Year'] = df['Date'].dt.isocalendar().year
+    df['ISO_Week'] = df['Date'].dt.isocalendar().week
+    employee_df = pd.DataFrame({'EmployeeID': ['E01', 'E02', 'E03', 'E04'], 'Name': ['Asha', 'Ravi', 'Asha', 'Meena']})
+    index = EmployeeIndex(df, employee_df)
+
+    assert index.employee_id('Asha') == 'E01'
+    date_range = (datetime.date(2024, 1, 10), datetime.date(2024, 2, 5))
+    for emp_id in ['E01', 'E02', 'E03']:
+        rows = df[df['EmployeeID'] == emp_id]
+        pd.testing.assert_frame_equal(index.records(emp_id), rows[DRILLDOWN_COLUMNS])
+        expected = rows[date_mask(rows['Date'], date_range)][DRILLDOWN_COLUMNS]
+        pd.testing.assert_frame_equal(index.records(emp_id, date_range), expected)
+    assert index.records('E04').empty
@@ -0,0 +1,27 @@
+import pandas as pd
+from scripts.clean_data import clean_and_save
+from scripts.generate_data import LOCATION_SPELLINGS, generate_dataset
+
+
+def test_generated_files_clean_like_the_shipped_data(tmp_path):
+    attendance_path, master_path = generate_dataset(tmp_path / 'raw', employees=40, days=15, departments=6,
+                                                    locations=4, seed=3)
+    raw = pd.read_csv(attendance_path, dtype=str)
+    assert len(raw) == 40 * 15
+    assert raw['Date'].str.contains('-').any() and raw['Date'].str.contains('/').any()
+    assert raw['InTime'].str.contains('AM').any() and raw['OutTime'].str.contains('PM').any()
+
+    attendance, master = clean_and_save(attendance_path, master_path, tmp_path / 'attendance.csv',
+                                        tmp_path / 'master.xlsx')
+    assert attendance['Date'].notna().all()
+    assert set(attendance['Status']) == {'Present', 'Wfh', 'Leave', 'Absent'}
+    worked = attendance['Status'].isin(['Present', 'Wfh'])
+    assert attendance.loc[worked, 'InTime'].notna().all() and attendance.loc[~worked, 'InTime'].isna().all()
+    assert master['Department'].nunique() == 6
+    assert set(master['Location'].dropna()) <= set(LOCATION_SPELLINGS)
+
+
+def test_chunks_do_not_change_the_row_count(tmp_path):
+    small = generate_dataset(tmp_path / 'small', employees=25, days=8, chunk_rows=30)[0]
+    large = generate_dataset(tmp_path / 'large', employees=25, days=8)[0]
+    assert len(pd.read_csv(small)) == len(pd.read_csv(large)) == 200
@@ -0,0 +1,21 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+CHECK = """
+import sys
+import scripts.attendance_analysis, scripts.attendance_dashboard, attendance_visualization
+print(sorted(name for name in ('matplotlib', 'seaborn') if name in sys.modules))
+"""
+
+
+def test_entry_points_import_without_side_effects(tmp_path):
+    # Importing reads no data, writes nothing to the working directory and leaves the plotting stack unloaded
+    env = dict(os.environ, PYTHONPATH=str(BASE_DIR))
+    result = subprocess.run([sys.executable, '-c', CHECK], cwd=tmp_path, env=env,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout == '[]\n'
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,46 @@
+import json
+
+from scripts.instrumentation import Timings, section, timed
+
+
+@timed()
+def _build(n):
+    return list(range(n))
+
+
+def test_sections_record_only_while_enabled():
+    # Nothing active: instrumented code runs unchanged
+    with section('outside'):
+        assert _build(3) == [0, 1, 2]
+
+    disabled = Timings(enabled=False)
+    with disabled.activate():
+        _build(3)
+    assert disabled.records == [] and disabled.log() is None
+
+    timings = Timings(enabled=True, trace_memory=True)
+    with timings.activate():
+        with section('load'):
+            pass
+        _build(100_000)
+    assert [record['section'] for record in timings.records] == ['load', '_build']
+    assert timings.records[1]['peak_mb'] > 1
+
+    payload = json.loads(timings.log(filters={'departments': ['HR']}))
+    assert payload['event'] == 'dashboard_rerun'
+    assert payload['sections'] == timings.records
+    assert payload['filters'] == {'departments': ['HR']}
+
+
+def test_total_counts_nested_sections_once():
+    timings = Timings(enabled=True)
+    with timings.activate():
+        with section('outer'):
+            _build(10)
+            with section('inner'):
+                _build(10)
+        _build(10)
+    assert [(record['section'], record['depth']) for record in timings.records] == [
+        ('outer', 0), ('_build', 1), ('inner', 1), ('_build', 2), ('_build', 0)]
+    top_level = [record['seconds'] for record in timings.records if record['depth'] == 0]
+    assert timings.total_seconds() == sum(top_level)
@@ -0,0 +1,33 @@
+import json
+
+import pandas as pd
+from scripts.generate_data import generate_dataset
+from scripts.pipeline import StageProfiler, main, run_pipeline
+
+
+def test_run_pipeline_profiles_each_stage(tmp_path):
+    generate_dataset(tmp_path / 'data', employees=20, days=10)
+    profiler = run_pipeline(tmp_path, profiler=StageProfiler(profile=True, cprofile_dir=tmp_path / 'profiles'))
+
+    stages = {stage['stage']: stage for stage in profiler.stages}
+    assert list(stages) == ['clean', 'analyze', 'visualize', 'report']
+    assert stages['clean']['rows'] == stages['analyze']['rows'] == 200
+    # One report row per EmployeeID, including the generator's IDs with a trailing space
+    assert stages['report']['rows'] == pd.read_csv(tmp_path / 'Employee_Attendance_Clean.csv')['EmployeeID'].nunique()
+    assert stages['visualize']['plots_rendered'] == 6
+    assert all(stage['cpu_seconds'] >= 0 and stage['rows_per_second'] > 0 for stage in profiler.stages)
+    assert (tmp_path / 'Employee_Attendance_Analysis_Report.xlsx').exists()
+    assert (tmp_path / 'profiles' / 'clean.prof').exists() and (tmp_path / 'profiles' / 'report.txt').exists()
+
+    # Later stages alone reuse the cleaned data; without --profile only wall time and rows are kept
+    profiler = run_pipeline(tmp_path, ['report'])
+    assert [stage['stage'] for stage in profiler.stages] == ['report']
+    assert set(profiler.stages[0]) == {'stage', 'rows', 'wall_seconds'}
+
+
+def test_main_writes_run_summary(tmp_path, monkeypatch):
+    monkeypatch.setattr('scripts.pipeline.run_pipeline', lambda base_dir, stages, profiler, *args: profiler)
+    main(['--stages', 'analyze', 'clean', '--summary', str(tmp_path / 'summary.json')])
+    summary = json.loads((tmp_path / 'summary.json').read_text())
+    assert summary['stages_requested'] == ['clean', 'analyze']
+    assert summary['stages'] == []
@@ -0,0 +1,112 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+from scripts.aggregations import group_codes, status_counts
+from scripts.attendance_analysis import calculate_attendance_metrics
+from scripts.punctuality import PUNCTUALITY_COLUMNS, punctuality_counts, punctuality_rates
+
+
+def _punch_rows(n=500):
+    rng = np.random.default_rng(0)
+    in_time = rng.integers(0, 24 * 60, n).astype(float)
+    out_time = rng.integers(0, 24 * 60, n).astype(float)
+    in_time[rng.random(n) < 0.1] = np.nan
+    out_time[rng.random(n) < 0.1] = np.nan
+    return pd.DataFrame({
+        'EmployeeID': rng.choice(['E0001', 'E0002', 'E0003', None], n, p=[0.4, 0.3, 0.25, 0.05]),
+        'InTime': pd.array(in_time, dtype='Float64').astype('Int16'),
+        'OutTime': pd.array(out_time, dtype='Float64').astype('Int16'),
+        'Status': rng.choice(['Present', 'Wfh', 'Leave', 'Absent'], n),
+    })
+
+
+def _per_row_punctuality(df, shift_start, shift_end, grace):
+    # Reference: one datetime per punch, the out punch moved to the next day when earlier than the in punch
+    def clock(minutes, day):
+        return datetime.datetime(2024, 1, day, int(minutes) // 60, int(minutes) % 60)
+
+    def offset(minutes, reference):
+        # Signed minutes to the punch from the nearest occurrence of `reference`
+        offsets = [(clock(minutes, day) - clock(reference, 2)).total_seconds() / 60 for day in (1, 2, 3)]
+        return min(offsets, key=lambda minutes: (abs(minutes), minutes))
+
+    shift_hours = ((shift_end - shift_start) % (24 * 60)) / 60
+    rows = []
+    for employee, group in df.dropna(subset=['EmployeeID']).groupby('EmployeeID'):
+        stats = dict.fromkeys(PUNCTUALITY_COLUMNS, 0)
+        for in_time, out_time, status in zip(group['InTime'], group['OutTime'], group['Status']):
+            has_in, has_out = not pd.isna(in_time), not pd.isna(out_time)
+            if has_in and has_out:
+                end = clock(out_time, 1)
+                if end < clock(in_time, 1):
+                    end += datetime.timedelta(days=1)
+                hours = (end - clock(in_time, 1)).total_seconds() / 3600
+                stats['Punched_Days'] += 1
+                stats['Worked_Hours'] += hours
+                stats['Overtime_Hours'] += max(hours - shift_hours, 0)
+            elif status in ('Present', 'Wfh'):
+                stats['Missing_Punch_Days'] += 1
+            if has_in and offset(in_time, shift_start) > grace:
+                stats['Late_Arrivals'] += 1
+            if has_out and offset(out_time, shift_end) < 0:
+                stats['Early_Departures'] += 1
+        rows.append({'EmployeeID': employee, **stats})
+    return pd.DataFrame(rows)
+
+
+def test_punctuality_counts_match_per_row_datetimes():
+    df = _punch_rows()
+    for shift_start, shift_end in [(9 * 60, 18 * 60), (22 * 60, 6 * 60)]:
+        result = punctuality_counts(df, 'EmployeeID', shift_start, shift_end, grace=15)
+        expected = _per_row_punctuality(df, shift_start, shift_end, grace=15)
+        for col in ['Worked_Hours', 'Overtime_Hours']:
+            expected[col] = expected[col].round(2)
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False, atol=0.01)
+
+
+def test_shared_grouping_matches_separate_factorization():
+    df = _punch_rows()
+    keys = ['EmployeeID', 'Status']
+    grouping = group_codes(df, keys)
+    pd.testing.assert_frame_equal(punctuality_counts(df, keys, grouping=grouping), punctuality_counts(df, keys))
+    pd.testing.assert_frame_equal(status_counts(df, keys, grouping=grouping), status_counts(df, keys))
+    # Each aggregation adds its columns to its own copy of the groups
+    assert list(grouping[1].columns) == keys
+
+
+def test_overnight_shift_and_missing_punches():
+    df = pd.DataFrame({'EmployeeID': ['E0001'] * 3,
+                       'InTime': pd.array([22 * 60, 10, None], dtype='Int16'),
+                       'OutTime': pd.array([6 * 60 + 30, 6 * 60, None], dtype='Int16'),
+                       'Status': ['Present', 'Present', 'Wfh']})
+    result = punctuality_counts(df, 'EmployeeID', shift_start=22 * 60, shift_end=6 * 60).iloc[0]
+    assert result['Punched_Days'] == 2 and result['Missing_Punch_Days'] == 1
+    assert result['Worked_Hours'] == round(8.5 + 5 + 5 / 6, 2)
+    assert result['Overtime_Hours'] == 0.5
+    # 00:10 is 130 minutes after a 22:00 start, not 21 hours before it
+    assert result['Late_Arrivals'] == 1 and result['Early_Departures'] == 0
+
+
+def test_attendance_metrics_include_punctuality():
+    attendance = pd.DataFrame({'EmployeeID': ['E0001', 'E0001', 'E0002'],
+                               'InTime': pd.array([540, 600, None], dtype='Int16'),
+                               'OutTime': pd.array([1140, 1080, None], dtype='Int16'),
+                               'Status': ['Present', 'Wfh', 'Absent']})
+    master = pd.DataFrame({'EmployeeID': ['E0001', 'E0002'], 'Name': ['A', 'B'], 'Department': ['IT', 'HR'],
+                           'Designation': ['Dev', 'Exec'], 'Location': ['Pune', 'Delhi'], 'Status': ['Active'] * 2})
+    metrics = calculate_attendance_metrics(attendance, master).set_index('EmployeeID')
+    assert metrics.loc['E0001', 'Worked_Hours'] == 18.0
+    assert metrics.loc['E0001', 'Avg_Worked_Hours'] == 9.0
+    assert metrics.loc['E0001', 'Overtime_Hours'] == 1.0
+    assert metrics.loc['E0001', 'Late_Percentage'] == 50.0
+    assert pd.isna(metrics.loc['E0002', 'Avg_Worked_Hours']) and pd.isna(metrics.loc['E0002', 'Late_Percentage'])
+
+
+def test_punctuality_rates_of_summed_groups():
+    stats = pd.DataFrame({'Present_Days': [3, 1], 'WFH_Days': [1, 0], 'Punched_Days': [4, 0],
+                          'Worked_Hours': [36.0, 0.0], 'Late_Arrivals': [1, 0], 'Early_Departures': [2, 0]})
+    rates = punctuality_rates(stats)
+    assert rates['Avg_Worked_Hours'].tolist()[0] == 9.0 and pd.isna(rates['Avg_Worked_Hours'][1])
+    assert rates['Late_Percentage'].tolist() == [25.0, 0.0]
+    assert rates['Early_Departure_Percentage'].tolist() == [50.0, 0.0]
@@ -0,0 +1,76 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+from scripts.rolling import attendance_trends, hr_alerts, rolling_rates
+
+
+def _attendance_rows(employees=6, days=200):
+    # Unique (employee, date) rows with gaps, shuffled, with a few missing statuses and a missing ID
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'EmployeeID': np.repeat([f'E{i:04d}' for i in range(employees)], days),
+        'Date': np.tile(pd.date_range('2024-01-01', periods=days).to_numpy(), employees),
+        'Status': rng.choice(['Present', 'Wfh', 'Leave', 'Absent', None], employees * days,
+                             p=[0.4, 0.15, 0.1, 0.3, 0.05]),
+    })
+    df = df[rng.random(len(df)) < 0.7].sample(frac=1, random_state=0)
+    df.loc[df.index[:3], 'EmployeeID'] = None
+    return df
+
+
+def test_rolling_rates_match_per_employee_rolling():
+    df = _attendance_rows()
+    result = rolling_rates(df)
+    for _, rows in df.dropna(subset=['EmployeeID']).groupby('EmployeeID'):
+        rows = rows.sort_values('Date')
+        by_date = rows.set_index('Date')
+        present = by_date['Status'].isin(['Present', 'Wfh']).astype(float)
+        counted = by_date['Status'].notna().astype(float)
+        for window in [30, 90]:
+            expected = (present.rolling(f'{window}D').sum() / counted.rolling(f'{window}D').sum() * 100).round(2)
+            np.testing.assert_allclose(result.loc[rows.index, f'Rate_{window}d'], expected, atol=0.01)
+    assert result.loc[df['EmployeeID'].isna()].isna().all().all()
+
+
+def test_sparse_dates_and_repeated_days_match_dense_path():
+    df = _attendance_rows(employees=15)
+    df = pd.concat([df, df.dropna(subset=['EmployeeID']).iloc[:20]])  # repeated employee-days
+    # One record centuries away makes the (employee, day) key space too large to count densely
+    far = pd.DataFrame({'EmployeeID': ['E0000'], 'Date': [pd.Timestamp('2250-01-01')], 'Status': ['Absent']})
+    sparse = rolling_rates(pd.concat([df, far], ignore_index=True)).iloc[:len(df)]
+    pd.testing.assert_frame_equal(sparse.set_axis(df.index), rolling_rates(df))
+
+
+def test_trends_match_per_employee_loops():
+    df = _attendance_rows()
+    trends = attendance_trends(df).set_index('EmployeeID')
+    rates = rolling_rates(df)
+    for employee, rows in df.dropna(subset=['EmployeeID']).groupby('EmployeeID'):
+        rows = rows.sort_values('Date')
+        runs = [(key, list(group)) for key, group in itertools.groupby(zip(rows['Status'] == 'Absent', rows['Date']),
+                                                                       key=lambda pair: pair[0])]
+        absences = [group for absent, group in runs if absent]
+        longest = max(absences, key=len) if absences else []
+        row = trends.loc[employee]
+        assert row['Records'] == len(rows) and row['Last_Date'] == rows['Date'].max()
+        assert row['Longest_Absence_Streak'] == len(longest)
+        if longest:
+            assert row['Longest_Streak_Start'] == longest[0][1]
+        assert row['Current_Absence_Streak'] == (len(runs[-1][1]) if runs[-1][0] else 0)
+
+        employee_rates = rates.loc[rows.index]
+        assert row['Rate_30d'] == employee_rates['Rate_30d'].iloc[-1]
+        covered = rows['Date'] - rows['Date'].min() >= pd.Timedelta(days=29)
+        assert row['Lowest_Rate_30d'] == employee_rates.loc[covered.to_numpy(), 'Rate_30d'].min()
+
+
+def test_hr_alerts_flag_running_streaks_and_low_rates():
+    trends = pd.DataFrame({'EmployeeID': ['E1', 'E2', 'E3', 'E4', 'E5'],
+                           'Records': [20, 20, 20, 20, 2],
+                           'Rate_30d': [90.0, 60.0, 50.0, 95.0, 0.0],
+                           'Current_Absence_Streak': [4, 0, 3, 1, 1]})
+    alerts = hr_alerts(trends)
+    assert alerts['EmployeeID'].tolist() == ['E1', 'E3', 'E2']
+    assert alerts['Reason'].tolist() == ['absent 4 days running', 'absent 3 days running; 30-day rate 50.0%',
+                                         '30-day rate 60.0%']
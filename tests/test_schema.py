@@ -0,0 +1,31 @@
+import pandas as pd
+from scripts.schema import apply_schema, employee_codes, fixed_categorical
+
+
+def test_fixed_categorical_keeps_unexpected_values():
+    result = fixed_categorical(pd.Series(['Wfh', 'Present', 'Sick', None]), ['Present', 'Wfh', 'Leave', 'Absent'])
+    assert list(result.cat.categories) == ['Present', 'Wfh', 'Leave', 'Absent', 'Sick']
+    assert result.isna().tolist() == [False, False, False, True]
+
+
+def test_employee_codes_parse_ids():
+    codes = employee_codes(pd.Series(['E0001', 'E0120', 'E0005 ', None]))
+    assert str(codes.dtype) == 'Int32'
+    assert codes.iloc[:2].tolist() == [1, 120]
+    assert codes.iloc[2:].isna().all()
+
+
+def test_apply_schema_shares_employee_vocabulary():
+    attendance = pd.DataFrame({'EmployeeID': ['E0002', 'E0001'], 'Date': ['2024-07-01', '2024-07-02'],
+                               'InTime': [540, None], 'OutTime': [1080, None], 'Status': ['Present', 'Absent']})
+    master = pd.DataFrame({'EmployeeID': ['E0001', 'E0002', 'E0003'], 'Department': ['IT', 'HR', 'IT'],
+                           'Location': ['Pune', None, 'Delhi'], 'Status': ['Active', 'Active', 'Resigned']})
+    attendance, master = apply_schema(attendance, master)
+
+    assert attendance['EmployeeID'].dtype == master['EmployeeID'].dtype
+    assert attendance['Date'].dtype == 'datetime64[ns]'
+    assert str(attendance['InTime'].dtype) == 'Int16'
+    assert attendance['EmployeeCode'].tolist() == [2, 1]
+    merged = attendance.merge(master[['EmployeeID', 'Department']], on='EmployeeID')
+    assert isinstance(merged['EmployeeID'].dtype, pd.CategoricalDtype)
+    assert merged['Department'].astype(object).tolist() == ['HR', 'IT']
@@ -0,0 +1,25 @@
+import pandas as pd
+from scripts.tables import page_count, search_rows, table_page
+
+
+def _employees():
+    return pd.DataFrame({
+        'EmployeeID': pd.Categorical(['E0003', 'E0001', 'E0002', None]),
+        'Name': ['Asha Rao', 'Ravi Kumar', None, 'Meena Iyer'],
+        'Present_Rate': [50.0, 75.0, 50.0, 10.0],
+    })
+
+
+def test_search_rows_matches_any_column_ignoring_case():
+    df = _employees()
+    assert search_rows(df, 'e0001', ['EmployeeID', 'Name'])['Name'].tolist() == ['Ravi Kumar']
+    assert search_rows(df, 'IYER', ['EmployeeID', 'Name'])['Present_Rate'].tolist() == [10.0]
+    assert len(search_rows(df, '  ', ['EmployeeID', 'Name'])) == 4
+
+
+def test_table_page_sorts_then_slices():
+    df = _employees()
+    assert page_count(0, 2) == 1 and page_count(4, 2) == 2 and page_count(5, 2) == 3
+    assert table_page(df, 1, 2, 'Present_Rate')['Name'].tolist() == ['Meena Iyer', 'Asha Rao']
+    assert table_page(df, 2, 2, 'Present_Rate', ascending=False)['Name'].tolist() == [None, 'Meena Iyer']
+    assert table_page(df, 9, 3)['Name'].tolist() == ['Meena Iyer']
@@ -0,0 +1,29 @@
+import json
+
+import pandas as pd
+from attendance_visualization import MANIFEST_NAME, PLOT_RENDERERS, render_plots
+
+
+def _frames(wfh_days=2):
+    statuses = ['Present', 'Absent', 'Leave'] + ['Wfh'] * wfh_days
+    attendance_df = pd.DataFrame({
+        'EmployeeID': ['E01', 'E02', 'E01', 'E02', 'E01'][:len(statuses)],
+        'Date': pd.to_datetime(['2024-07-01', '2024-07-02', '2024-08-05', '2024-08-06', '2024-08-07'][:len(statuses)]),
+        'Status': statuses,
+    })
+    employee_df = pd.DataFrame({'EmployeeID': ['E01', 'E02'], 'Department': ['HR', 'IT'], 'Location': ['Pune', None]})
+    return attendance_df, employee_df
+
+
+def test_render_plots_skips_unchanged_inputs(tmp_path):
+    assert sorted(render_plots(*_frames(), tmp_path)) == sorted(PLOT_RENDERERS)
+    assert all((tmp_path / name).exists() for name in PLOT_RENDERERS)
+    assert set(json.loads((tmp_path / MANIFEST_NAME).read_text())) == set(PLOT_RENDERERS)
+
+    assert render_plots(*_frames(), tmp_path) == []
+    (tmp_path / 'wfh_trends.png').unlink()
+    assert render_plots(*_frames(), tmp_path) == ['wfh_trends.png']
+
+    # One WFH day fewer changes every plot built from statuses
+    assert 'wfh_trends.png' in render_plots(*_frames(wfh_days=1), tmp_path)
+    assert len(render_plots(*_frames(), tmp_path, force=True)) == len(PLOT_RENDERERS)